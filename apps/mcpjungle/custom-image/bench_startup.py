@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark for the stdio MCP servers in this image.
+
+MCPJungle spawns netbox-mcp-rw and scanopy-mcp-rw once per session, so process start
+plus the MCP handshake is paid on every session. This spawns a server repeatedly and
+times, from spawn:
+
+  - initialize: the first response (the initialize handshake)
+  - tools/list: the tool list, i.e. when a client can actually start calling tools
+
+No NetBox/Scanopy instance is needed: the servers only connect on the first tool call,
+and placeholder URL/token values are filled in if the environment doesn't set them.
+
+Usage:
+    python bench_startup.py netbox-mcp-rw
+    python bench_startup.py scanopy-mcp-rw --runs 20
+    python bench_startup.py netbox-mcp-rw -- uv run server.py   # as MCPJungle runs it
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PLACEHOLDER_ENV = {
+    "NETBOX_URL": "http://netbox.invalid",
+    "NETBOX_TOKEN": "benchmark",
+    "SCANOPY_URL": "http://scanopy.invalid",
+    "SCANOPY_TOKEN": "benchmark",
+}
+
+
+def _send(proc: subprocess.Popen, message: dict) -> None:
+    proc.stdin.write(json.dumps(message) + "\n")
+    proc.stdin.flush()
+
+
+def _receive(proc: subprocess.Popen, request_id: int) -> dict:
+    """Read stdout lines until the response to request_id arrives."""
+    while True:
+        line = proc.stdout.readline()
+        if not line:
+            raise RuntimeError(f"server exited before answering request {request_id}")
+        message = json.loads(line)
+        if message.get("id") == request_id:
+            return message
+
+
+def run_once(server_dir: Path, command: list) -> dict:
+    """Spawn the server once and return seconds to the initialize and tools/list responses."""
+    env = {**PLACEHOLDER_ENV, **os.environ}
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        command, cwd=server_dir, env=env, text=True,
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+    )
+    try:
+        _send(proc, {
+            "jsonrpc": "2.0", "id": 1, "method": "initialize",
+            "params": {
+                "protocolVersion": "2024-11-05",
+                "capabilities": {},
+                "clientInfo": {"name": "bench_startup", "version": "0"},
+            },
+        })
+        _receive(proc, 1)
+        initialized = time.perf_counter() - started
+        _send(proc, {"jsonrpc": "2.0", "method": "notifications/initialized"})
+        _send(proc, {"jsonrpc": "2.0", "id": 2, "method": "tools/list"})
+        tools = _receive(proc, 2)["result"]["tools"]
+        listed = time.perf_counter() - started
+    finally:
+        proc.kill()
+        proc.wait()
+    return {"initialize": initialized, "tools/list": listed, "tools": len(tools)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("server_dir", help="Server directory, e.g. netbox-mcp-rw")
+    parser.add_argument("--runs", type=int, default=10, help="Number of cold spawns (default 10)")
+    parser.add_argument("command", nargs="*", help="Command to start the server (default: this Python running server.py)")
+    args = parser.parse_args()
+
+    server_dir = Path(args.server_dir).resolve()
+    command = args.command or [sys.executable, "server.py"]
+    results = [run_once(server_dir, command) for _ in range(args.runs)]
+
+    print(f"{server_dir.name}: {results[0]['tools']} tools, {args.runs} cold spawns of {' '.join(command)}")
+    for phase in ("initialize", "tools/list"):
+        times = sorted(result[phase] * 1000 for result in results)
+        print(
+            f"  {phase:<11} min {times[0]:7.1f} ms   median {statistics.median(times):7.1f} ms   "
+            f"max {times[-1]:7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Compact Output
+
+Shrinks list results from the MCP tools in the MCPJungle image (netbox-mcp-rw and
+scanopy-mcp-rw) before they are returned to the model:
+
+  - hypermedia fields are dropped: display_url and _depth everywhere, url and display
+    only from NetBox objects and references (dicts with both "id" and "url"), so a
+    "url" or "display" that is real data elsewhere is kept
+  - nested objects that occur more than once (the same site, device type or tag on
+    every row) are stored once in "refs" and replaced by {"$ref": "<n>"}
+  - a list of objects becomes a table: "columns" once, then one "rows" entry per
+    object, instead of repeating every key name on every row
+
+The result reports the serialized size before and after, so the saving is visible.
+
+This file is duplicated verbatim in ../netbox-mcp-rw/ and ../scanopy-mcp-rw/. Each is
+its own uv project, copied into the image separately (see ../Dockerfile), so there's no
+shared package to import it from. Keep both copies identical.
+"""
+
+import json
+from typing import Any, Dict, List
+
+HYPERMEDIA_FIELDS = frozenset({"display_url", "_depth"})
+# Only hypermedia on a NetBox object or reference, which always carries "id" and "url"
+REFERENCE_FIELDS = frozenset({"url", "display"})
+
+
+def _size(value: Any) -> int:
+    """Return the size of a value serialized as compact JSON."""
+    return len(json.dumps(value, separators=(",", ":"), default=str))
+
+
+def _strip(value: Any) -> Any:
+    """Drop hypermedia fields from every dict in a value."""
+    if isinstance(value, dict):
+        dropped = HYPERMEDIA_FIELDS | REFERENCE_FIELDS if "id" in value and "url" in value else HYPERMEDIA_FIELDS
+        return {k: _strip(v) for k, v in value.items() if k not in dropped}
+    if isinstance(value, list):
+        return [_strip(item) for item in value]
+    return value
+
+
+def _count_nested(value: Any, counts: Dict[str, int], top: bool = True) -> None:
+    """Count occurrences of every nested object, keyed by its canonical JSON."""
+    if isinstance(value, dict):
+        if not top:
+            key = json.dumps(value, sort_keys=True, default=str)
+            counts[key] = counts.get(key, 0) + 1
+        for item in value.values():
+            _count_nested(item, counts, top=False)
+    elif isinstance(value, list):
+        for item in value:
+            _count_nested(item, counts, top=False)
+
+
+def _dedupe(value: Any, repeated: Dict[str, str], refs: Dict[str, Any], top: bool = True) -> Any:
+    """Replace repeated nested objects with {"$ref": id}, storing each once in refs."""
+    if isinstance(value, dict):
+        if not top:
+            key = json.dumps(value, sort_keys=True, default=str)
+            ref = repeated.get(key)
+            if ref is not None:
+                if ref not in refs:
+                    refs[ref] = {k: _dedupe(v, repeated, refs, top=False) for k, v in value.items()}
+                return {"$ref": ref}
+        return {k: _dedupe(v, repeated, refs, top=False) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_dedupe(item, repeated, refs, top=False) for item in value]
+    return value
+
+
+def compact_list(objects: List[Any]) -> Dict[str, Any]:
+    """
+    Compact a list of API objects.
+
+    Returns:
+        Dict with "columns" and "rows" (or "items" if the list isn't all objects), "refs"
+        (repeated nested objects, keyed by the id used in {"$ref": id}) and "size"
+        (original_bytes, compact_bytes and reduction_pct)
+
+    Example:
+        compact_list([{"id": 1, "name": "a", "site": {"id": 3, "name": "nyc"}},
+                      {"id": 2, "name": "b", "site": {"id": 3, "name": "nyc"}}])
+        # {"columns": ["id", "name", "site"],
+        #  "rows": [[1, "a", {"$ref": "1"}], [2, "b", {"$ref": "1"}]],
+        #  "refs": {"1": {"id": 3, "name": "nyc"}}, "size": {...}}
+    """
+    original_bytes = _size(objects)
+    stripped = [_strip(obj) for obj in objects]
+
+    counts: Dict[str, int] = {}
+    for obj in stripped:
+        _count_nested(obj, counts)
+    repeated = {}
+    for key, count in counts.items():
+        # Only worth a ref if the copies outweigh the ref markers
+        if count > 1 and len(key) > 16:
+            repeated[key] = str(len(repeated) + 1)
+    refs: Dict[str, Any] = {}
+    deduped = [_dedupe(obj, repeated, refs) for obj in stripped]
+
+    if deduped and all(isinstance(obj, dict) for obj in deduped):
+        columns: Dict[str, None] = {}
+        for obj in deduped:
+            columns.update(dict.fromkeys(obj))
+        result: Dict[str, Any] = {
+            "columns": list(columns),
+            "rows": [[obj.get(column) for column in columns] for obj in deduped],
+        }
+    else:
+        result = {"items": deduped}
+    result["refs"] = refs
+
+    compact_bytes = _size(result)
+    result["size"] = {
+        "original_bytes": original_bytes,
+        "compact_bytes": compact_bytes,
+        "reduction_pct": round(100 * (1 - compact_bytes / original_bytes), 1) if original_bytes else 0.0,
+    }
+    return result
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+NetBox Response Cache
+
+In-process TTL + LRU cache for NetBox GET responses, shared by NetBoxRestClient and
+AsyncNetBoxRestClient. Entries are raw response bodies keyed on the request path
+(endpoint plus optional object ID) and the normalized query parameters, so list pages,
+detail lookups and changelog queries are all cached the same way.
+
+The cache is bounded both by entry count and by total body bytes, evicting least
+recently used entries first. TTLs can be set per endpoint prefix. Clients call
+invalidate() after a successful write, which drops every entry under that endpoint.
+
+Responses that carry an ETag are kept after their TTL runs out. The client sends the
+stored ETag as If-None-Match and, on a 304, calls revalidate() to re-arm the entry, so
+refreshing a large object costs a header round trip instead of a full download.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qsl
+
+CacheKey = Tuple[str, Tuple[Tuple[str, Any], ...]]
+
+
+class CacheEntry:
+    """A cached response body and its bookkeeping."""
+
+    __slots__ = ("body", "etag", "expires", "size")
+
+    def __init__(self, body: bytes, expires: float, etag: Optional[str] = None):
+        self.body = body
+        self.etag = etag
+        self.expires = expires
+        self.size = len(body)
+
+
+class ResponseCache:
+    """
+    Thread-safe TTL + LRU cache of NetBox GET response bodies.
+
+    Example:
+        cache = ResponseCache(default_ttl=30, ttls={"core/object-changes": 5})
+        client = AsyncNetBoxRestClient(url=..., token=..., cache=cache)
+        cache.stats()  # {"hits": ..., "misses": ..., "evictions": ..., ...}
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        default_ttl: float = 30.0,
+        ttls: Optional[Dict[str, float]] = None,
+    ):
+        """
+        Args:
+            max_entries: Maximum number of cached responses
+            max_bytes: Maximum total size of cached response bodies
+            default_ttl: Seconds an entry stays fresh when no per-endpoint TTL matches
+            ttls: Per-endpoint TTLs in seconds, keyed on endpoint prefix (e.g.
+                {"dcim/device-types": 600, "core/object-changes": 5}). The longest
+                matching prefix wins. A TTL of 0 disables caching for that endpoint,
+                except that responses with an ETag are still kept and revalidated on
+                every request.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.ttls = {k.strip("/"): v for k, v in (ttls or {}).items()}
+        self._entries: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self.revalidations = 0
+
+    @staticmethod
+    def make_key(path: str, params: Optional[Dict[str, Any]] = None) -> CacheKey:
+        """
+        Build a cache key from an API path and query parameters.
+
+        Args:
+            path: Request path relative to the API root, optionally with a query string
+                (e.g. 'dcim/devices/5', 'dcim/interfaces?limit=1000&offset=2000')
+            params: Optional query parameters sent alongside the path
+
+        Returns:
+            A hashable key that ignores parameter order
+        """
+        path, _, query = path.partition("?")
+        merged: Dict[str, Any] = dict(parse_qsl(query))
+        merged.update(params or {})
+        normalized = tuple(sorted(
+            (str(k), tuple(sorted(map(str, v))) if isinstance(v, (list, tuple, set)) else str(v))
+            for k, v in merged.items()
+        ))
+        return path.strip("/"), normalized
+
+    def ttl_for(self, path: str) -> float:
+        """Return the TTL for an API path, using the longest matching endpoint prefix."""
+        path = path.strip("/")
+        best, ttl = -1, self.default_ttl
+        for prefix, prefix_ttl in self.ttls.items():
+            if (path == prefix or path.startswith(prefix + "/")) and len(prefix) > best:
+                best, ttl = len(prefix), prefix_ttl
+        return ttl
+
+    def get(self, key: CacheKey) -> Optional[bytes]:
+        """
+        Return the cached body for a key, or None on a miss or expired entry.
+
+        Expired entries with an ETag are kept for etag()/revalidate(); the rest are
+        dropped.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry.expires <= time.monotonic():
+                if entry.etag is None:
+                    self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.body
+
+    def etag(self, key: CacheKey) -> Optional[str]:
+        """Return the stored ETag for a key, fresh or expired, if there is one."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry.etag if entry is not None else None
+
+    def revalidate(self, key: CacheKey) -> Optional[bytes]:
+        """
+        Mark an entry fresh again after the server answered 304 Not Modified.
+
+        Returns:
+            The cached body, or None if the entry was evicted in the meantime
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            entry.expires = time.monotonic() + self.ttl_for(key[0])
+            self._entries.move_to_end(key)
+            self.revalidations += 1
+            return entry.body
+
+    def set(self, key: CacheKey, body: bytes, etag: Optional[str] = None) -> None:
+        """
+        Store a response body, evicting least recently used entries to stay in bounds.
+        """
+        ttl = self.ttl_for(key[0])
+        if (ttl <= 0 and etag is None) or len(body) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            entry = CacheEntry(body, time.monotonic() + ttl, etag)
+            self._entries[key] = entry
+            self._bytes += entry.size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, endpoint: str) -> int:
+        """
+        Drop every entry for an endpoint, including its detail and bulk paths.
+
+        Args:
+            endpoint: The API endpoint that was written to (e.g. 'dcim/devices')
+
+        Returns:
+            Number of entries dropped
+        """
+        endpoint = endpoint.strip("/")
+        with self._lock:
+            stale = [
+                key for key in self._entries
+                if key[0] == endpoint or key[0].startswith(endpoint + "/")
+            ]
+            for key in stale:
+                self._remove(key)
+            self.invalidations += len(stale)
+            return len(stale)
+
+    def clear(self) -> None:
+        """Drop every entry. Counters are left as-is."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return cache counters and current size, for tuning limits and TTLs.
+
+        A 304 revalidation counts towards hit_ratio: the body came from the cache.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": (self.hits + self.revalidations) / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                "revalidations": self.revalidations,
+            }
+
+    def _remove(self, key: CacheKey) -> None:
+        """Remove an entry and release its bytes. Caller must hold the lock."""
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
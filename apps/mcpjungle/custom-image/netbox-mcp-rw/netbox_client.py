@@ -2,13 +2,29 @@
 """
 NetBox Client Library
 
-This module provides a base class for NetBox client implementations and a REST API implementation.
+This module provides a base class for NetBox client implementations, a REST API implementation,
+and an asyncio REST API implementation with the same surface.
 """
 
 import abc
-from typing import Any, Dict, List, Optional, Union
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
+from urllib.parse import parse_qs, urlsplit
+import httpx
 import requests
 
+from netbox_cache import CacheKey, ResponseCache
+from request_scheduler import RequestScheduler, parse_retry_after, request_key
+
+logger = logging.getLogger(__name__)
+
 
 class NetBoxClientBase(abc.ABC):
     """
@@ -19,7 +35,7 @@ class NetBoxClientBase(abc.ABC):
     """
 
     @abc.abstractmethod
-    def get(self, endpoint: str, id: Optional[int] = None, params: Optional[Dict[str, Any]] = None) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+    def get(self, endpoint: str, id: Optional[int] = None, params: Optional[Dict[str, Any]] = None, fields: Optional[List[str]] = None, brief: bool = False, use_cache: bool = True) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """
         Retrieve one or more objects from NetBox.
 
@@ -27,12 +43,55 @@ class NetBoxClientBase(abc.ABC):
             endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
             id: Optional ID to retrieve a specific object
             params: Optional query parameters for filtering
+            fields: Optional field names to return (e.g. ['id', 'name', 'device.name']);
+                sent to NetBox as fields= and also pruned client-side, so dotted paths
+                and NetBox versions without dynamic fields work too
+            brief: Request NetBox's compact brief representation (ignored if fields is set)
+            use_cache: Set False to always ask NetBox, neither reading nor storing a
+                cached response (e.g. when polling for new changes)
 
         Returns:
             Either a single object dict or a list of object dicts
         """
         pass
 
+    @abc.abstractmethod
+    def iter_objects(self, endpoint: str, params: Optional[Dict[str, Any]] = None, page_size: Optional[int] = None, fields: Optional[List[str]] = None, brief: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterate over every object matching a query, across all pages.
+
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            params: Optional query parameters for filtering
+            page_size: Optional number of objects to fetch per page
+            fields: Optional field names to return (e.g. ['id', 'name', 'device.name']);
+                sent to NetBox as fields= and also pruned client-side, so dotted paths
+                and NetBox versions without dynamic fields work too
+            brief: Request NetBox's compact brief representation (ignored if fields is set)
+
+        Returns:
+            An iterator of object dicts
+        """
+        pass
+
+    def get_all(self, endpoint: str, params: Optional[Dict[str, Any]] = None, page_size: Optional[int] = None, fields: Optional[List[str]] = None, brief: bool = False) -> List[Dict[str, Any]]:
+        """
+        Retrieve every object matching a query, across all pages.
+
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            params: Optional query parameters for filtering
+            page_size: Optional number of objects to fetch per page
+            fields: Optional field names to return (e.g. ['id', 'name', 'device.name']);
+                sent to NetBox as fields= and also pruned client-side, so dotted paths
+                and NetBox versions without dynamic fields work too
+            brief: Request NetBox's compact brief representation (ignored if fields is set)
+
+        Returns:
+            List of object dicts
+        """
+        return list(self.iter_objects(endpoint, params=params, page_size=page_size, fields=fields, brief=brief))
+
     @abc.abstractmethod
     def create(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -119,7 +178,315 @@ class NetBoxClientBase(abc.ABC):
         pass
 
 
-class NetBoxRestClient(NetBoxClientBase):
+@dataclass
+class BulkResult:
+    """
+    Outcome of a chunked bulk create/update/delete.
+
+    Chunks are committed independently, so a failure in one chunk doesn't undo the
+    others. `succeeded` holds the created/updated objects (or deleted IDs) in input
+    order; `failed` holds one {"item", "error"} entry per item that wasn't applied.
+    """
+
+    action: str
+    endpoint: str
+    succeeded: List[Any] = field(default_factory=list)
+    failed: List[Dict[str, Any]] = field(default_factory=list)
+    chunks: int = 0
+    retries: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarize the result for an MCP tool response."""
+        return {
+            "success": self.ok,
+            "action": self.action,
+            "endpoint": self.endpoint,
+            "succeeded_count": len(self.succeeded),
+            "failed_count": len(self.failed),
+            "chunks": self.chunks,
+            "retries": self.retries,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+        }
+
+
+class BulkOperationError(Exception):
+    """
+    Raised by bulk_create/bulk_update/bulk_delete when some items weren't applied.
+
+    The partial BulkResult is attached as `result`; items in other chunks may already
+    have been committed.
+    """
+
+    def __init__(self, result: BulkResult):
+        total = len(result.succeeded) + len(result.failed)
+        super().__init__(f"{len(result.failed)} of {total} {result.endpoint} items failed to {result.action}")
+        self.result = result
+
+
+class NetBoxGraphQLError(Exception):
+    """
+    Raised when a NetBox GraphQL query returns errors.
+
+    `errors` holds the GraphQL error list and `data` any partial result.
+    """
+
+    def __init__(self, errors: List[Dict[str, Any]], data: Any = None):
+        messages = "; ".join(str(error.get("message", error)) for error in errors)
+        super().__init__(f"GraphQL query failed: {messages}")
+        self.errors = errors
+        self.data = data
+
+
+class _BulkChunk:
+    """Progress of one bulk chunk across retries."""
+
+    def __init__(self, items: List[Any]):
+        self.pending = items
+        self.succeeded: List[Any] = []
+        self.failed: List[Dict[str, Any]] = []
+        self.attempts = 0
+
+
+class _NetBoxRestMixin:
+    """
+    Connection settings and URL handling shared by the sync and async REST clients.
+    """
+
+    _BULK_METHODS = {'create': 'POST', 'update': 'PATCH', 'delete': 'DELETE'}
+
+    # Statuses where NetBox (or the proxy in front of it) rejected a bulk request
+    # without applying it. A bulk POST isn't idempotent, so creates are only retried
+    # when the request certainly wasn't processed; PATCH/DELETE replay safely.
+    _BULK_RETRY_STATUSES = {
+        'create': {429, 503},
+        'update': {429, 500, 502, 503, 504},
+        'delete': {429, 500, 502, 503, 504},
+    }
+
+    def _configure(self, url: str, token: str, verify_ssl: bool, page_size: int, max_workers: int, cache: Optional[ResponseCache], bulk_chunk_size: int, bulk_retries: int, scheduler: Optional[RequestScheduler]) -> None:
+        """Store connection settings common to both REST clients."""
+        self.base_url = url.rstrip('/')
+        self.api_url = f"{self.base_url}/api"
+        self.token = token
+        self.verify_ssl = verify_ssl
+        self.page_size = page_size
+        self.max_workers = max_workers
+        self.cache = cache
+        self.bulk_chunk_size = bulk_chunk_size
+        self.bulk_retries = bulk_retries
+        self.scheduler = scheduler or RequestScheduler()
+        self.headers = {
+            'Authorization': f'Token {token}',
+            'Content-Type': 'application/json',
+            'Accept': 'application/json',
+        }
+
+    def _build_url(self, endpoint: str, id: Optional[int] = None) -> str:
+        """Build the full URL for an API request."""
+        endpoint = endpoint.strip('/')
+        if id is not None:
+            return f"{self.api_url}/{endpoint}/{id}/"
+        return f"{self.api_url}/{endpoint}/"
+
+    def _rebase_url(self, url: Optional[str]) -> Optional[str]:
+        """
+        Point a server-provided pagination link back at base_url.
+
+        NetBox builds "next" links from its own idea of its hostname and scheme, which
+        behind a reverse proxy is often http:// or an internal name. Only the path and
+        query are trusted.
+        """
+        if not url:
+            return None
+        base, parts = urlsplit(self.base_url), urlsplit(url)
+        return parts._replace(scheme=base.scheme, netloc=base.netloc).geturl()
+
+    @staticmethod
+    def _page_offsets(data: Dict[str, Any], start: int) -> Optional[range]:
+        """
+        Offsets of the pages after a first page, for fetching them concurrently.
+
+        NetBox silently caps limit at its MAX_PAGE_SIZE, so the step is the limit in
+        the first page's "next" link (or the size of the first page), not the one
+        requested. Returns None when "count" or "next" is missing; the caller then
+        follows "next" links serially.
+        """
+        count, next_url = data.get('count'), data.get('next')
+        if not isinstance(count, int) or not next_url:
+            return None
+        try:
+            step = int(parse_qs(urlsplit(next_url).query)['limit'][0])
+        except (KeyError, IndexError, ValueError):
+            step = len(data['results'])
+        if step <= 0:
+            return None
+        return range(start + step, count, step)
+
+    @staticmethod
+    def _check_count(endpoint: str, data: Dict[str, Any], start: int, received: int) -> None:
+        """Log when a concurrent fetch returned a different number of objects than NetBox counted."""
+        expected = max(data['count'] - start, 0)
+        if received != expected:
+            # Objects created or deleted mid-fetch shift the offsets under us
+            logger.warning("%s: fetched %d objects, NetBox reported %d", endpoint, received, expected)
+
+    @staticmethod
+    def _projection_params(params: Optional[Dict[str, Any]], fields: Optional[List[str]], brief: bool) -> Dict[str, Any]:
+        """
+        Add NetBox's fields=/brief= query parameters for a projection.
+
+        NetBox's dynamic fields only select top-level attributes, so dotted paths are
+        requested by their top-level name and narrowed by _project().
+        """
+        query = dict(params or {})
+        if fields:
+            query['fields'] = ','.join(dict.fromkeys(field.split('.', 1)[0] for field in fields))
+        elif brief:
+            query['brief'] = 'true'
+        return query
+
+    @staticmethod
+    def _field_tree(fields: Optional[List[str]]) -> Optional[Dict[str, Any]]:
+        """
+        Turn ['id', 'device.name', 'device.id'] into {'id': None, 'device': {'name': None, 'id': None}}.
+
+        None marks a field kept whole. Returns None when no projection was asked for.
+        """
+        if not fields:
+            return None
+        tree: Dict[str, Any] = {}
+        for field in fields:
+            node = tree
+            *parents, leaf = field.split('.')
+            for part in parents:
+                if part in node and node[part] is None:
+                    break
+                node = node.setdefault(part, {})
+            else:
+                node[leaf] = None
+        return tree
+
+    @classmethod
+    def _project(cls, value: Any, tree: Optional[Dict[str, Any]]) -> Any:
+        """
+        Prune an object, or each object in a list, down to the fields in a field tree.
+
+        Runs even when NetBox honoured fields=, since older releases ignore it and it
+        can't narrow nested objects.
+        """
+        if tree is None:
+            return value
+        if isinstance(value, list):
+            return [cls._project(item, tree) for item in value]
+        if not isinstance(value, dict):
+            return value
+        return {key: cls._project(value[key], subtree) for key, subtree in tree.items() if key in value}
+
+    def _graphql_cache_key(self, query: str, variables: Optional[Dict[str, Any]]) -> Optional[CacheKey]:
+        """Build the response cache key for a GraphQL query, or None if caching is off."""
+        if self.cache is None:
+            return None
+        return self.cache.make_key('graphql', {'query': query, 'variables': json.dumps(variables or {}, sort_keys=True)})
+
+    @staticmethod
+    def _graphql_data(payload: Dict[str, Any]) -> Any:
+        """Return a GraphQL response's data, raising NetBoxGraphQLError on errors."""
+        if payload.get('errors'):
+            raise NetBoxGraphQLError(payload['errors'], payload.get('data'))
+        return payload.get('data')
+
+    def _cache_key(self, url: str, params: Optional[Dict[str, Any]]) -> Optional[CacheKey]:
+        """Build the response cache key for a GET request, or None if caching is off."""
+        if self.cache is None:
+            return None
+        return self.cache.make_key(url[len(self.api_url):], params)
+
+    def _bulk_chunks(self, items: List[Any], chunk_size: Optional[int]) -> List[_BulkChunk]:
+        """Split bulk input into chunks of at most chunk_size items."""
+        size = max(1, chunk_size or self.bulk_chunk_size)
+        return [_BulkChunk(list(items[i:i + size])) for i in range(0, len(items), size)]
+
+    @staticmethod
+    def _bulk_payload(action: str, items: List[Any]) -> List[Dict[str, Any]]:
+        """Build the request body for a bulk chunk; deletes take bare IDs."""
+        if action == 'delete':
+            return [{"id": id} for id in items]
+        return items
+
+    def _bulk_handle(self, action: str, chunk: _BulkChunk, status: Optional[int], body: Any, retries: int, retry_after: Optional[float] = None) -> Optional[float]:
+        """
+        Record the outcome of one bulk request and decide what to do next.
+
+        Args:
+            action: 'create', 'update' or 'delete'
+            chunk: The chunk that was sent; its pending items are updated in place
+            status: HTTP status, or None if the request failed in transport
+            body: Parsed JSON body, response text, or the transport error message
+            retries: How many times the chunk may be resent
+            retry_after: Parsed Retry-After header of the response, if any
+
+        Returns:
+            Seconds to wait before resending chunk.pending, or None if the chunk is done
+        """
+        pending = chunk.pending
+        if status is not None and 200 <= status < 300:
+            chunk.succeeded.extend(pending if action == 'delete' else body)
+            chunk.pending = []
+            return None
+
+        if status == 400 and isinstance(body, list) and len(body) == len(pending):
+            # DRF returns one error dict per item; the transaction rolled back the
+            # valid items too, so resend just those
+            rejected = [(item, error) for item, error in zip(pending, body) if error]
+            if rejected:
+                chunk.failed.extend({"item": item, "error": error} for item, error in rejected)
+                chunk.pending = [item for item, error in zip(pending, body) if not error]
+                return 0.0 if chunk.pending else None
+
+        if status is None:
+            # Transport failure: the request may or may not have been applied
+            retryable = action != 'create'
+        else:
+            retryable = status in self._BULK_RETRY_STATUSES[action]
+        if retryable and chunk.attempts < retries:
+            chunk.attempts += 1
+            return self.scheduler.retry_policy.backoff(chunk.attempts - 1, retry_after)
+
+        error = body if status is None else {"status": status, "detail": body}
+        chunk.failed.extend({"item": item, "error": error} for item in pending)
+        chunk.pending = []
+        return None
+
+    def _bulk_result(self, action: str, endpoint: str, chunks: List[_BulkChunk]) -> BulkResult:
+        """Merge per-chunk outcomes, in input order, and invalidate cached reads."""
+        result = BulkResult(action=action, endpoint=endpoint, chunks=len(chunks))
+        for chunk in chunks:
+            result.succeeded.extend(chunk.succeeded)
+            result.failed.extend(chunk.failed)
+            result.retries += chunk.attempts
+        if result.succeeded:
+            self._invalidate(endpoint)
+        return result
+
+    def _invalidate(self, endpoint: str) -> None:
+        """
+        Drop cached responses after a successful write to an endpoint.
+
+        Every write also adds a changelog record, so cached core/object-changes pages
+        are dropped too, as are cached GraphQL results, which can span any endpoint.
+        """
+        if self.cache is not None:
+            self.cache.invalidate(endpoint)
+            self.cache.invalidate('core/object-changes')
+            self.cache.invalidate('graphql')
+
+
+class NetBoxRestClient(_NetBoxRestMixin, NetBoxClientBase):
     """
     NetBox client implementation using the REST API.
     """
@@ -147,7 +514,7 @@ class NetBoxRestClient(NetBoxClientBase):
 # })
 # print(f"Created site: {new_site.get('name')} (ID: {new_site.get('id')})")
 
-    def __init__(self, url: str, token: str, verify_ssl: bool = True):
+    def __init__(self, url: str, token: str, verify_ssl: bool = True, page_size: int = 1000, max_workers: int = 4, cache: Optional[ResponseCache] = None, bulk_chunk_size: int = 100, bulk_retries: int = 2, scheduler: Optional[RequestScheduler] = None):
         """
         Initialize the REST API client.
 
@@ -155,26 +522,65 @@ class NetBoxRestClient(NetBoxClientBase):
             url: The base URL of the NetBox instance (e.g., 'https://netbox.example.com')
             token: API token for authentication
             verify_ssl: Whether to verify SSL certificates
+            page_size: Default number of objects per page for iter_objects/get_all
+                (NetBox caps this at its MAX_PAGE_SIZE setting, 1000 by default)
+            max_workers: Default number of pages get_all fetches concurrently
+            cache: Optional ResponseCache to serve repeated GETs from; writes through
+                this client invalidate the affected endpoint
+            bulk_chunk_size: Default number of items per request for bulk_* methods
+            bulk_retries: Default number of times a failed bulk chunk is resent
+            scheduler: Optional RequestScheduler setting timeouts, retries and rate
+                limits for every request (defaults to RequestScheduler())
         """
-        self.base_url = url.rstrip('/')
-        self.api_url = f"{self.base_url}/api"
-        self.token = token
-        self.verify_ssl = verify_ssl
+        self._configure(url, token, verify_ssl, page_size, max_workers, cache, bulk_chunk_size, bulk_retries, scheduler)
         self.session = requests.Session()
-        self.session.headers.update({
-            'Authorization': f'Token {token}',
-            'Content-Type': 'application/json',
-            'Accept': 'application/json',
-        })
+        self.session.headers.update(self.headers)
+        self.scheduler.mount(self.session)
 
-    def _build_url(self, endpoint: str, id: Optional[int] = None) -> str:
-        """Build the full URL for an API request."""
-        endpoint = endpoint.strip('/')
-        if id is not None:
-            return f"{self.api_url}/{endpoint}/{id}/"
-        return f"{self.api_url}/{endpoint}/"
+    def _request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request through the scheduler (timeouts, retries, rate limit)."""
+        return self.scheduler.send(self.session, method, url, verify=self.verify_ssl, **kwargs)
 
-    def get(self, endpoint: str, id: Optional[int] = None, params: Optional[Dict[str, Any]] = None) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+    def _get_json(self, url: str, params: Optional[Dict[str, Any]] = None, use_cache: bool = True) -> Any:
+        """
+        Issue a GET request and return the parsed JSON body, via the cache if set
+        and use_cache is True.
+
+        Concurrent identical GETs share one upstream request; each caller parses its
+        own copy of the body.
+        """
+        key = self._cache_key(url, params) if use_cache else None
+        if key is not None:
+            body = self.cache.get(key)
+            if body is not None:
+                return json.loads(body)
+        body = self.scheduler.coalesce(request_key('GET', url, params), lambda: self._fetch_body(url, params, key))
+        return json.loads(body)
+
+    def _fetch_body(self, url: str, params: Optional[Dict[str, Any]], key: Optional[CacheKey]) -> bytes:
+        """
+        Issue a GET request and return the raw body, storing it in the cache if set.
+
+        Expired cache entries with an ETag are revalidated with If-None-Match; a 304
+        serves the cached body without downloading it again.
+        """
+        headers = {}
+        etag = self.cache.etag(key) if key is not None else None
+        if etag is not None:
+            headers['If-None-Match'] = etag
+        response = self._request('GET', url, params=params, headers=headers)
+        if response.status_code == 304 and key is not None:
+            body = self.cache.revalidate(key)
+            if body is not None:
+                return body
+            # Entry was evicted while the request was in flight; fetch it for real
+            return self._fetch_body(url, params, key)
+        response.raise_for_status()
+        if key is not None:
+            self.cache.set(key, response.content, response.headers.get('ETag'))
+        return response.content
+
+    def get(self, endpoint: str, id: Optional[int] = None, params: Optional[Dict[str, Any]] = None, fields: Optional[List[str]] = None, brief: bool = False, use_cache: bool = True) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """
         Retrieve one or more objects from NetBox via the REST API.
 
@@ -182,6 +588,12 @@ class NetBoxRestClient(NetBoxClientBase):
             endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
             id: Optional ID to retrieve a specific object
             params: Optional query parameters for filtering
+            fields: Optional field names to return (e.g. ['id', 'name', 'device.name']);
+                sent to NetBox as fields= and also pruned client-side, so dotted paths
+                and NetBox versions without dynamic fields work too
+            brief: Request NetBox's compact brief representation (ignored if fields is set)
+            use_cache: Set False to always ask NetBox, neither reading nor storing a
+                cached response (e.g. when polling for new changes)
 
         Returns:
             Either a single object dict or a list of object dicts
@@ -190,13 +602,173 @@ class NetBoxRestClient(NetBoxClientBase):
             requests.HTTPError: If the request fails
         """
         url = self._build_url(endpoint, id)
-        response = self.session.get(url, params=params, verify=self.verify_ssl)
-        response.raise_for_status()
-
-        data = response.json()
+        data = self._get_json(url, self._projection_params(params, fields, brief), use_cache)
         if id is None and 'results' in data:
             # Handle paginated results
-            return data['results']
+            data = data['results']
+        return self._project(data, self._field_tree(fields))
+
+    def iter_objects(self, endpoint: str, params: Optional[Dict[str, Any]] = None, page_size: Optional[int] = None, fields: Optional[List[str]] = None, brief: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterate over every object matching a query via the REST API.
+
+        Follows the "next" link of each page, fetching one page at a time as the caller
+        consumes results, so memory use is bounded by the page size rather than the
+        result count.
+
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            params: Optional query parameters for filtering
+            page_size: Optional number of objects per page (defaults to self.page_size)
+            fields: Optional field names to return (e.g. ['id', 'name', 'device.name']);
+                sent to NetBox as fields= and also pruned client-side, so dotted paths
+                and NetBox versions without dynamic fields work too
+            brief: Request NetBox's compact brief representation (ignored if fields is set)
+
+        Returns:
+            An iterator of object dicts
+
+        Raises:
+            requests.HTTPError: If any page request fails
+        """
+        url = self._build_url(endpoint)
+        tree = self._field_tree(fields)
+        query = self._projection_params(params, fields, brief)
+        query['limit'] = page_size or self.page_size
+        while url:
+            data = self._get_json(url, query)
+            if not isinstance(data, dict) or 'results' not in data:
+                # Endpoint isn't paginated; yield whatever it returned
+                yield from self._project(data if isinstance(data, list) else [data], tree)
+                return
+            yield from self._project(data['results'], tree)
+            # "next" already carries the filters, limit and offset
+            url = self._rebase_url(data.get('next'))
+            query = None
+
+    def iter_objects_concurrent(self, endpoint: str, params: Optional[Dict[str, Any]] = None, page_size: Optional[int] = None, concurrency: Optional[int] = None, fields: Optional[List[str]] = None, brief: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over every object matching a query, prefetching pages concurrently.
+
+        The first page is fetched on its own to learn the total count and the page size
+        NetBox actually serves (it caps limit at MAX_PAGE_SIZE); the remaining pages are
+        then requested by limit/offset on a thread pool, at most `concurrency` at a
+        time, and yielded in order. Memory use is bounded by page_size * concurrency
+        objects.
+
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            params: Optional query parameters for filtering
+            page_size: Optional number of objects per page (defaults to self.page_size)
+            concurrency: Optional number of pages in flight (defaults to self.max_workers)
+            fields: Optional field names to return (e.g. ['id', 'name', 'device.name']);
+                sent to NetBox as fields= and also pruned client-side, so dotted paths
+                and NetBox versions without dynamic fields work too
+            brief: Request NetBox's compact brief representation (ignored if fields is set)
+
+        Returns:
+            An iterator of object dicts
+
+        Raises:
+            requests.HTTPError: If any page request fails
+        """
+        url = self._build_url(endpoint)
+        limit = page_size or self.page_size
+        workers = concurrency or self.max_workers
+        tree = self._field_tree(fields)
+        query = self._projection_params(params, fields, brief)
+        start = int(query.pop('offset', 0))
+        query['limit'] = limit
+
+        data = self._get_json(url, {**query, 'offset': start})
+        if not isinstance(data, dict) or 'results' not in data:
+            yield from self._project(data if isinstance(data, list) else [data], tree)
+            return
+        yield from self._project(data['results'], tree)
+        if not data.get('next'):
+            return
+
+        page_offsets = self._page_offsets(data, start)
+        if page_offsets is None:
+            next_url = self._rebase_url(data.get('next'))
+            while next_url:
+                page = self._get_json(next_url)
+                yield from self._project(page['results'], tree)
+                next_url = self._rebase_url(page.get('next'))
+            return
+
+        received = len(data['results'])
+        offsets = iter(page_offsets)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pending = deque(
+                pool.submit(self._get_json, url, {**query, 'offset': offset})
+                for offset in islice(offsets, workers)
+            )
+            while pending:
+                page = pending.popleft().result()
+                # Keep the window full before handing results to the caller
+                for offset in islice(offsets, 1):
+                    pending.append(pool.submit(self._get_json, url, {**query, 'offset': offset}))
+                received += len(page['results'])
+                yield from self._project(page['results'], tree)
+        self._check_count(endpoint, data, start, received)
+
+    def get_all(self, endpoint: str, params: Optional[Dict[str, Any]] = None, page_size: Optional[int] = None, concurrency: Optional[int] = None, fields: Optional[List[str]] = None, brief: bool = False) -> List[Dict[str, Any]]:
+        """
+        Retrieve every object matching a query via the REST API.
+
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            params: Optional query parameters for filtering
+            page_size: Optional number of objects per page (defaults to self.page_size)
+            concurrency: Optional number of pages fetched in parallel (defaults to
+                self.max_workers; 1 follows "next" links serially)
+            fields: Optional field names to return (e.g. ['id', 'name', 'device.name']);
+                sent to NetBox as fields= and also pruned client-side, so dotted paths
+                and NetBox versions without dynamic fields work too
+            brief: Request NetBox's compact brief representation (ignored if fields is set)
+
+        Returns:
+            List of object dicts
+
+        Raises:
+            requests.HTTPError: If any page request fails
+        """
+        if (concurrency or self.max_workers) <= 1:
+            return super().get_all(endpoint, params=params, page_size=page_size, fields=fields, brief=brief)
+        return list(self.iter_objects_concurrent(endpoint, params=params, page_size=page_size, concurrency=concurrency, fields=fields, brief=brief))
+
+    def graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Run a read-only query against NetBox's GraphQL API.
+
+        One query can walk relations (sites -> devices -> interfaces -> IPs) and select
+        only the fields it needs, replacing a chain of REST list calls.
+
+        Args:
+            query: GraphQL query document
+            variables: Optional GraphQL variables
+
+        Returns:
+            The query's "data" object
+
+        Raises:
+            NetBoxGraphQLError: If the query returned errors
+            requests.HTTPError: If the request fails
+        """
+        key = self._graphql_cache_key(query, variables)
+        if key is not None:
+            body = self.cache.get(key)
+            if body is not None:
+                return self._graphql_data(json.loads(body))
+        url = f"{self.base_url}/graphql/"
+        # NetBox's GraphQL API has no mutations, so a query is always safe to resend
+        response = self._request('POST', url, idempotent=True, json={'query': query, 'variables': variables or {}})
+        response.raise_for_status()
+        payload = response.json()
+        data = self._graphql_data(payload)
+        if key is not None:
+            self.cache.set(key, response.content)
         return data
 
     def create(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -214,8 +786,9 @@ class NetBoxRestClient(NetBoxClientBase):
             requests.HTTPError: If the request fails
         """
         url = self._build_url(endpoint)
-        response = self.session.post(url, json=data, verify=self.verify_ssl)
+        response = self._request('POST', url, json=data)
         response.raise_for_status()
+        self._invalidate(endpoint)
         return response.json()
 
     def update(self, endpoint: str, id: int, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -234,8 +807,9 @@ class NetBoxRestClient(NetBoxClientBase):
             requests.HTTPError: If the request fails
         """
         url = self._build_url(endpoint, id)
-        response = self.session.patch(url, json=data, verify=self.verify_ssl)
+        response = self._request('PATCH', url, json=data)
         response.raise_for_status()
+        self._invalidate(endpoint)
         return response.json()
 
     def delete(self, endpoint: str, id: int) -> bool:
@@ -253,13 +827,70 @@ class NetBoxRestClient(NetBoxClientBase):
             requests.HTTPError: If the request fails
         """
         url = self._build_url(endpoint, id)
-        response = self.session.delete(url, verify=self.verify_ssl)
+        response = self._request('DELETE', url)
         response.raise_for_status()
+        self._invalidate(endpoint)
         return response.status_code == 204
 
+    @staticmethod
+    def _response_body(response: requests.Response) -> Any:
+        """Parse a response body as JSON, falling back to its text."""
+        if not response.content:
+            return None
+        try:
+            return response.json()
+        except ValueError:
+            return response.text
+
+    def _send_bulk_chunk(self, action: str, url: str, chunk: _BulkChunk, retries: int) -> None:
+        """Send one bulk chunk, retrying and splitting it as _bulk_handle decides."""
+        method = self._BULK_METHODS[action]
+        while chunk.pending:
+            try:
+                # The chunk loop below owns retries, so the scheduler doesn't resend
+                response = self._request(method, url, retries=0, json=self._bulk_payload(action, chunk.pending))
+                status, body = response.status_code, self._response_body(response)
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            except requests.RequestException as e:
+                status, body, retry_after = None, str(e), None
+            delay = self._bulk_handle(action, chunk, status, body, retries, retry_after)
+            if delay:
+                time.sleep(delay)
+
+    def bulk_write(self, action: str, endpoint: str, items: List[Any], chunk_size: Optional[int] = None, concurrency: Optional[int] = None, retries: Optional[int] = None) -> BulkResult:
+        """
+        Apply a bulk create/update/delete in chunks, dispatched concurrently.
+
+        Each chunk is its own NetBox transaction. Chunks rejected as throttled or
+        unavailable are resent with exponential backoff (creates only when the request
+        certainly wasn't applied); items NetBox rejects as invalid are reported
+        individually and the rest of their chunk is resent without them.
+
+        Args:
+            action: 'create', 'update' or 'delete'
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            items: Objects to create, objects to update (must include ID), or IDs to delete
+            chunk_size: Optional number of items per request (defaults to self.bulk_chunk_size)
+            concurrency: Optional number of chunks in flight (defaults to self.max_workers;
+                use 1 when later items depend on earlier ones)
+            retries: Optional number of resends per chunk (defaults to self.bulk_retries)
+
+        Returns:
+            A BulkResult listing what succeeded and what failed
+        """
+        if action not in self._BULK_METHODS:
+            raise ValueError(f"Invalid bulk action {action!r}. Must be one of: {', '.join(self._BULK_METHODS)}")
+        # NetBox takes bulk writes on the list URL itself (POST/PATCH/DELETE a list)
+        url = self._build_url(endpoint)
+        chunks = self._bulk_chunks(items, chunk_size)
+        retries = self.bulk_retries if retries is None else retries
+        with ThreadPoolExecutor(max_workers=max(1, concurrency or self.max_workers)) as pool:
+            list(pool.map(lambda chunk: self._send_bulk_chunk(action, url, chunk, retries), chunks))
+        return self._bulk_result(action, endpoint, chunks)
+
     def bulk_create(self, endpoint: str, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        Create multiple objects in NetBox via the REST API.
+        Create multiple objects in NetBox via the REST API, in chunks (see bulk_write).
 
         Args:
             endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
@@ -269,16 +900,16 @@ class NetBoxRestClient(NetBoxClientBase):
             List of created objects as dicts
 
         Raises:
-            requests.HTTPError: If the request fails
+            BulkOperationError: If any item wasn't created; see its `result`
         """
-        url = f"{self._build_url(endpoint)}bulk/"
-        response = self.session.post(url, json=data, verify=self.verify_ssl)
-        response.raise_for_status()
-        return response.json()
+        result = self.bulk_write('create', endpoint, data)
+        if not result.ok:
+            raise BulkOperationError(result)
+        return result.succeeded
 
     def bulk_update(self, endpoint: str, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        Update multiple objects in NetBox via the REST API.
+        Update multiple objects in NetBox via the REST API, in chunks (see bulk_write).
 
         Args:
             endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
@@ -288,29 +919,490 @@ class NetBoxRestClient(NetBoxClientBase):
             List of updated objects as dicts
 
         Raises:
-            requests.HTTPError: If the request fails
+            BulkOperationError: If any item wasn't updated; see its `result`
         """
-        url = f"{self._build_url(endpoint)}bulk/"
-        response = self.session.patch(url, json=data, verify=self.verify_ssl)
-        response.raise_for_status()
-        return response.json()
+        result = self.bulk_write('update', endpoint, data)
+        if not result.ok:
+            raise BulkOperationError(result)
+        return result.succeeded
 
     def bulk_delete(self, endpoint: str, ids: List[int]) -> bool:
         """
-        Delete multiple objects from NetBox via the REST API.
+        Delete multiple objects from NetBox via the REST API, in chunks (see bulk_write).
 
         Args:
             endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
             ids: List of IDs to delete
 
+        Returns:
+            True if every object was deleted
+
+        Raises:
+            BulkOperationError: If any object wasn't deleted; see its `result`
+        """
+        result = self.bulk_write('delete', endpoint, ids)
+        if not result.ok:
+            raise BulkOperationError(result)
+        return True
+
+
+class AsyncNetBoxRestClient(_NetBoxRestMixin):
+    """
+    NetBox client implementation using the REST API from asyncio.
+
+    Mirrors NetBoxClientBase method for method, but every call is a coroutine and
+    requests share one pooled httpx.AsyncClient, so concurrent callers overlap on the
+    wire instead of blocking the event loop.
+
+    Example:
+        client = AsyncNetBoxRestClient(url="https://netbox.example.com", token="...")
+        sites = await client.get_all("dcim/sites")
+        site = await client.get("dcim/sites", id=1)
+        await client.aclose()
+    """
+
+    def __init__(self, url: str, token: str, verify_ssl: bool = True, page_size: int = 1000, max_workers: int = 4, cache: Optional[ResponseCache] = None, bulk_chunk_size: int = 100, bulk_retries: int = 2, scheduler: Optional[RequestScheduler] = None):
+        """
+        Initialize the async REST API client.
+
+        Args:
+            url: The base URL of the NetBox instance (e.g., 'https://netbox.example.com')
+            token: API token for authentication
+            verify_ssl: Whether to verify SSL certificates
+            page_size: Default number of objects per page for iter_objects/get_all
+                (NetBox caps this at its MAX_PAGE_SIZE setting, 1000 by default)
+            max_workers: Default number of pages get_all fetches concurrently
+            cache: Optional ResponseCache to serve repeated GETs from; writes through
+                this client invalidate the affected endpoint
+            bulk_chunk_size: Default number of items per request for bulk_* methods
+            bulk_retries: Default number of times a failed bulk chunk is resent
+            scheduler: Optional RequestScheduler setting timeouts, retries and rate
+                limits for every request (defaults to RequestScheduler())
+        """
+        self._configure(url, token, verify_ssl, page_size, max_workers, cache, bulk_chunk_size, bulk_retries, scheduler)
+        # Timeouts are set per request by the scheduler
+        self.client = httpx.AsyncClient(headers=self.headers, verify=verify_ssl, limits=self.scheduler.httpx_limits())
+
+    async def __aenter__(self) -> "AsyncNetBoxRestClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self.client.aclose()
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request through the scheduler (timeouts, retries, rate limit)."""
+        return await self.scheduler.send_async(self.client, method, url, **kwargs)
+
+    async def _get_json(self, url: str, params: Optional[Dict[str, Any]] = None, use_cache: bool = True) -> Any:
+        """
+        Issue a GET request and return the parsed JSON body, via the cache if set
+        and use_cache is True.
+
+        Concurrent identical GETs share one upstream request; each caller parses its
+        own copy of the body.
+        """
+        key = self._cache_key(url, params) if use_cache else None
+        if key is not None:
+            body = self.cache.get(key)
+            if body is not None:
+                return json.loads(body)
+        body = await self.scheduler.coalesce_async(request_key('GET', url, params), lambda: self._fetch_body(url, params, key))
+        return json.loads(body)
+
+    async def _fetch_body(self, url: str, params: Optional[Dict[str, Any]], key: Optional[CacheKey]) -> bytes:
+        """
+        Issue a GET request and return the raw body, storing it in the cache if set.
+
+        Expired cache entries with an ETag are revalidated with If-None-Match; a 304
+        serves the cached body without downloading it again.
+        """
+        headers = {}
+        etag = self.cache.etag(key) if key is not None else None
+        if etag is not None:
+            headers['If-None-Match'] = etag
+        response = await self._request('GET', url, params=params, headers=headers)
+        if response.status_code == 304 and key is not None:
+            body = self.cache.revalidate(key)
+            if body is not None:
+                return body
+            # Entry was evicted while the request was in flight; fetch it for real
+            return await self._fetch_body(url, params, key)
+        response.raise_for_status()
+        if key is not None:
+            self.cache.set(key, response.content, response.headers.get('ETag'))
+        return response.content
+
+    async def get(self, endpoint: str, id: Optional[int] = None, params: Optional[Dict[str, Any]] = None, fields: Optional[List[str]] = None, brief: bool = False, use_cache: bool = True) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Retrieve one or more objects from NetBox via the REST API.
+
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            id: Optional ID to retrieve a specific object
+            params: Optional query parameters for filtering
+            fields: Optional field names to return (e.g. ['id', 'name', 'device.name']);
+                sent to NetBox as fields= and also pruned client-side, so dotted paths
+                and NetBox versions without dynamic fields work too
+            brief: Request NetBox's compact brief representation (ignored if fields is set)
+            use_cache: Set False to always ask NetBox, neither reading nor storing a
+                cached response (e.g. when polling for new changes)
+
+        Returns:
+            Either a single object dict or a list of object dicts (first page only)
+
+        Raises:
+            httpx.HTTPStatusError: If the request fails
+        """
+        url = self._build_url(endpoint, id)
+        data = await self._get_json(url, self._projection_params(params, fields, brief), use_cache)
+        if id is None and 'results' in data:
+            # Handle paginated results
+            data = data['results']
+        return self._project(data, self._field_tree(fields))
+
+    async def iter_objects(self, endpoint: str, params: Optional[Dict[str, Any]] = None, page_size: Optional[int] = None, fields: Optional[List[str]] = None, brief: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Lazily iterate over every object matching a query, following "next" links.
+
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            params: Optional query parameters for filtering
+            page_size: Optional number of objects per page (defaults to self.page_size)
+            fields: Optional field names to return (e.g. ['id', 'name', 'device.name']);
+                sent to NetBox as fields= and also pruned client-side, so dotted paths
+                and NetBox versions without dynamic fields work too
+            brief: Request NetBox's compact brief representation (ignored if fields is set)
+
+        Returns:
+            An async iterator of object dicts
+
+        Raises:
+            httpx.HTTPStatusError: If any page request fails
+        """
+        url = self._build_url(endpoint)
+        tree = self._field_tree(fields)
+        query = self._projection_params(params, fields, brief)
+        query['limit'] = page_size or self.page_size
+        while url:
+            data = await self._get_json(url, query)
+            if not isinstance(data, dict) or 'results' not in data:
+                # Endpoint isn't paginated; yield whatever it returned
+                for obj in self._project(data if isinstance(data, list) else [data], tree):
+                    yield obj
+                return
+            for obj in self._project(data['results'], tree):
+                yield obj
+            url = self._rebase_url(data.get('next'))
+            query = None
+
+    async def iter_objects_concurrent(self, endpoint: str, params: Optional[Dict[str, Any]] = None, page_size: Optional[int] = None, concurrency: Optional[int] = None, fields: Optional[List[str]] = None, brief: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over every object matching a query, prefetching pages concurrently.
+
+        Same strategy as NetBoxRestClient.iter_objects_concurrent, with tasks on the
+        event loop in place of a thread pool.
+
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            params: Optional query parameters for filtering
+            page_size: Optional number of objects per page (defaults to self.page_size)
+            concurrency: Optional number of pages in flight (defaults to self.max_workers)
+            fields: Optional field names to return (e.g. ['id', 'name', 'device.name']);
+                sent to NetBox as fields= and also pruned client-side, so dotted paths
+                and NetBox versions without dynamic fields work too
+            brief: Request NetBox's compact brief representation (ignored if fields is set)
+
+        Returns:
+            An async iterator of object dicts
+
+        Raises:
+            httpx.HTTPStatusError: If any page request fails
+        """
+        url = self._build_url(endpoint)
+        limit = page_size or self.page_size
+        workers = concurrency or self.max_workers
+        tree = self._field_tree(fields)
+        query = self._projection_params(params, fields, brief)
+        start = int(query.pop('offset', 0))
+        query['limit'] = limit
+
+        data = await self._get_json(url, {**query, 'offset': start})
+        if not isinstance(data, dict) or 'results' not in data:
+            for obj in self._project(data if isinstance(data, list) else [data], tree):
+                yield obj
+            return
+        for obj in self._project(data['results'], tree):
+            yield obj
+        if not data.get('next'):
+            return
+
+        page_offsets = self._page_offsets(data, start)
+        if page_offsets is None:
+            next_url = self._rebase_url(data.get('next'))
+            while next_url:
+                page = await self._get_json(next_url)
+                for obj in self._project(page['results'], tree):
+                    yield obj
+                next_url = self._rebase_url(page.get('next'))
+            return
+
+        received = len(data['results'])
+        offsets = iter(page_offsets)
+        pending = deque(
+            asyncio.ensure_future(self._get_json(url, {**query, 'offset': offset}))
+            for offset in islice(offsets, workers)
+        )
+        try:
+            while pending:
+                page = await pending.popleft()
+                for offset in islice(offsets, 1):
+                    pending.append(asyncio.ensure_future(self._get_json(url, {**query, 'offset': offset})))
+                received += len(page['results'])
+                for obj in self._project(page['results'], tree):
+                    yield obj
+        finally:
+            # Caller stopped early or a page failed; don't leave requests running
+            for task in pending:
+                task.cancel()
+        self._check_count(endpoint, data, start, received)
+
+    async def get_all(self, endpoint: str, params: Optional[Dict[str, Any]] = None, page_size: Optional[int] = None, concurrency: Optional[int] = None, fields: Optional[List[str]] = None, brief: bool = False) -> List[Dict[str, Any]]:
+        """
+        Retrieve every object matching a query via the REST API.
+
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            params: Optional query parameters for filtering
+            page_size: Optional number of objects per page (defaults to self.page_size)
+            concurrency: Optional number of pages fetched in parallel (defaults to
+                self.max_workers; 1 follows "next" links serially)
+            fields: Optional field names to return (e.g. ['id', 'name', 'device.name']);
+                sent to NetBox as fields= and also pruned client-side, so dotted paths
+                and NetBox versions without dynamic fields work too
+            brief: Request NetBox's compact brief representation (ignored if fields is set)
+
+        Returns:
+            List of object dicts
+
+        Raises:
+            httpx.HTTPStatusError: If any page request fails
+        """
+        if (concurrency or self.max_workers) <= 1:
+            return [obj async for obj in self.iter_objects(endpoint, params=params, page_size=page_size, fields=fields, brief=brief)]
+        return [obj async for obj in self.iter_objects_concurrent(endpoint, params=params, page_size=page_size, concurrency=concurrency, fields=fields, brief=brief)]
+
+    async def graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Run a read-only query against NetBox's GraphQL API.
+
+        One query can walk relations (sites -> devices -> interfaces -> IPs) and select
+        only the fields it needs, replacing a chain of REST list calls.
+
+        Args:
+            query: GraphQL query document
+            variables: Optional GraphQL variables
+
+        Returns:
+            The query's "data" object
+
+        Raises:
+            NetBoxGraphQLError: If the query returned errors
+            httpx.HTTPStatusError: If the request fails
+        """
+        key = self._graphql_cache_key(query, variables)
+        if key is not None:
+            body = self.cache.get(key)
+            if body is not None:
+                return self._graphql_data(json.loads(body))
+        url = f"{self.base_url}/graphql/"
+        # NetBox's GraphQL API has no mutations, so a query is always safe to resend
+        response = await self._request('POST', url, idempotent=True, json={'query': query, 'variables': variables or {}})
+        response.raise_for_status()
+        payload = response.json()
+        data = self._graphql_data(payload)
+        if key is not None:
+            self.cache.set(key, response.content)
+        return data
+
+    async def create(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create a new object in NetBox via the REST API.
+
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            data: Object data to create
+
+        Returns:
+            The created object as a dict
+
+        Raises:
+            httpx.HTTPStatusError: If the request fails
+        """
+        url = self._build_url(endpoint)
+        response = await self._request('POST', url, json=data)
+        response.raise_for_status()
+        self._invalidate(endpoint)
+        return response.json()
+
+    async def update(self, endpoint: str, id: int, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Update an existing object in NetBox via the REST API.
+
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            id: ID of the object to update
+            data: Object data to update
+
+        Returns:
+            The updated object as a dict
+
+        Raises:
+            httpx.HTTPStatusError: If the request fails
+        """
+        url = self._build_url(endpoint, id)
+        response = await self._request('PATCH', url, json=data)
+        response.raise_for_status()
+        self._invalidate(endpoint)
+        return response.json()
+
+    async def delete(self, endpoint: str, id: int) -> bool:
+        """
+        Delete an object from NetBox via the REST API.
+
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            id: ID of the object to delete
+
         Returns:
             True if deletion was successful, False otherwise
 
         Raises:
-            requests.HTTPError: If the request fails
+            httpx.HTTPStatusError: If the request fails
         """
-        url = f"{self._build_url(endpoint)}bulk/"
-        data = [{"id": id} for id in ids]
-        response = self.session.delete(url, json=data, verify=self.verify_ssl)
+        url = self._build_url(endpoint, id)
+        response = await self._request('DELETE', url)
         response.raise_for_status()
+        self._invalidate(endpoint)
         return response.status_code == 204
+
+    @staticmethod
+    def _response_body(response: httpx.Response) -> Any:
+        """Parse a response body as JSON, falling back to its text."""
+        if not response.content:
+            return None
+        try:
+            return response.json()
+        except ValueError:
+            return response.text
+
+    async def _send_bulk_chunk(self, action: str, url: str, chunk: _BulkChunk, retries: int) -> None:
+        """Send one bulk chunk, retrying and splitting it as _bulk_handle decides."""
+        method = self._BULK_METHODS[action]
+        while chunk.pending:
+            try:
+                # The chunk loop below owns retries, so the scheduler doesn't resend
+                response = await self._request(method, url, retries=0, json=self._bulk_payload(action, chunk.pending))
+                status, body = response.status_code, self._response_body(response)
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            except httpx.HTTPError as e:
+                status, body, retry_after = None, str(e), None
+            delay = self._bulk_handle(action, chunk, status, body, retries, retry_after)
+            if delay:
+                await asyncio.sleep(delay)
+
+    async def bulk_write(self, action: str, endpoint: str, items: List[Any], chunk_size: Optional[int] = None, concurrency: Optional[int] = None, retries: Optional[int] = None) -> BulkResult:
+        """
+        Apply a bulk create/update/delete in chunks, dispatched concurrently.
+
+        Each chunk is its own NetBox transaction. Chunks rejected as throttled or
+        unavailable are resent with exponential backoff (creates only when the request
+        certainly wasn't applied); items NetBox rejects as invalid are reported
+        individually and the rest of their chunk is resent without them.
+
+        Args:
+            action: 'create', 'update' or 'delete'
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            items: Objects to create, objects to update (must include ID), or IDs to delete
+            chunk_size: Optional number of items per request (defaults to self.bulk_chunk_size)
+            concurrency: Optional number of chunks in flight (defaults to self.max_workers;
+                use 1 when later items depend on earlier ones)
+            retries: Optional number of resends per chunk (defaults to self.bulk_retries)
+
+        Returns:
+            A BulkResult listing what succeeded and what failed
+        """
+        if action not in self._BULK_METHODS:
+            raise ValueError(f"Invalid bulk action {action!r}. Must be one of: {', '.join(self._BULK_METHODS)}")
+        # NetBox takes bulk writes on the list URL itself (POST/PATCH/DELETE a list)
+        url = self._build_url(endpoint)
+        chunks = self._bulk_chunks(items, chunk_size)
+        retries = self.bulk_retries if retries is None else retries
+        semaphore = asyncio.Semaphore(max(1, concurrency or self.max_workers))
+
+        async def run(chunk: _BulkChunk) -> None:
+            async with semaphore:
+                await self._send_bulk_chunk(action, url, chunk, retries)
+
+        await asyncio.gather(*(run(chunk) for chunk in chunks))
+        return self._bulk_result(action, endpoint, chunks)
+
+    async def bulk_create(self, endpoint: str, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Create multiple objects in NetBox via the REST API, in chunks (see bulk_write).
+
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            data: List of object data to create
+
+        Returns:
+            List of created objects as dicts
+
+        Raises:
+            BulkOperationError: If any item wasn't created; see its `result`
+        """
+        result = await self.bulk_write('create', endpoint, data)
+        if not result.ok:
+            raise BulkOperationError(result)
+        return result.succeeded
+
+    async def bulk_update(self, endpoint: str, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Update multiple objects in NetBox via the REST API, in chunks (see bulk_write).
+
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            data: List of object data to update (must include ID)
+
+        Returns:
+            List of updated objects as dicts
+
+        Raises:
+            BulkOperationError: If any item wasn't updated; see its `result`
+        """
+        result = await self.bulk_write('update', endpoint, data)
+        if not result.ok:
+            raise BulkOperationError(result)
+        return result.succeeded
+
+    async def bulk_delete(self, endpoint: str, ids: List[int]) -> bool:
+        """
+        Delete multiple objects from NetBox via the REST API, in chunks (see bulk_write).
+
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            ids: List of IDs to delete
+
+        Returns:
+            True if every object was deleted
+
+        Raises:
+            BulkOperationError: If any object wasn't deleted; see its `result`
+        """
+        result = await self.bulk_write('delete', endpoint, ids)
+        if not result.ok:
+            raise BulkOperationError(result)
+        return True
@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+NetBox IP Index
+
+In-memory index over NetBox prefixes, IP ranges and IP addresses, so containment,
+longest-prefix-match and free-space questions are answered without pulling whole
+ipam/* lists for every question.
+
+Each (VRF, IP version) pair gets its own table:
+
+- prefixes are hashed per prefix length, so a longest-prefix match is one dict lookup
+  per possible length (at most 33 for IPv4, 129 for IPv6) regardless of table size;
+  they are also kept sorted by network address, so the prefixes inside a parent are
+  found by bisection
+- IP addresses are kept sorted by address and found by bisection
+- IP ranges are kept sorted by start address, with a running maximum of end addresses
+  so the search for ranges covering an address stops early
+
+IPIndexCache keeps the index current from a NetBoxMirror of the three ipam endpoints:
+the server's own mirror when it holds them, otherwise a private one that stores only
+the fields the index uses and polls the changelog at most once per TTL. Either way
+NetBox is read in full once; after that only changelog deltas and the changed objects
+are fetched. The index itself is rebuilt in memory (no requests) whenever the mirrored
+objects change.
+"""
+
+import asyncio
+import ipaddress
+import time
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from netbox_client import AsyncNetBoxRestClient
+from netbox_mirror import NetBoxMirror
+
+PREFIXES_ENDPOINT = "ipam/prefixes"
+IP_RANGES_ENDPOINT = "ipam/ip-ranges"
+IP_ADDRESSES_ENDPOINT = "ipam/ip-addresses"
+
+# Fields the index needs when it reads NetBox directly
+_INDEX_FIELDS = {
+    PREFIXES_ENDPOINT: ["id", "prefix", "vrf.id", "vrf.name", "status", "is_pool", "description"],
+    IP_RANGES_ENDPOINT: [
+        "id", "start_address", "end_address", "vrf.id", "vrf.name", "status", "description",
+        "mark_utilized", "mark_populated",
+    ],
+    IP_ADDRESSES_ENDPOINT: ["id", "address", "vrf.id", "vrf.name", "status", "dns_name", "description"],
+}
+
+Network = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+
+def _vrf_id(obj: Dict[str, Any]) -> Optional[int]:
+    """Return the object's VRF ID, or None for the global table."""
+    vrf = obj.get("vrf")
+    return vrf.get("id") if isinstance(vrf, dict) else vrf
+
+
+def _summary(obj: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce an index entry to the fields worth returning from a lookup."""
+    keys = ("id", "prefix", "start_address", "end_address", "address", "dns_name", "description")
+    summary = {key: obj[key] for key in keys if obj.get(key) not in (None, "")}
+    status = obj.get("status")
+    if status is not None:
+        summary["status"] = status.get("value") if isinstance(status, dict) else status
+    if isinstance(obj.get("vrf"), dict):
+        summary["vrf"] = obj["vrf"].get("name")
+    return summary
+
+
+def _gaps(start: int, end: int, used: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Return the inclusive intervals in [start, end] not covered by the sorted used intervals."""
+    gaps, cursor = [], start
+    for used_start, used_end in used:
+        if used_end < cursor:
+            continue
+        if used_start > end:
+            break
+        if used_start > cursor:
+            gaps.append((cursor, used_start - 1))
+        cursor = max(cursor, used_end + 1)
+    if cursor <= end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+class _Table:
+    """Prefixes, ranges and addresses of one VRF and IP version."""
+
+    def __init__(self, version: int):
+        self.version = version
+        self.max_length = 32 if version == 4 else 128
+        self.by_length: Dict[int, Dict[int, List[Dict[str, Any]]]] = {}
+        self.prefixes: List[Tuple[int, int, int]] = []  # (network, prefix length, entry index)
+        self.prefix_entries: List[Tuple[Network, Dict[str, Any]]] = []
+        self.addresses: List[Tuple[int, int]] = []  # (address, entry index)
+        self.address_entries: List[Dict[str, Any]] = []
+        self.ranges: List[Tuple[int, int, int]] = []  # (start, end, entry index)
+        self.range_entries: List[Dict[str, Any]] = []
+        self.range_max_end: List[int] = []
+
+    def finish(self) -> None:
+        """Sort the tables once every entry is added."""
+        self.prefixes.sort()
+        self.addresses.sort()
+        self.ranges.sort()
+        running = -1
+        for _, end, _ in self.ranges:
+            running = max(running, end)
+            self.range_max_end.append(running)
+
+    def containing_prefixes(self, network: Network) -> List[Dict[str, Any]]:
+        """Return every prefix containing the network, outermost first."""
+        matches = []
+        value = int(network.network_address)
+        for length in range(network.prefixlen, -1, -1):
+            bucket = self.by_length.get(length)
+            if bucket:
+                mask = ((1 << length) - 1) << (self.max_length - length)
+                matches.extend(bucket.get(value & mask, ()))
+        return matches[::-1]
+
+    def child_prefixes(self, network: Network) -> List[Tuple[Network, Dict[str, Any]]]:
+        """Return the prefixes strictly inside the network, in address order."""
+        first, last = int(network.network_address), int(network.broadcast_address)
+        lo = bisect_left(self.prefixes, (first, network.prefixlen + 1, -1))
+        hi = bisect_right(self.prefixes, (last, self.max_length + 1, -1))
+        return [
+            self.prefix_entries[index] for _, length, index in self.prefixes[lo:hi]
+            if length > network.prefixlen
+        ]
+
+    def addresses_within(self, first: int, last: int) -> List[Tuple[int, Dict[str, Any]]]:
+        """Return the IP addresses in [first, last], in address order."""
+        lo = bisect_left(self.addresses, (first, -1))
+        hi = bisect_right(self.addresses, (last, len(self.address_entries)))
+        return [(value, self.address_entries[index]) for value, index in self.addresses[lo:hi]]
+
+    def ranges_covering(self, value: int) -> List[Dict[str, Any]]:
+        """Return the IP ranges that include an address."""
+        matches = []
+        index = bisect_right(self.ranges, (value, 1 << self.max_length, len(self.range_entries))) - 1
+        while index >= 0 and self.range_max_end[index] >= value:
+            _, end, entry = self.ranges[index]
+            if end >= value:
+                matches.append(self.range_entries[entry])
+            index -= 1
+        return matches[::-1]
+
+    def ranges_within(self, first: int, last: int) -> List[Tuple[int, int, Dict[str, Any]]]:
+        """Return the IP ranges that overlap [first, last], clipped to it."""
+        matches = []
+        index = bisect_right(self.ranges, (last, 1 << self.max_length, len(self.range_entries))) - 1
+        while index >= 0 and self.range_max_end[index] >= first:
+            start, end, entry = self.ranges[index]
+            if end >= first:
+                matches.append((max(start, first), min(end, last), self.range_entries[entry]))
+            index -= 1
+        return matches[::-1]
+
+
+class IPIndex:
+    """
+    Immutable index over prefixes, IP ranges and IP addresses.
+
+    Example:
+        index = IPIndex.build(prefixes, ip_ranges, ip_addresses)
+        index.lookup("10.20.3.4")           # longest match, containing prefixes, range, IP
+        index.free("10.20.3.0/24", limit=10)  # free IPs and free child prefixes
+    """
+
+    def __init__(self):
+        self._tables: Dict[Tuple[Optional[int], int], _Table] = {}
+        self.built_at = time.monotonic()
+        self.counts = {"prefixes": 0, "ip_ranges": 0, "ip_addresses": 0}
+
+    @classmethod
+    def build(cls, prefixes: List[Dict[str, Any]], ip_ranges: List[Dict[str, Any]], ip_addresses: List[Dict[str, Any]]) -> "IPIndex":
+        """Build an index from NetBox prefix, IP range and IP address objects."""
+        index = cls()
+        for obj in prefixes:
+            network = ipaddress.ip_network(obj["prefix"], strict=False)
+            table = index._table(_vrf_id(obj), network.version)
+            value = int(network.network_address)
+            table.by_length.setdefault(network.prefixlen, {}).setdefault(value, []).append(obj)
+            table.prefixes.append((value, network.prefixlen, len(table.prefix_entries)))
+            table.prefix_entries.append((network, obj))
+        for obj in ip_ranges:
+            start = ipaddress.ip_interface(obj["start_address"]).ip
+            end = ipaddress.ip_interface(obj["end_address"]).ip
+            table = index._table(_vrf_id(obj), start.version)
+            table.ranges.append((int(start), int(end), len(table.range_entries)))
+            table.range_entries.append(obj)
+        for obj in ip_addresses:
+            address = ipaddress.ip_interface(obj["address"]).ip
+            table = index._table(_vrf_id(obj), address.version)
+            table.addresses.append((int(address), len(table.address_entries)))
+            table.address_entries.append(obj)
+        for table in index._tables.values():
+            table.finish()
+        index.counts = {"prefixes": len(prefixes), "ip_ranges": len(ip_ranges), "ip_addresses": len(ip_addresses)}
+        return index
+
+    def lookup(self, query: str, vrf_id: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Find what an address or prefix belongs to.
+
+        An address with a mask (e.g. '10.0.0.5/24', as NetBox stores IP addresses) is
+        looked up as the address.
+
+        Returns:
+            Dict with longest_match (the most specific containing prefix, or None),
+            containing_prefixes (outermost first), ip_ranges covering the address and
+            ip_addresses recorded for it (addresses only)
+        """
+        interface = ipaddress.ip_interface(query)
+        is_address = "/" not in query or interface.ip != interface.network.network_address
+        network = ipaddress.ip_network(interface.ip) if is_address else interface.network
+        table = self._tables.get((vrf_id, network.version))
+        if table is None:
+            return {"query": query, "longest_match": None, "containing_prefixes": [], "ip_ranges": [], "ip_addresses": []}
+        containing = table.containing_prefixes(network)
+        result = {
+            "query": query,
+            "longest_match": _summary(containing[-1]) if containing else None,
+            "containing_prefixes": [_summary(obj) for obj in containing],
+            "ip_ranges": [],
+            "ip_addresses": [],
+        }
+        if is_address or network.num_addresses == 1:
+            value = int(network.network_address)
+            result["ip_ranges"] = [_summary(obj) for obj in table.ranges_covering(value)]
+            result["ip_addresses"] = [_summary(obj) for _, obj in table.addresses_within(value, value)]
+        return result
+
+    def children(self, prefix: str, vrf_id: Optional[int] = None, limit: int = 256) -> Dict[str, Any]:
+        """
+        List what is allocated inside a prefix.
+
+        Returns:
+            Dict with child prefixes, IP ranges and IP addresses inside the prefix (each
+            capped at limit) and their full counts
+        """
+        network = ipaddress.ip_network(prefix, strict=False)
+        table = self._tables.get((vrf_id, network.version)) or _Table(network.version)
+        first, last = int(network.network_address), int(network.broadcast_address)
+        prefixes = table.child_prefixes(network)
+        ranges = table.ranges_within(first, last)
+        addresses = table.addresses_within(first, last)
+        return {
+            "prefix": str(network),
+            "prefix_count": len(prefixes),
+            "ip_range_count": len(ranges),
+            "ip_address_count": len(addresses),
+            "prefixes": [_summary(obj) for _, obj in prefixes[:limit]],
+            "ip_ranges": [_summary(obj) for _, _, obj in ranges[:limit]],
+            "ip_addresses": [_summary(obj) for _, obj in addresses[:limit]],
+        }
+
+    def free(self, prefix: str, vrf_id: Optional[int] = None, limit: int = 256) -> Dict[str, Any]:
+        """
+        Work out the unallocated space inside a prefix.
+
+        Follows NetBox's available-ips rules: IP addresses count as used, IP ranges only
+        when marked utilized (or, on NetBox 4.3+, populated), and unless the prefix is a pool the IPv4 network/broadcast addresses (or the
+        IPv6 subnet-router anycast address) are never free.
+
+        Returns:
+            Dict with free_ip_count, free_ips (the first `limit` free addresses),
+            free_ip_ranges and free_prefixes (unallocated child CIDR blocks), each list
+            capped at limit
+        """
+        network = ipaddress.ip_network(prefix, strict=False)
+        table = self._tables.get((vrf_id, network.version)) or _Table(network.version)
+        first, last = int(network.network_address), int(network.broadcast_address)
+
+        own = table.by_length.get(network.prefixlen, {}).get(first, [])
+        is_pool = any(obj.get("is_pool") for obj in own)
+        ip_first, ip_last = first, last
+        if not is_pool:
+            if network.version == 4 and network.prefixlen < 31:
+                ip_first, ip_last = first + 1, last - 1
+            elif network.version == 6 and network.prefixlen < 127:
+                ip_first = first + 1
+
+        used = sorted(
+            [(value, value) for value, _ in table.addresses_within(first, last)]
+            + [
+                (start, end) for start, end, obj in table.ranges_within(first, last)
+                if obj.get("mark_utilized") or obj.get("mark_populated")
+            ]
+        )
+        free_ranges = _gaps(ip_first, ip_last, used) if ip_first <= ip_last else []
+        free_ips: List[str] = []
+        for start, end in free_ranges:
+            for value in range(start, min(end, start + limit - len(free_ips) - 1) + 1):
+                free_ips.append(str(ipaddress.ip_address(value)))
+            if len(free_ips) >= limit:
+                break
+
+        # Only top-level children take space: nested ones sit inside another child
+        children, covered_to = [], first - 1
+        for child, _ in table.child_prefixes(network):
+            if int(child.network_address) > covered_to:
+                children.append((int(child.network_address), int(child.broadcast_address)))
+                covered_to = int(child.broadcast_address)
+        free_prefixes: List[str] = []
+        for start, end in _gaps(first, last, children):
+            for block in ipaddress.summarize_address_range(ipaddress.ip_address(start), ipaddress.ip_address(end)):
+                free_prefixes.append(str(block))
+            if len(free_prefixes) >= limit:
+                break
+
+        return {
+            "prefix": str(network),
+            "is_pool": is_pool,
+            "free_ip_count": sum(end - start + 1 for start, end in free_ranges),
+            "free_ips": free_ips,
+            "free_ip_ranges": [
+                {"start": str(ipaddress.ip_address(start)), "end": str(ipaddress.ip_address(end)), "size": end - start + 1}
+                for start, end in free_ranges[:limit]
+            ],
+            "free_prefixes": free_prefixes[:limit],
+        }
+
+    def _table(self, vrf_id: Optional[int], version: int) -> _Table:
+        """Return the table for a VRF and IP version, creating it if needed."""
+        key = (vrf_id, version)
+        if key not in self._tables:
+            self._tables[key] = _Table(version)
+        return self._tables[key]
+
+
+class IPIndexCache:
+    """
+    Keeps an IPIndex current from a mirror of the ipam endpoints, kept in sync from
+    the changelog.
+
+    Example:
+        indexes = IPIndexCache(client, mirror=mirror, ttl=60)
+        index = await indexes.get()
+    """
+
+    def __init__(self, client: AsyncNetBoxRestClient, mirror: Optional[NetBoxMirror] = None, ttl: float = 60.0):
+        """
+        Args:
+            client: Client used by the private mirror when `mirror` doesn't hold the
+                ipam endpoints
+            mirror: Optional local mirror to build the index from
+            ttl: Minimum seconds between changelog polls of the private mirror
+        """
+        endpoints = (PREFIXES_ENDPOINT, IP_RANGES_ENDPOINT, IP_ADDRESSES_ENDPOINT)
+        if mirror is None or not all(mirror.mirrors(endpoint) for endpoint in endpoints):
+            mirror = NetBoxMirror(client, endpoints, poll_interval=ttl, fields=_INDEX_FIELDS)
+        self.client = client
+        self.mirror = mirror
+        self.ttl = ttl
+        self.builds = 0
+        self._index: Optional[IPIndex] = None
+        self._generations: Optional[Tuple[int, ...]] = None
+        self._lock = asyncio.Lock()
+
+    def mark_stale(self) -> None:
+        """Poll the changelog before the next use, e.g. after a write through this server."""
+        self.mirror.mark_stale()
+
+    async def get(self) -> IPIndex:
+        """Return a current index, rebuilding it if the mirrored objects changed."""
+        endpoints = (PREFIXES_ENDPOINT, IP_RANGES_ENDPOINT, IP_ADDRESSES_ENDPOINT)
+        async with self._lock:
+            snapshots = [await self.mirror.snapshot(endpoint) for endpoint in endpoints]
+            generations = tuple(generation for generation, _ in snapshots)
+            if self._index is None or generations != self._generations:
+                self._index = IPIndex.build(*(objects for _, objects in snapshots))
+                self._generations = generations
+                self.builds += 1
+            return self._index
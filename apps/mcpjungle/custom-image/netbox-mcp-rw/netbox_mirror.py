@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+NetBox Object Mirror
+
+In-memory replica of selected NetBox endpoints, used by the MCP server to answer read
+tools without a round trip. Each endpoint is loaded with a full paginated dump the first
+time it is read. From then on the mirror is kept current by polling core/object-changes
+with id__gt set to the newest change already applied (changelog IDs only ever increase,
+where timestamps can tie and don't compare reliably as strings):
+
+- delete records drop the object locally
+- create and update records are re-read from the REST API in one id-filtered request
+  per endpoint, so mirrored objects keep the exact shape the REST API returns (a
+  changelog's postchange_data holds foreign keys as bare IDs, not nested objects)
+
+A poll runs at most once per poll_interval, on the next read, so an idle server sends
+no requests at all. Only filters listed in _FILTERS are evaluated locally, each the way
+NetBox's filterset compares it. Anything else - lookups such as name__ic, free-text q,
+ordering, explicit paging, filters on tree models (region, location, roles, groups)
+that also match descendants, or any other field - returns None and the caller falls
+back to the live API.
+"""
+
+import asyncio
+import ipaddress
+import re
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from netbox_client import AsyncNetBoxRestClient
+
+CHANGELOG_ENDPOINT = "core/object-changes"
+
+# Filters the mirror evaluates locally, and how NetBox compares each:
+#   exact    the field's own scalar value
+#   bool     a boolean field, given as true/false/1/0 in any case
+#   ref      a related object by slug, or a choice field by value (site, status, ...)
+#   name     a related object by name (interfaces' device)
+#   id       a related object's ID, or "null" for none
+#   address  an IP address by host part, ignoring the mask
+#   mac      a MAC address, case-insensitively
+# Related models that nest (regions, locations, roles, platforms, groups) are left out:
+# NetBox's filters on them also match descendants, which the mirror can't see. Every
+# other filter needs the live API.
+_FILTERS = {
+    "id": "exact",
+    "name": "exact",
+    "slug": "exact",
+    "vid": "exact",
+    "dns_name": "exact",
+    "enabled": "bool",
+    "mgmt_only": "bool",
+    "status": "ref",
+    "type": "ref",
+    "site": "ref",
+    "tenant": "ref",
+    "manufacturer": "ref",
+    "device_type": "ref",
+    "device": "name",
+    "site_id": "id",
+    "tenant_id": "id",
+    "manufacturer_id": "id",
+    "device_type_id": "id",
+    "device_id": "id",
+    "rack_id": "id",
+    "vrf_id": "id",
+    "vlan_id": "id",
+    "cluster_id": "id",
+    "virtual_machine_id": "id",
+    "assigned_object_id": "id",
+    "address": "address",
+    "mac_address": "mac",
+}
+
+# Query-string spellings NetBox's boolean filters accept
+_BOOLEANS = {"true": "true", "1": "true", "false": "false", "0": "false"}
+
+# Number of IDs re-read per request when applying create/update records
+_REFRESH_CHUNK = 100
+
+# Endpoints whose model name isn't their URL path made singular
+_MODEL_LABELS = {
+    "virtualization/interfaces": "virtualization.vminterface",
+}
+
+
+def model_label(endpoint: str) -> str:
+    """
+    Derive the changelog object type ('app_label.model') for a REST endpoint.
+
+    Example:
+        model_label("ipam/ip-addresses")  # "ipam.ipaddress"
+    """
+    endpoint = endpoint.strip("/")
+    if endpoint in _MODEL_LABELS:
+        return _MODEL_LABELS[endpoint]
+    app, _, resource = endpoint.partition("/")
+    name = resource.replace("-", "")
+    if name.endswith("chassis"):
+        return f"{app}.{name}"
+    if name.endswith("ies"):
+        name = name[:-3] + "y"
+    elif name.endswith(("sses", "xes")):
+        name = name[:-2]
+    elif name.endswith("s"):
+        name = name[:-1]
+    return f"{app}.{name}"
+
+
+def _normalize(value: Any) -> str:
+    """Render a filter or field value the way NetBox's query string would."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if value is None:
+        return "null"
+    return str(value)
+
+
+def _bool(value: Any) -> Optional[str]:
+    """Normalize a boolean filter value to "true"/"false", or None if it isn't one."""
+    if isinstance(value, bool):
+        return _normalize(value)
+    return _BOOLEANS.get(str(value).lower())
+
+
+def _host(value: Any) -> Optional[str]:
+    """Return the host part of an address with or without a mask, or None if it isn't one."""
+    try:
+        return str(ipaddress.ip_interface(str(value)).ip)
+    except ValueError:
+        return None
+
+
+def _mac(value: Any) -> Optional[str]:
+    """Normalize a MAC address to lowercase colon-separated form, or None if it isn't one."""
+    digits = re.sub(r"[^0-9a-fA-F]", "", str(value))
+    if len(digits) != 12:
+        return None
+    return ":".join(digits[i:i + 2] for i in range(0, 12, 2)).lower()
+
+
+def _compile_filters(filters: Optional[Dict[str, Any]]) -> Optional[Dict[str, Tuple[str, Set[str]]]]:
+    """
+    Turn tool filters into {field: (kind, accepted values)}, or None if any filter needs the live API.
+    """
+    compiled = {}
+    for key, value in (filters or {}).items():
+        kind = _FILTERS.get(key)
+        if kind is None:
+            return None
+        values = value if isinstance(value, (list, tuple, set)) else [value]
+        if kind == "address":
+            accepted = {_host(item) for item in values}
+        elif kind == "mac":
+            accepted = {_mac(item) for item in values}
+        elif kind == "bool":
+            accepted = {_bool(item) for item in values}
+        else:
+            accepted = {_normalize(item) for item in values}
+        if None in accepted:
+            return None
+        compiled[key] = (kind, accepted)
+    return compiled
+
+
+def _field_values(obj: Dict[str, Any], key: str, kind: str) -> Optional[Set[str]]:
+    """Return the values a filter compares against, or None if the object can't be compared locally."""
+    if kind == "id":
+        if key[:-3] in obj:
+            value = obj[key[:-3]]
+            found = set()
+            for item in value if isinstance(value, list) else [value]:
+                if item is None:
+                    found.add("null")
+                elif isinstance(item, dict) and "id" in item:
+                    found.add(_normalize(item["id"]))
+                else:
+                    return None
+            return found or {"null"}
+        if key in obj and not isinstance(obj[key], (dict, list)):
+            # A plain integer field, e.g. assigned_object_id
+            return {_normalize(obj[key])}
+        return None
+    if key not in obj:
+        return None
+    value = obj[key]
+    if isinstance(value, list):
+        return None
+    if kind == "exact":
+        return None if isinstance(value, dict) else {_normalize(value)}
+    if kind == "bool":
+        return {_normalize(value)} if isinstance(value, bool) else None
+    if kind in ("ref", "name"):
+        if value is None:
+            return {"null"}
+        if not isinstance(value, dict):
+            return {_normalize(value)} if kind == "ref" else None
+        for attr in (("value", "slug") if kind == "ref" else ("name",)):
+            if attr in value:
+                return {_normalize(value[attr])}
+        return None
+    if value is None:
+        return set()
+    found = _host(value) if kind == "address" else _mac(value)
+    return {found} if found else None
+
+
+def _matches(obj: Dict[str, Any], compiled: Dict[str, Tuple[str, Set[str]]]) -> Optional[bool]:
+    """Return whether an object passes the filters, or None if one can't be evaluated locally."""
+    for key, (kind, accepted) in compiled.items():
+        found = _field_values(obj, key, kind)
+        if found is None:
+            return None
+        if not found & accepted:
+            return False
+    return True
+
+
+class NetBoxMirror:
+    """
+    Locally replicated NetBox objects, kept in sync from the changelog.
+
+    Example:
+        mirror = NetBoxMirror(client, ["dcim/devices", "dcim/sites"], poll_interval=10)
+        devices = await mirror.query("dcim/devices", {"site": "nyc", "status": "active"})
+        if devices is None:
+            devices = await client.get_all("dcim/devices", params={...})
+    """
+
+    def __init__(self, client: AsyncNetBoxRestClient, endpoints: Iterable[str], poll_interval: float = 10.0, fields: Optional[Dict[str, List[str]]] = None):
+        """
+        Args:
+            client: Client used for the initial dumps, changelog polls and re-reads
+            endpoints: API endpoints to mirror (e.g. 'dcim/devices')
+            poll_interval: Minimum seconds between changelog polls
+            fields: Optional {endpoint: field names} to mirror only part of each object
+                (must include 'id')
+        """
+        self.client = client
+        self.poll_interval = poll_interval
+        self.endpoints = {model_label(endpoint): endpoint.strip("/") for endpoint in endpoints}
+        self.fields = {endpoint.strip("/"): names for endpoint, names in (fields or {}).items()}
+        self._objects: Dict[str, Dict[int, Dict[str, Any]]] = {}
+        self._generations: Dict[str, int] = {}
+        self._watermark: Optional[int] = None
+        self._started = False
+        self._last_sync = 0.0
+        self._stale = False
+        self._lock = asyncio.Lock()
+        self.hits = 0
+        self.fallbacks = 0
+        self.syncs = 0
+        self.changes_applied = 0
+
+    def mirrors(self, endpoint: str) -> bool:
+        """Return whether an endpoint is mirrored."""
+        return endpoint.strip("/") in self.endpoints.values()
+
+    def mark_stale(self) -> None:
+        """Force a changelog poll before the next read, e.g. after a write through this server."""
+        self._stale = True
+
+    async def query(self, endpoint: str, filters: Optional[Dict[str, Any]] = None, fields: Optional[List[str]] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        Return mirrored objects matching simple equality filters.
+
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/devices')
+            filters: NetBox filters; those in _FILTERS, single or multi-value, are
+                evaluated locally
+            fields: Optional field names to return, with the same dotted-path pruning
+                as the REST client
+
+        Returns:
+            List of object dicts, or None if the endpoint isn't mirrored or the filters
+            need the live API
+        """
+        endpoint = endpoint.strip("/")
+        compiled = _compile_filters(filters)
+        if compiled is None or not self.mirrors(endpoint):
+            self.fallbacks += 1
+            return None
+        objects = await self._load(endpoint)
+        results = []
+        for obj in objects.values():
+            matched = _matches(obj, compiled)
+            if matched is None:
+                self.fallbacks += 1
+                return None
+            if matched:
+                results.append(obj)
+        self.hits += 1
+        return self.client._project(results, self.client._field_tree(fields))
+
+    async def get(self, endpoint: str, id: int, fields: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Return one mirrored object, or None if the endpoint isn't mirrored or has no such ID.
+        """
+        endpoint = endpoint.strip("/")
+        if not self.mirrors(endpoint):
+            self.fallbacks += 1
+            return None
+        obj = (await self._load(endpoint)).get(int(id))
+        if obj is None:
+            self.fallbacks += 1
+            return None
+        self.hits += 1
+        return self.client._project(obj, self.client._field_tree(fields))
+
+    async def snapshot(self, endpoint: str) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Return every mirrored object of an endpoint along with its generation.
+
+        The generation goes up whenever the endpoint's objects change, so callers that
+        derive data from a snapshot (e.g. an IP index) know when to rebuild it.
+        """
+        endpoint = endpoint.strip("/")
+        objects = await self._load(endpoint)
+        return self._generations[endpoint], list(objects.values())
+
+    def stats(self) -> Dict[str, Any]:
+        """Return mirror counters, the changelog watermark and per-endpoint object counts."""
+        return {
+            "endpoints": {endpoint: len(objects) for endpoint, objects in self._objects.items()},
+            "watermark": self._watermark,
+            "last_sync_age": round(time.monotonic() - self._last_sync, 3) if self._started else None,
+            "poll_interval": self.poll_interval,
+            "hits": self.hits,
+            "fallbacks": self.fallbacks,
+            "syncs": self.syncs,
+            "changes_applied": self.changes_applied,
+        }
+
+    async def _load(self, endpoint: str) -> Dict[int, Dict[str, Any]]:
+        """Bring the mirror up to date, dumping the endpoint first if it isn't loaded yet."""
+        async with self._lock:
+            if not self._started:
+                await self._start()
+            elif self._stale or time.monotonic() - self._last_sync >= self.poll_interval:
+                await self._sync()
+            if endpoint not in self._objects:
+                if self.client.cache is not None:
+                    # Cached pages may predate the watermark, and changes in between would never be replayed
+                    self.client.cache.invalidate(endpoint)
+                objects = await self.client.get_all(endpoint, fields=self.fields.get(endpoint))
+                self._objects[endpoint] = {obj["id"]: obj for obj in objects}
+                self._generations[endpoint] = self._generations.get(endpoint, 0) + 1
+            return self._objects[endpoint]
+
+    async def _start(self) -> None:
+        """
+        Record the newest changelog entry as the starting watermark.
+
+        Dumps happen after this, so a change that lands mid-dump is replayed by the next
+        poll rather than lost.
+        """
+        latest = await self.client.get(CHANGELOG_ENDPOINT, params={"limit": 1, "ordering": "-id"})
+        if latest:
+            self._watermark = latest[0]["id"]
+        self._started = True
+        self._last_sync = time.monotonic()
+
+    async def _sync(self) -> None:
+        """Apply every changelog record newer than the watermark to the loaded endpoints."""
+        if self.client.cache is not None:
+            self.client.cache.invalidate(CHANGELOG_ENDPOINT)
+        params = {"ordering": "id"}
+        if self._watermark is not None:
+            params["id__gt"] = self._watermark
+        changes = await self.client.get_all(CHANGELOG_ENDPOINT, params=params)
+
+        refresh: Dict[str, Set[int]] = {}
+        for change in changes:
+            if self._watermark is not None and change["id"] <= self._watermark:
+                continue
+            self._watermark = change["id"]
+
+            endpoint = self.endpoints.get(change["changed_object_type"])
+            if endpoint not in self._objects:
+                continue
+            action = change["action"]
+            action = action.get("value") if isinstance(action, dict) else action
+            object_id = change["changed_object_id"]
+            if action == "delete":
+                self._objects[endpoint].pop(object_id, None)
+                refresh.get(endpoint, set()).discard(object_id)
+            else:
+                refresh.setdefault(endpoint, set()).add(object_id)
+            self._generations[endpoint] += 1
+            self.changes_applied += 1
+
+        for endpoint, ids in refresh.items():
+            await self._refresh(endpoint, sorted(ids))
+        self.syncs += 1
+        self._stale = False
+        self._last_sync = time.monotonic()
+
+    async def _refresh(self, endpoint: str, ids: List[int]) -> None:
+        """Re-read created or updated objects, dropping any that have since been deleted."""
+        if self.client.cache is not None:
+            # Cached pages for this endpoint predate the change being applied
+            self.client.cache.invalidate(endpoint)
+        objects = self._objects[endpoint]
+        for start in range(0, len(ids), _REFRESH_CHUNK):
+            chunk = ids[start:start + _REFRESH_CHUNK]
+            fetched = {
+                obj["id"]: obj
+                for obj in await self.client.get_all(endpoint, params={"id": chunk}, fields=self.fields.get(endpoint))
+            }
+            for object_id in chunk:
+                if object_id in fetched:
+                    objects[object_id] = fetched[object_id]
+                else:
+                    objects.pop(object_id, None)
@@ -1,9 +1,16 @@
 from mcp.server.fastmcp import FastMCP
-from netbox_client import NetBoxRestClient
+from compact_output import compact_list
+from types import MappingProxyType
+import asyncio
+import json
 import os
 
-# Mapping of simple object names to API endpoints
-NETBOX_OBJECT_TYPES = {
+# The NetBox client stack (netbox_client, request_scheduler, requests/urllib3) is
+# imported by _client() on the first tool call rather than here: MCPJungle spawns this
+# server per session, and the MCP handshake doesn't need any of it.
+
+# Mapping of simple object names to API endpoints (read-only)
+NETBOX_OBJECT_TYPES = MappingProxyType({
     # DCIM (Device and Infrastructure)
     "cables": "dcim/cables",
     "console-ports": "dcim/console-ports",
@@ -95,18 +102,54 @@ NETBOX_OBJECT_TYPES = {
     "scripts": "extras/scripts",
     "tags": "extras/tags",
     "webhooks": "extras/webhooks",
-}
-
-mcp = FastMCP("NetBox", log_level="DEBUG")
+})
+
+# Built once: returned for every call with an unknown object_type
+INVALID_OBJECT_TYPE_MESSAGE = "Invalid object_type. Must be one of:\n" + "\n".join(
+    f"- {t}" for t in sorted(NETBOX_OBJECT_TYPES)
+)
+
+# Host/port only apply to the sse and streamable-http transports (NETBOX_MCP_TRANSPORT).
+# They're passed to the constructor because FastMCP derives its DNS-rebinding protection
+# from the host it's created with.
+mcp = FastMCP(
+    "NetBox",
+    log_level="DEBUG",
+    host=os.getenv("NETBOX_MCP_HOST", "127.0.0.1"),
+    port=int(os.getenv("NETBOX_MCP_PORT", "8000")),
+)
+MCP_TRANSPORTS = ("stdio", "sse", "streamable-http")
 netbox = None
+mirror = None
+ip_index = None
+
+def _endpoint(object_type: str) -> str:
+    """Return the API endpoint for an object type, or raise ValueError listing the valid ones."""
+    endpoint = NETBOX_OBJECT_TYPES.get(object_type)
+    if endpoint is None:
+        raise ValueError(INVALID_OBJECT_TYPE_MESSAGE)
+    return endpoint
 
 @mcp.tool()
-def netbox_get_objects(object_type: str, filters: dict):
+async def netbox_get_objects(object_type: str, filters: dict, fields: list[str] | None = None, brief: bool = False, compact: bool = False):
     """
     Get objects from NetBox based on their type and filters
     Args:
         object_type: String representing the NetBox object type (e.g. "devices", "ip-addresses")
         filters: dict of filters to apply to the API call based on the NetBox API filtering options
+        fields: Optional list of fields to return per object, e.g. ["id", "name", "site.name"].
+            Dotted paths select inside nested objects. Use this whenever only a few fields
+            are needed - full device/interface objects are very large.
+        brief: Return NetBox's compact brief representation (id, url, display, name, ...)
+            instead of full objects. Ignored if fields is given.
+        compact: Return the list as a table ({"columns", "rows"}) without url/display
+            fields, with repeated nested objects (sites, device types, tags, ...) stored
+            once under "refs" and referenced as {"$ref": id}. Much smaller for large
+            lists; "size" reports the saving. Combines with fields.
+
+    Returns every matching object, following NetBox's pagination. To fetch a single page
+    instead, pass "limit" and/or "offset" in filters (e.g. {"limit": 50, "offset": 100}).
+    With the local mirror enabled, plain equality filters are answered from the mirror.
 
     Valid object_type values:
 
@@ -193,41 +236,155 @@ def netbox_get_objects(object_type: str, filters: dict):
 
     See NetBox API documentation for filtering options for each object type.
     """
-    # Validate object_type exists in mapping
-    if object_type not in NETBOX_OBJECT_TYPES:
-        valid_types = "\n".join(f"- {t}" for t in sorted(NETBOX_OBJECT_TYPES.keys()))
-        raise ValueError(f"Invalid object_type. Must be one of:\n{valid_types}")
+    # Validate object_type and get its API endpoint
+    endpoint = _endpoint(object_type)
+    netbox = _client()
 
-    # Get API endpoint from mapping
-    endpoint = NETBOX_OBJECT_TYPES[object_type]
+    # Explicit limit/offset means the caller is paging themselves
+    if "limit" in filters or "offset" in filters:
+        objects = await netbox.get(endpoint, params=filters, fields=fields, brief=brief)
+    else:
+        objects = None
+        if mirror is not None and not brief:
+            objects = await mirror.query(endpoint, filters, fields=fields)
+        if objects is None:
+            # Make API call, following every page
+            objects = await netbox.get_all(endpoint, params=filters, fields=fields, brief=brief)
 
-    # Make API call
-    return netbox.get(endpoint, params=filters)
+    return compact_list(objects) if compact else objects
 
 @mcp.tool()
-def netbox_get_object_by_id(object_type: str, object_id: int):
+async def netbox_get_object_by_id(object_type: str, object_id: int, fields: list[str] | None = None):
     """
     Get detailed information about a specific NetBox object by its ID.
 
     Args:
         object_type: String representing the NetBox object type (e.g. "devices", "ip-addresses")
         object_id: The numeric ID of the object
+        fields: Optional list of fields to return, e.g. ["name", "status", "primary_ip4.address"]
 
     Returns:
         Complete object details
     """
-    # Validate object_type exists in mapping
-    if object_type not in NETBOX_OBJECT_TYPES:
-        valid_types = "\n".join(f"- {t}" for t in sorted(NETBOX_OBJECT_TYPES.keys()))
-        raise ValueError(f"Invalid object_type. Must be one of:\n{valid_types}")
+    # Validate object_type and get its API endpoint
+    endpoint = _endpoint(object_type)
+    netbox = _client()
+
+    if mirror is not None:
+        obj = await mirror.get(endpoint, object_id, fields=fields)
+        if obj is not None:
+            return obj
 
-    # Get API endpoint from mapping
-    endpoint = f"{NETBOX_OBJECT_TYPES[object_type]}/{object_id}"
+    return await netbox.get(endpoint, id=object_id, fields=fields)
 
-    return netbox.get(endpoint)
+# IDs fetched per id-filtered list request in netbox_batch_get
+BATCH_ID_CHUNK = 100
 
 @mcp.tool()
-def netbox_get_changelogs(filters: dict):
+async def netbox_batch_get(requests: list[dict], fields: list[str] | None = None):
+    """
+    Run many NetBox reads in one tool call. Use this instead of calling
+    netbox_get_object_by_id or netbox_get_objects repeatedly.
+
+    Args:
+        requests: List of request dicts, each with "object_type" and either "id" (one
+            object) or "filters" (a list query, as for netbox_get_objects). An optional
+            "key" names the request in the result.
+        fields: Optional list of fields to return per object, applied to every request
+
+    Returns:
+        Dict mapping each request's key to its result, or to {"error": "..."} if that
+        request failed. Keys default to "<object_type>/<id>" for ID requests and
+        "<object_type>?<filters as JSON>" for filter requests; a malformed entry is
+        reported under "requests[<index>]".
+
+    Duplicate requests are run once. ID requests for the same object type are merged
+    into id-filtered list requests, and everything runs concurrently.
+
+    Example:
+    netbox_batch_get([
+        {"object_type": "devices", "id": 12},
+        {"object_type": "devices", "id": 14},
+        {"object_type": "interfaces", "filters": {"device_id": 12}},
+        {"object_type": "sites", "id": 3, "key": "site"}
+    ], fields=["id", "name"])
+    """
+    netbox = _client()
+    results = {}
+    ids_by_type = {}
+    keys_by_id = {}
+    filter_requests = {}
+    for index, request in enumerate(requests):
+        if not isinstance(request, dict) or not isinstance(request.get("key", ""), str):
+            results[f"requests[{index}]"] = {
+                "error": "Each request must be a dict with object_type, either id or filters, and an optional string key"
+            }
+            continue
+        object_type = request.get("object_type")
+        if "id" in request:
+            key = request.get("key") or f"{object_type}/{request['id']}"
+        elif isinstance(request.get("filters") or {}, dict):
+            key = request.get("key") or f"{object_type}?{json.dumps(request.get('filters') or {}, sort_keys=True, default=str)}"
+        else:
+            results[request.get("key") or f"requests[{index}]"] = {"error": "filters must be a dict"}
+            continue
+        if object_type not in NETBOX_OBJECT_TYPES:
+            results[key] = {"error": INVALID_OBJECT_TYPE_MESSAGE}
+        elif "id" in request:
+            try:
+                object_id = int(request["id"])
+            except (TypeError, ValueError):
+                results[key] = {"error": f"Invalid id: {request['id']}"}
+                continue
+            ids_by_type.setdefault(object_type, set()).add(object_id)
+            keys_by_id.setdefault((object_type, object_id), []).append(key)
+        else:
+            filters = request.get("filters") or {}
+            signature = (object_type, json.dumps(filters, sort_keys=True))
+            filter_requests.setdefault(signature, (object_type, filters, []))[2].append(key)
+
+    # ID lookups need "id" back to match objects to requests
+    id_fields = fields if not fields or "id" in fields else [*fields, "id"]
+    semaphore = asyncio.Semaphore(netbox.scheduler.pool_maxsize)
+
+    async def fetch_ids(object_type, ids):
+        async with semaphore:
+            try:
+                objects = await netbox_get_objects(object_type, {"id": ids}, fields=id_fields)
+            except Exception as e:
+                for object_id in ids:
+                    for key in keys_by_id[(object_type, object_id)]:
+                        results[key] = {"error": str(e)}
+                return
+        found = {obj["id"]: obj for obj in objects}
+        for object_id in ids:
+            obj = found.get(object_id)
+            if obj is not None and id_fields is not fields:
+                obj = {k: v for k, v in obj.items() if k != "id"}
+            for key in keys_by_id[(object_type, object_id)]:
+                results[key] = obj if obj is not None else {"error": f"{object_type} {object_id} not found"}
+
+    async def fetch_filtered(object_type, filters, keys):
+        async with semaphore:
+            try:
+                result = await netbox_get_objects(object_type, filters, fields=fields)
+            except Exception as e:
+                result = {"error": str(e)}
+        for key in keys:
+            results[key] = result
+
+    tasks = [fetch_filtered(*request) for request in filter_requests.values()]
+    for object_type, ids in ids_by_type.items():
+        ids = sorted(ids)
+        tasks.extend(
+            fetch_ids(object_type, ids[start:start + BATCH_ID_CHUNK])
+            for start in range(0, len(ids), BATCH_ID_CHUNK)
+        )
+    await asyncio.gather(*tasks)
+    return results
+
+@mcp.tool()
+async def netbox_get_changelogs(filters: dict):
     """
     Get object change records (changelogs) from NetBox based on filters.
 
@@ -270,13 +427,179 @@ def netbox_get_changelogs(filters: dict):
     - postchange_data: The object's data after the change (null for deletions)
     - time: The timestamp when the change was made
     """
+    netbox = _client()
     endpoint = "core/object-changes"
 
     # Make API call
-    return netbox.get(endpoint, params=filters)
+    return await netbox.get(endpoint, params=filters)
+
+@mcp.tool()
+async def netbox_tail_changelogs(cursor: int | None = None, filters: dict | None = None, diff: bool = True, limit: int = 100):
+    """
+    Get changelog records newer than a cursor, for polling NetBox for changes.
+
+    Args:
+        cursor: The "cursor" value returned by the previous call. Omit it on the first
+            call to get the latest `limit` changes and a cursor to continue from.
+        filters: Optional changelog filters, as for netbox_get_changelogs
+            (e.g. {"changed_object_type": "dcim.device", "user": "admin"})
+        diff: Return only the keys each change touched, as {"key": {"old": ..., "new": ...}}
+            (nested keys dotted, e.g. "custom_fields.owner"), instead of the full
+            prechange_data and postchange_data snapshots
+        limit: Maximum number of changes per call
+
+    Returns:
+        Dict with:
+        - changes: oldest first; each with id, time, user_name, request_id, action,
+          changed_object_type, changed_object_id, object_repr and either "diff" or
+          "prechange_data"/"postchange_data". For creations the diff holds the
+          object's non-empty fields as "new"; for deletions it is empty.
+        - cursor: pass this to the next call
+        - has_more: True if more changes are waiting; call again right away
+
+    Example:
+    First call, then poll with the returned cursor:
+    netbox_tail_changelogs()
+    netbox_tail_changelogs(cursor=48213, filters={"changed_object_type": "ipam.prefix"})
+    """
+    netbox = _client()
+    params = dict(filters or {})
+    params["limit"] = limit
+    if cursor is None:
+        params["ordering"] = "-id"
+    else:
+        # Changelog IDs only ever increase, so they make an exact cursor where
+        # timestamps can tie
+        params["ordering"] = "id"
+        params["id__gt"] = cursor
+    # A tail must see changes as soon as they land, not after the cache TTL, and
+    # its pages aren't worth caching for anyone else
+    changes = await netbox.get("core/object-changes", params=params, use_cache=False)
+    if cursor is None:
+        changes.reverse()
+
+    return {
+        "changes": [_compact_change(change, diff) for change in changes],
+        "cursor": changes[-1]["id"] if changes else cursor,
+        "has_more": cursor is not None and len(changes) >= limit,
+    }
+
+def _compact_change(change: dict, diff: bool) -> dict:
+    """Reduce a changelog record to its identity plus either a diff or both snapshots."""
+    action = change.get("action")
+    compact = {
+        "id": change["id"],
+        "time": change.get("time"),
+        "user_name": change.get("user_name"),
+        "request_id": change.get("request_id"),
+        "action": action.get("value") if isinstance(action, dict) else action,
+        "changed_object_type": change.get("changed_object_type"),
+        "changed_object_id": change.get("changed_object_id"),
+        "object_repr": change.get("object_repr"),
+    }
+    if diff:
+        compact["diff"] = _diff_snapshots(change.get("prechange_data"), change.get("postchange_data"))
+    else:
+        compact["prechange_data"] = change.get("prechange_data")
+        compact["postchange_data"] = change.get("postchange_data")
+    return compact
+
+def _diff_snapshots(before: dict | None, after: dict | None, prefix: str = "") -> dict:
+    """Return {dotted key: {"old", "new"}} for every key that differs between two snapshots."""
+    if after is None:
+        return {}
+    if before is None:
+        return {
+            f"{prefix}{key}": {"old": None, "new": value}
+            for key, value in after.items() if value not in (None, "", [], {})
+        }
+    changed = {}
+    for key in before.keys() | after.keys():
+        old, new = before.get(key), after.get(key)
+        if old == new:
+            continue
+        if isinstance(old, dict) and isinstance(new, dict):
+            changed.update(_diff_snapshots(old, new, f"{prefix}{key}."))
+        else:
+            changed[f"{prefix}{key}"] = {"old": old, "new": new}
+    return dict(sorted(changed.items()))
+
+@mcp.tool()
+async def netbox_graphql_query(query: str, variables: dict | None = None):
+    """
+    Run a read-only GraphQL query against NetBox's /graphql/ API.
+
+    Use this instead of chained netbox_get_objects calls when following relations:
+    one query can fetch sites, their devices, those devices' interfaces and the IPs
+    on them, returning only the fields named in the query.
+
+    Args:
+        query: GraphQL query document
+        variables: Optional dict of GraphQL variables
+
+    Returns:
+        The query's "data" object
+
+    Example:
+    Interfaces and IPs of every device at site "nyc-dc1":
+    netbox_graphql_query('''
+        query ($site: [String]) {
+          device_list(filters: {site: $site}) {
+            name
+            interfaces { name ip_addresses { address } }
+          }
+        }
+    ''', {"site": ["nyc-dc1"]})
+
+    Filter syntax differs between NetBox releases (4.3 moved to nested lookups such as
+    filters: {site: {slug: {exact: "nyc-dc1"}}}); browse /graphql/ on the NetBox
+    instance for the exact schema.
+    """
+    netbox = _client()
+    return await netbox.graphql(query, variables)
+
+@mcp.tool()
+async def netbox_ip_lookup(query: str, mode: str = "lookup", vrf_id: int | None = None, limit: int = 256):
+    """
+    Answer IP containment questions from a local index of prefixes, IP ranges and IP
+    addresses, instead of listing ipam objects with netbox_get_objects.
+
+    Args:
+        query: An IP address (e.g. "10.20.3.4") or prefix (e.g. "10.20.3.0/24")
+        mode: One of
+            - "lookup": longest-prefix match plus every prefix containing the query,
+              and for an address the IP ranges and IP address records covering it
+            - "children": prefixes, IP ranges and IP addresses inside a prefix
+            - "free": unallocated space inside a prefix - free IP count, the first
+              free IPs, free IP ranges and unallocated child prefixes
+        vrf_id: ID of the VRF to search; omit for the global table
+        limit: Maximum entries returned per list
+
+    Returns:
+        Dict of results for the chosen mode; objects are reduced to id, prefix/address,
+        status, VRF, DNS name and description
+
+    Example:
+    Which prefix contains 10.20.3.4:
+    netbox_ip_lookup("10.20.3.4")
+
+    What IPs are free in 10.20.3.0/24:
+    netbox_ip_lookup("10.20.3.0/24", mode="free", limit=20)
+    """
+    modes = {"lookup", "children", "free"}
+    if mode not in modes:
+        raise ValueError(f"Invalid mode. Must be one of: {', '.join(sorted(modes))}")
+
+    _client()
+    index = await ip_index.get()
+    if mode == "lookup":
+        return index.lookup(query, vrf_id=vrf_id)
+    if mode == "children":
+        return index.children(query, vrf_id=vrf_id, limit=limit)
+    return index.free(query, vrf_id=vrf_id, limit=limit)
 
 @mcp.tool()
-def netbox_create_object(object_type: str, data: dict):
+async def netbox_create_object(object_type: str, data: dict):
     """
     Create a new object in NetBox.
 
@@ -304,19 +627,17 @@ def netbox_create_object(object_type: str, data: dict):
         "status": "active"
     })
     """
-    # Validate object_type exists in mapping
-    if object_type not in NETBOX_OBJECT_TYPES:
-        valid_types = "\n".join(f"- {t}" for t in sorted(NETBOX_OBJECT_TYPES.keys()))
-        raise ValueError(f"Invalid object_type. Must be one of:\n{valid_types}")
-
-    # Get API endpoint from mapping
-    endpoint = NETBOX_OBJECT_TYPES[object_type]
+    # Validate object_type and get its API endpoint
+    endpoint = _endpoint(object_type)
+    netbox = _client()
 
     # Make API call
-    return netbox.create(endpoint, data)
+    result = await netbox.create(endpoint, data)
+    _mark_stale()
+    return result
 
 @mcp.tool()
-def netbox_update_object(object_type: str, object_id: int, data: dict):
+async def netbox_update_object(object_type: str, object_id: int, data: dict):
     """
     Update an existing object in NetBox.
 
@@ -335,19 +656,17 @@ def netbox_update_object(object_type: str, object_id: int, data: dict):
     To change a device's status:
     netbox_update_object("devices", 5, {"status": "offline"})
     """
-    # Validate object_type exists in mapping
-    if object_type not in NETBOX_OBJECT_TYPES:
-        valid_types = "\n".join(f"- {t}" for t in sorted(NETBOX_OBJECT_TYPES.keys()))
-        raise ValueError(f"Invalid object_type. Must be one of:\n{valid_types}")
-
-    # Get API endpoint from mapping
-    endpoint = NETBOX_OBJECT_TYPES[object_type]
+    # Validate object_type and get its API endpoint
+    endpoint = _endpoint(object_type)
+    netbox = _client()
 
     # Make API call
-    return netbox.update(endpoint, object_id, data)
+    result = await netbox.update(endpoint, object_id, data)
+    _mark_stale()
+    return result
 
 @mcp.tool()
-def netbox_delete_object(object_type: str, object_id: int):
+async def netbox_delete_object(object_type: str, object_id: int):
     """
     Delete an object from NetBox.
 
@@ -367,16 +686,13 @@ def netbox_delete_object(object_type: str, object_id: int):
     To delete an IP address:
     netbox_delete_object("ip-addresses", 123)
     """
-    # Validate object_type exists in mapping
-    if object_type not in NETBOX_OBJECT_TYPES:
-        valid_types = "\n".join(f"- {t}" for t in sorted(NETBOX_OBJECT_TYPES.keys()))
-        raise ValueError(f"Invalid object_type. Must be one of:\n{valid_types}")
-
-    # Get API endpoint from mapping
-    endpoint = NETBOX_OBJECT_TYPES[object_type]
+    # Validate object_type and get its API endpoint
+    endpoint = _endpoint(object_type)
+    netbox = _client()
 
     # Make API call - this will raise an exception if it fails
-    success = netbox.delete(endpoint, object_id)
+    success = await netbox.delete(endpoint, object_id)
+    _mark_stale()
 
     if success:
         return {"success": True, "message": f"Successfully deleted {object_type} with ID {object_id}"}
@@ -384,16 +700,20 @@ def netbox_delete_object(object_type: str, object_id: int):
         return {"success": False, "message": f"Failed to delete {object_type} with ID {object_id}"}
 
 @mcp.tool()
-def netbox_bulk_create_objects(object_type: str, data: list):
+async def netbox_bulk_create_objects(object_type: str, data: list, chunk_size: int | None = None):
     """
-    Create multiple objects in NetBox in a single request.
+    Create multiple objects in NetBox, in as many chunked requests as needed.
 
     Args:
         object_type: String representing the NetBox object type (e.g. "devices", "ip-addresses")
         data: List of dicts containing the object data to create
+        chunk_size: Optional number of items sent per request. Large lists are split into
+            chunks that are sent concurrently and committed independently, so a failing
+            chunk doesn't undo the others.
 
     Returns:
-        List of created objects
+        Dict with success, succeeded_count, failed_count, chunks, retries, the
+        created objects ("succeeded") and one {"item", "error"} entry per item that failed ("failed")
 
     Example:
     To create multiple sites:
@@ -402,28 +722,30 @@ def netbox_bulk_create_objects(object_type: str, data: list):
         {"name": "Site B", "slug": "site-b", "status": "active"}
     ])
     """
-    # Validate object_type exists in mapping
-    if object_type not in NETBOX_OBJECT_TYPES:
-        valid_types = "\n".join(f"- {t}" for t in sorted(NETBOX_OBJECT_TYPES.keys()))
-        raise ValueError(f"Invalid object_type. Must be one of:\n{valid_types}")
-
-    # Get API endpoint from mapping
-    endpoint = NETBOX_OBJECT_TYPES[object_type]
+    # Validate object_type and get its API endpoint
+    endpoint = _endpoint(object_type)
+    netbox = _client()
 
     # Make API call
-    return netbox.bulk_create(endpoint, data)
+    result = await netbox.bulk_write("create", endpoint, data, chunk_size=chunk_size)
+    _mark_stale()
+    return result.to_dict()
 
 @mcp.tool()
-def netbox_bulk_update_objects(object_type: str, data: list):
+async def netbox_bulk_update_objects(object_type: str, data: list, chunk_size: int | None = None):
     """
-    Update multiple objects in NetBox in a single request.
+    Update multiple objects in NetBox, in as many chunked requests as needed.
 
     Args:
         object_type: String representing the NetBox object type (e.g. "devices", "ip-addresses")
         data: List of dicts containing the object data to update (must include "id" field)
+        chunk_size: Optional number of items sent per request. Large lists are split into
+            chunks that are sent concurrently and committed independently, so a failing
+            chunk doesn't undo the others.
 
     Returns:
-        List of updated objects
+        Dict with success, succeeded_count, failed_count, chunks, retries, the
+        updated objects ("succeeded") and one {"item", "error"} entry per item that failed ("failed")
 
     Example:
     To update multiple devices:
@@ -432,28 +754,30 @@ def netbox_bulk_update_objects(object_type: str, data: list):
         {"id": 2, "status": "maintenance"}
     ])
     """
-    # Validate object_type exists in mapping
-    if object_type not in NETBOX_OBJECT_TYPES:
-        valid_types = "\n".join(f"- {t}" for t in sorted(NETBOX_OBJECT_TYPES.keys()))
-        raise ValueError(f"Invalid object_type. Must be one of:\n{valid_types}")
-
-    # Get API endpoint from mapping
-    endpoint = NETBOX_OBJECT_TYPES[object_type]
+    # Validate object_type and get its API endpoint
+    endpoint = _endpoint(object_type)
+    netbox = _client()
 
     # Make API call
-    return netbox.bulk_update(endpoint, data)
+    result = await netbox.bulk_write("update", endpoint, data, chunk_size=chunk_size)
+    _mark_stale()
+    return result.to_dict()
 
 @mcp.tool()
-def netbox_bulk_delete_objects(object_type: str, object_ids: list):
+async def netbox_bulk_delete_objects(object_type: str, object_ids: list, chunk_size: int | None = None):
     """
-    Delete multiple objects from NetBox in a single request.
+    Delete multiple objects from NetBox, in as many chunked requests as needed.
 
     Args:
         object_type: String representing the NetBox object type (e.g. "devices", "ip-addresses")
         object_ids: List of numeric IDs to delete
+        chunk_size: Optional number of items sent per request. Large lists are split into
+            chunks that are sent concurrently and committed independently, so a failing
+            chunk doesn't undo the others.
 
     Returns:
-        Success status
+        Dict with success, succeeded_count, failed_count, chunks, retries, the
+        deleted IDs ("succeeded") and one {"item", "error"} entry per item that failed ("failed")
 
     WARNING: This permanently deletes the objects and cannot be undone!
 
@@ -461,31 +785,157 @@ def netbox_bulk_delete_objects(object_type: str, object_ids: list):
     To delete multiple devices:
     netbox_bulk_delete_objects("devices", [5, 6, 7])
     """
-    # Validate object_type exists in mapping
-    if object_type not in NETBOX_OBJECT_TYPES:
-        valid_types = "\n".join(f"- {t}" for t in sorted(NETBOX_OBJECT_TYPES.keys()))
-        raise ValueError(f"Invalid object_type. Must be one of:\n{valid_types}")
-
-    # Get API endpoint from mapping
-    endpoint = NETBOX_OBJECT_TYPES[object_type]
+    # Validate object_type and get its API endpoint
+    endpoint = _endpoint(object_type)
+    netbox = _client()
 
     # Make API call
-    success = netbox.bulk_delete(endpoint, object_ids)
+    result = await netbox.bulk_write("delete", endpoint, object_ids, chunk_size=chunk_size)
+    _mark_stale()
+    return result.to_dict()
 
-    if success:
-        return {"success": True, "message": f"Successfully deleted {len(object_ids)} {object_type} objects"}
-    else:
-        return {"success": False, "message": f"Failed to delete {object_type} objects"}
+@mcp.tool()
+async def netbox_get_cache_stats():
+    """
+    Get response cache counters for this NetBox MCP server.
 
-if __name__ == "__main__":
-    # Load NetBox configuration from environment variables
-    netbox_url = os.getenv("NETBOX_URL")
-    netbox_token = os.getenv("NETBOX_TOKEN")
+    Returns:
+        Dict with entries, bytes, hits, misses, hit_ratio, evictions, expirations,
+        invalidations and revalidations (304 Not Modified answers to ETag checks), or
+        {"enabled": False} if caching is turned off
+    """
+    netbox = _client()
+    if netbox.cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **netbox.cache.stats()}
 
-    if not netbox_url or not netbox_token:
-        raise ValueError("NETBOX_URL and NETBOX_TOKEN environment variables must be set")
+@mcp.tool()
+async def netbox_get_connection_stats():
+    """
+    Get HTTP connection counters for this NetBox MCP server's client.
+
+    Returns:
+        Dict with retries, coalesced (GETs that joined an identical in-flight request),
+        throttled_seconds, pool_maxsize, new_connections, reused_connections,
+        reuse_ratio (keep-alive effectiveness), tls_handshakes, tls_handshake_seconds
+        and tls_handshake_avg_ms
+    """
+    netbox = _client()
+    return netbox.scheduler.stats()
+
+@mcp.tool()
+async def netbox_get_mirror_stats():
+    """
+    Get local mirror counters for this NetBox MCP server.
+
+    Returns:
+        Dict with endpoints (objects held per mirrored endpoint), watermark (ID of the
+        newest changelog record applied), last_sync_age, poll_interval, hits, fallbacks
+        (reads sent to the live API), syncs and changes_applied, or {"enabled": False}
+        if the mirror is turned off
+    """
+    _client()
+    if mirror is None:
+        return {"enabled": False}
+    return {"enabled": True, **mirror.stats()}
+
+def _mark_stale():
+    """Make the mirror and IP index catch up before their next read, so writes are seen."""
+    if mirror is not None:
+        mirror.mark_stale()
+    if ip_index is not None:
+        ip_index.mark_stale()
+
+def _parse_ttls(value: str) -> dict:
+    """Parse "endpoint=seconds,endpoint=seconds" into a per-endpoint TTL dict."""
+    ttls = {}
+    for item in filter(None, (part.strip() for part in value.split(","))):
+        endpoint, _, seconds = item.partition("=")
+        ttls[endpoint.strip()] = float(seconds)
+    return ttls
+
+def _client():
+    """
+    Return the NetBox client, building it (with the cache, mirror and IP index) from
+    environment variables on first use.
+    """
+    global netbox, mirror, ip_index
+    if netbox is not None:
+        return netbox
+
+    from netbox_cache import ResponseCache
+    from netbox_client import AsyncNetBoxRestClient
+    from netbox_ipindex import IPIndexCache
+    from netbox_mirror import NetBoxMirror
+    from request_scheduler import HostRateLimiter, RequestScheduler, RetryPolicy
+
+    netbox_page_size = int(os.getenv("NETBOX_PAGE_SIZE", "1000"))
+    netbox_max_workers = int(os.getenv("NETBOX_MAX_WORKERS", "4"))
+
+    # Response cache for read tools; NETBOX_CACHE_TTL=0 turns it off
+    cache_ttl = float(os.getenv("NETBOX_CACHE_TTL", "30"))
+    cache = None
+    if cache_ttl > 0:
+        cache = ResponseCache(
+            max_entries=int(os.getenv("NETBOX_CACHE_MAX_ENTRIES", "1024")),
+            max_bytes=int(os.getenv("NETBOX_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+            default_ttl=cache_ttl,
+            ttls=_parse_ttls(os.getenv("NETBOX_CACHE_TTLS", "core/object-changes=5")),
+        )
+
+    scheduler = RequestScheduler(
+        retry_policy=RetryPolicy(max_retries=int(os.getenv("NETBOX_MAX_RETRIES", "3"))),
+        rate_limiter=HostRateLimiter(rate=float(os.getenv("NETBOX_RATE_LIMIT", "0"))),
+        connect_timeout=float(os.getenv("NETBOX_CONNECT_TIMEOUT", "5")),
+        read_timeout=float(os.getenv("NETBOX_READ_TIMEOUT", "60")),
+        pool_connections=int(os.getenv("NETBOX_POOL_CONNECTIONS", "10")),
+        pool_maxsize=int(os.getenv("NETBOX_POOL_MAXSIZE", "10")),
+        pool_block=os.getenv("NETBOX_POOL_BLOCK", "false").lower() == "true",
+    )
 
     # Initialize NetBox client
-    netbox = NetBoxRestClient(url=netbox_url, token=netbox_token)
+    client = AsyncNetBoxRestClient(
+        url=os.environ["NETBOX_URL"],
+        token=os.environ["NETBOX_TOKEN"],
+        page_size=netbox_page_size,
+        max_workers=netbox_max_workers,
+        cache=cache,
+        bulk_chunk_size=int(os.getenv("NETBOX_BULK_CHUNK_SIZE", "100")),
+        bulk_retries=int(os.getenv("NETBOX_BULK_RETRIES", "2")),
+        scheduler=scheduler,
+    )
+
+    # Optional local mirror of NetBox objects, kept current from the changelog
+    local_mirror = None
+    if os.getenv("NETBOX_MIRROR", "false").lower() == "true":
+        mirror_types = os.getenv("NETBOX_MIRROR_TYPES", "")
+        mirror_types = [t.strip() for t in mirror_types.split(",") if t.strip()] or list(NETBOX_OBJECT_TYPES)
+        unknown = [t for t in mirror_types if t not in NETBOX_OBJECT_TYPES]
+        if unknown:
+            raise ValueError(f"Unknown NETBOX_MIRROR_TYPES: {', '.join(unknown)}")
+        local_mirror = NetBoxMirror(
+            client,
+            [NETBOX_OBJECT_TYPES[t] for t in mirror_types],
+            poll_interval=float(os.getenv("NETBOX_MIRROR_POLL_INTERVAL", "10")),
+        )
+
+    # IP containment index; built from the mirror when it holds the ipam types
+    ip_index = IPIndexCache(client, mirror=local_mirror, ttl=float(os.getenv("NETBOX_IP_INDEX_TTL", "60")))
+    mirror = local_mirror
+    netbox = client
+    return netbox
+
+if __name__ == "__main__":
+    # Fail fast on missing configuration; the client itself is built on first use
+    if not os.getenv("NETBOX_URL") or not os.getenv("NETBOX_TOKEN"):
+        raise ValueError("NETBOX_URL and NETBOX_TOKEN environment variables must be set")
+
+    transport = os.getenv("NETBOX_MCP_TRANSPORT", "stdio")
+    if transport not in MCP_TRANSPORTS:
+        raise ValueError(f"NETBOX_MCP_TRANSPORT must be one of: {', '.join(MCP_TRANSPORTS)}")
+    if transport != "stdio":
+        # One long-lived process serves every session, sharing the connection pool,
+        # cache and mirror; build the client up front
+        _client()
 
-    mcp.run(transport="stdio")
+    mcp.run(transport=transport)
@@ -0,0 +1,556 @@
+#!/usr/bin/env python3
+"""
+Request Scheduler
+
+Shared request-execution layer for the REST clients in the MCPJungle image
+(netbox-mcp-rw's netbox_client.py and scanopy-mcp-rw's scanopy_client.py). Every HTTP
+request a client makes goes through RequestScheduler.send() (requests) or
+send_async() (httpx), which adds:
+
+  - explicit connect/read timeouts, so a stalled connection fails instead of hanging
+  - retries with exponential backoff and full jitter, honouring Retry-After
+  - idempotency-aware retry rules: any method is retried when the request certainly
+    wasn't processed (429, or the connection was never established), but only
+    idempotent methods are retried on 5xx or on errors once the request was sent
+  - a token-bucket rate limiter per host, shared by every thread/task using the client
+  - configurable connection pool sizes, with counters for new vs. reused (keep-alive)
+    connections and time spent in TLS handshakes
+  - single-flight coalescing (coalesce() / coalesce_async()): identical GETs issued
+    while one is already in flight wait for that request instead of sending their own
+
+This file is duplicated verbatim in ../netbox-mcp-rw/ and ../scanopy-mcp-rw/. Each is
+its own uv project, copied into the image separately (see ../Dockerfile), so there's no
+shared package to import it from. Keep both copies identical.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import NewConnectionError
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds from now."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """
+    Decides whether a failed request may be resent, and how long to wait first.
+    """
+
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        retry_statuses: Iterable[int] = (500, 502, 503, 504),
+        max_retry_after: float = 120.0,
+    ):
+        """
+        Args:
+            max_retries: Resends allowed per request
+            backoff_base: Backoff before the first resend, doubled for each one after
+            backoff_max: Cap on the computed backoff (not on Retry-After)
+            retry_statuses: Server-side statuses worth retrying for idempotent methods
+                (429 is always retried, for any method)
+            max_retry_after: Give up instead of waiting if Retry-After asks for longer
+        """
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = frozenset(retry_statuses)
+        self.max_retry_after = max_retry_after
+
+    def should_retry(
+        self,
+        method: str,
+        attempt: int,
+        status: Optional[int] = None,
+        connect_failed: bool = False,
+        idempotent: Optional[bool] = None,
+        max_retries: Optional[int] = None,
+    ) -> bool:
+        """
+        Args:
+            method: HTTP method of the request
+            attempt: Number of resends already made
+            status: Response status, or None if the request failed in transport
+            connect_failed: True if the transport error happened before the request
+                was sent (connection refused, DNS failure, connect timeout)
+            idempotent: Override whether the request is safe to replay; defaults to
+                the method's HTTP semantics
+            max_retries: Override self.max_retries for this request
+        """
+        if attempt >= (self.max_retries if max_retries is None else max_retries):
+            return False
+        if status == 429 or (status is None and connect_failed):
+            return True
+        if status is not None and status not in self.retry_statuses:
+            return False
+        return method.upper() in self.IDEMPOTENT_METHODS if idempotent is None else idempotent
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Seconds to wait before resend number attempt + 1 (full jitter)."""
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket. reserve() always takes a token, going into debt if
+    needed, and returns how long the caller must wait for it, so waiters queue fairly.
+    """
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class HostRateLimiter:
+    """One TokenBucket per host. A rate of 0 or less disables limiting."""
+
+    def __init__(self, rate: float = 0.0, burst: Optional[float] = None):
+        """
+        Args:
+            rate: Sustained requests per second allowed per host
+            burst: Requests allowed back-to-back before the rate applies (defaults to rate)
+        """
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, url: str) -> float:
+        """Take a token for the URL's host and return the seconds to wait for it."""
+        if self.rate <= 0:
+            return 0.0
+        host = urlsplit(url).netloc
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.rate, self.burst)
+        return bucket.reserve()
+
+
+class ConnectionStats:
+    """
+    Thread-safe counters showing whether HTTP keep-alive is doing its job.
+
+    A healthy long-running client reuses almost every connection; a high
+    new_connections count under load means the pool is too small or the server is
+    closing idle connections.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.new_connections = 0
+        self.reused_connections = 0
+        self.tls_handshakes = 0
+        self.tls_handshake_seconds = 0.0
+
+    def record_connection(self, reused: bool) -> None:
+        with self._lock:
+            if reused:
+                self.reused_connections += 1
+            else:
+                self.new_connections += 1
+
+    def record_tls_handshake(self, seconds: float) -> None:
+        with self._lock:
+            self.tls_handshakes += 1
+            self.tls_handshake_seconds += seconds
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.new_connections + self.reused_connections
+            return {
+                "new_connections": self.new_connections,
+                "reused_connections": self.reused_connections,
+                "reuse_ratio": self.reused_connections / total if total else 0.0,
+                "tls_handshakes": self.tls_handshakes,
+                "tls_handshake_seconds": round(self.tls_handshake_seconds, 3),
+                "tls_handshake_avg_ms": round(1000 * self.tls_handshake_seconds / self.tls_handshakes, 1) if self.tls_handshakes else 0.0,
+            }
+
+
+def _instrumented_pool_classes(stats: ConnectionStats) -> Dict[str, type]:
+    """Build urllib3 pool classes that report connection reuse and TLS time to stats."""
+
+    class _HTTPSConnection(HTTPSConnection):
+        def _new_conn(self):
+            started = time.perf_counter()
+            sock = super()._new_conn()
+            self._tcp_seconds = time.perf_counter() - started
+            return sock
+
+        def connect(self):
+            # connect() is TCP connect (_new_conn) followed by the TLS handshake
+            self._tcp_seconds = 0.0
+            started = time.perf_counter()
+            super().connect()
+            stats.record_tls_handshake(time.perf_counter() - started - self._tcp_seconds)
+
+    class _CountingPoolMixin:
+        def _get_conn(self, timeout=None):
+            conn = super()._get_conn(timeout)
+            # A pooled connection still holding its socket is a keep-alive reuse
+            stats.record_connection(reused=conn.sock is not None)
+            return conn
+
+    class _HTTPConnectionPool(_CountingPoolMixin, HTTPConnectionPool):
+        pass
+
+    class _HTTPSConnectionPool(_CountingPoolMixin, HTTPSConnectionPool):
+        ConnectionCls = _HTTPSConnection
+
+    return {"http": _HTTPConnectionPool, "https": _HTTPSConnectionPool}
+
+
+class _InstrumentedAdapter(HTTPAdapter):
+    """requests adapter whose pools feed a ConnectionStats."""
+
+    def __init__(self, stats: ConnectionStats, **kwargs: Any):
+        self._stats = stats  # read by init_poolmanager(), called from HTTPAdapter.__init__
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = _instrumented_pool_classes(self._stats)
+
+
+class _HttpxTrace:
+    """Per-request httpx "trace" extension callback feeding a ConnectionStats."""
+
+    def __init__(self, stats: ConnectionStats):
+        self.stats = stats
+        self.connected = False
+        self.tls_started: Optional[float] = None
+
+    async def __call__(self, event_name: str, info: Dict[str, Any]) -> None:
+        if event_name == "connection.connect_tcp.started":
+            self.connected = True
+        elif event_name == "connection.start_tls.started":
+            self.tls_started = time.perf_counter()
+        elif event_name == "connection.start_tls.complete" and self.tls_started is not None:
+            self.stats.record_tls_handshake(time.perf_counter() - self.tls_started)
+
+    def finish(self) -> None:
+        """Record the request's connection as new or reused once it's done."""
+        self.stats.record_connection(reused=not self.connected)
+
+
+def request_key(method: str, url: str, params: Optional[Dict[str, Any]] = None) -> Tuple[Any, ...]:
+    """Build a hashable key identifying a request by method, URL and query parameters."""
+    normalized = tuple(sorted(
+        (str(k), tuple(map(str, v)) if isinstance(v, (list, tuple, set)) else str(v))
+        for k, v in (params or {}).items()
+    ))
+    return method.upper(), url, normalized
+
+
+class _Flight:
+    """One in-flight call that other threads can wait on."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Runs at most one call per key at a time; concurrent callers with the same key
+    wait for it and share its result (or exception).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, _Flight] = {}
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Return fn()'s result, joining an identical call already in flight if there is one."""
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                self.shared += 1
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+        try:
+            flight.result = fn()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+
+class AsyncSingleFlight:
+    """
+    asyncio counterpart of SingleFlight. The call runs as its own task, so a caller
+    being cancelled doesn't cancel it for the others waiting on it.
+    """
+
+    def __init__(self):
+        self._flights: Dict[Hashable, "asyncio.Task[Any]"] = {}
+        self.shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Return await fn(), joining an identical call already in flight if there is one."""
+        task = self._flights.get(key)
+        if task is None:
+            task = self._flights[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: "asyncio.Task[Any]") -> None:
+        if self._flights.get(key) is task:
+            del self._flights[key]
+        if not task.cancelled():
+            task.exception()  # mark retrieved even if every waiter was cancelled
+
+
+class RequestScheduler:
+    """
+    Sends requests with timeouts, rate limiting and retries.
+
+    Example:
+        scheduler = RequestScheduler(RetryPolicy(max_retries=3), HostRateLimiter(rate=20))
+        response = scheduler.send(session, "GET", url, params={"limit": 50})
+        response = await scheduler.send_async(async_client, "GET", url)
+    """
+
+    def __init__(
+        self,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[HostRateLimiter] = None,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 60.0,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+    ):
+        """
+        Args:
+            retry_policy: When and how long to back off; defaults to RetryPolicy()
+            rate_limiter: Per-host limiter; defaults to no limit
+            connect_timeout: Seconds to wait for a connection to be established
+            read_timeout: Seconds to wait between bytes of the response
+            pool_connections: Number of per-host pools a requests session keeps
+            pool_maxsize: Keep-alive connections kept per host; size this to at least
+                the number of concurrent requests, or extra connections are opened and
+                thrown away
+            pool_block: Wait for a free pooled connection instead of opening a
+                throwaway one when the pool is exhausted (httpx always waits)
+        """
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = rate_limiter or HostRateLimiter()
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.connection_stats = ConnectionStats()
+        self._flights = SingleFlight()
+        self._async_flights = AsyncSingleFlight()
+        # Guards the counters below; send() runs on many worker threads at once
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.throttled_seconds = 0.0
+
+    def mount(self, session: requests.Session) -> None:
+        """Replace a session's adapters with pooled, instrumented ones."""
+        for prefix in ("http://", "https://"):
+            session.mount(prefix, _InstrumentedAdapter(
+                self.connection_stats,
+                pool_connections=self.pool_connections,
+                pool_maxsize=self.pool_maxsize,
+                pool_block=self.pool_block,
+            ))
+
+    def httpx_limits(self) -> Any:
+        """Return httpx.Limits matching this scheduler's pool settings."""
+        import httpx
+
+        return httpx.Limits(max_connections=self.pool_maxsize, max_keepalive_connections=self.pool_maxsize)
+
+    def _reserve(self, url: str) -> float:
+        delay = self.rate_limiter.reserve(url)
+        with self._lock:
+            self.throttled_seconds += delay
+        return delay
+
+    def _count_retry(self) -> None:
+        with self._lock:
+            self.retries += 1
+
+    @staticmethod
+    def _connect_failed(exc: requests.RequestException) -> bool:
+        """True if a requests transport error happened before anything was sent."""
+        if isinstance(exc, requests.exceptions.ConnectTimeout):
+            return True
+        reason = getattr(exc.args[0], "reason", None) if exc.args else None
+        return isinstance(exc, requests.ConnectionError) and isinstance(reason, NewConnectionError)
+
+    def send(
+        self,
+        session: requests.Session,
+        method: str,
+        url: str,
+        idempotent: Optional[bool] = None,
+        retries: Optional[int] = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """
+        Send a request on a requests.Session, retrying per the retry policy.
+
+        Args:
+            session: Session to send on
+            method: HTTP method
+            url: Full request URL
+            idempotent: Override whether the request is safe to replay
+            retries: Override the policy's max_retries for this request
+            **kwargs: Passed through to session.request()
+
+        Returns:
+            The final response, whatever its status; callers still raise_for_status()
+
+        Raises:
+            requests.RequestException: If the last attempt failed in transport
+        """
+        policy = self.retry_policy
+        attempt = 0
+        while True:
+            time.sleep(self._reserve(url))
+            try:
+                response = session.request(method, url, timeout=(self.connect_timeout, self.read_timeout), **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if not policy.should_retry(method, attempt, None, self._connect_failed(e), idempotent, retries):
+                    raise
+                delay = policy.backoff(attempt)
+            else:
+                if not policy.should_retry(method, attempt, response.status_code, False, idempotent, retries):
+                    return response
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                if retry_after is not None and retry_after > policy.max_retry_after:
+                    return response
+                delay = policy.backoff(attempt, retry_after)
+                response.close()
+            attempt += 1
+            self._count_retry()
+            time.sleep(delay)
+
+    async def send_async(
+        self,
+        client: Any,
+        method: str,
+        url: str,
+        idempotent: Optional[bool] = None,
+        retries: Optional[int] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Send a request on an httpx.AsyncClient, retrying per the retry policy.
+
+        Same arguments and behaviour as send(); raises httpx.TransportError if the last
+        attempt failed in transport.
+        """
+        import httpx  # only the async NetBox client needs httpx
+
+        policy = self.retry_policy
+        timeout = httpx.Timeout(self.read_timeout, connect=self.connect_timeout)
+        attempt = 0
+        while True:
+            await asyncio.sleep(self._reserve(url))
+            trace = _HttpxTrace(self.connection_stats)
+            try:
+                response = await client.request(method, url, timeout=timeout, extensions={"trace": trace}, **kwargs)
+            except httpx.TransportError as e:
+                connect_failed = isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout))
+                if not policy.should_retry(method, attempt, None, connect_failed, idempotent, retries):
+                    raise
+                delay = policy.backoff(attempt)
+            else:
+                trace.finish()
+                if not policy.should_retry(method, attempt, response.status_code, False, idempotent, retries):
+                    return response
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                if retry_after is not None and retry_after > policy.max_retry_after:
+                    return response
+                delay = policy.backoff(attempt, retry_after)
+                await response.aclose()
+            attempt += 1
+            self._count_retry()
+            await asyncio.sleep(delay)
+
+    def coalesce(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        """
+        Run fetch() unless an identical request (see request_key()) is already in
+        flight, in which case wait for it and return its result.
+
+        Only coalesce reads, and return something callers won't mutate (e.g. the raw
+        body) since every waiter gets the same object.
+        """
+        return self._flights.do(key, fetch)
+
+    async def coalesce_async(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Coroutine version of coalesce(); fetch is a zero-argument coroutine function."""
+        return await self._async_flights.do(key, fetch)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return retry, rate-limit, coalescing and connection reuse counters."""
+        with self._lock:
+            retries, throttled_seconds = self.retries, self.throttled_seconds
+        return {
+            "retries": retries,
+            "coalesced": self._flights.shared + self._async_flights.shared,
+            "throttled_seconds": round(throttled_seconds, 3),
+            "pool_maxsize": self.pool_maxsize,
+            **self.connection_stats.snapshot(),
+        }
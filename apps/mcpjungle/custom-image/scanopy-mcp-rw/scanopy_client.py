@@ -22,9 +22,15 @@ convention below is copied from NetBox/DRF, not confirmed against Scanopy's own
 also unverified — expect the bulk_* methods to need adjustment once actually exercised.
 """
 
-from typing import Any, Dict, List, Optional, Union
+import json
+from typing import Any, Dict, Iterator, List, Optional, Union
 import requests
 
+from request_scheduler import RequestScheduler, request_key
+
+# Scanopy's largest accepted limit; its default page is 50
+MAX_PAGE_SIZE = 1000
+
 
 class ScanopyRestClient:
     """
@@ -33,11 +39,19 @@ class ScanopyRestClient:
     Example:
         client = ScanopyRestClient(url="https://scanopy.xrs444.net", token="scp_u_...")
         hosts = client.get("hosts", params={"limit": 10})
+        all_hosts = client.get_all("hosts")
         host = client.get("hosts", id="70680c92-9087-4427-a0b4-e1afd096891c")
         new_tag = client.create("tags", {"name": "verified"})
     """
 
-    def __init__(self, url: str, token: str, verify_ssl: bool = True):
+    def __init__(
+        self,
+        url: str,
+        token: str,
+        verify_ssl: bool = True,
+        scheduler: Optional[RequestScheduler] = None,
+        page_size: int = MAX_PAGE_SIZE,
+    ):
         """
         Args:
             url: Base URL of the Scanopy instance (e.g. "https://scanopy.xrs444.net")
@@ -45,11 +59,17 @@ class ScanopyRestClient:
             verify_ssl: Whether to verify TLS certificates (Scanopy runs a real Let's
                 Encrypt cert here, unlike some other self-hosted apps in this infra that
                 need this set to False for self-signed certs — leave True)
+            scheduler: Timeouts, retries and per-host rate limiting for every request
+                (see request_scheduler.py); defaults to RequestScheduler()
+            page_size: Default number of objects per page for iter_objects/get_all
+                (capped at MAX_PAGE_SIZE, Scanopy's own limit)
         """
         self.base_url = url.rstrip("/")
         self.api_url = f"{self.base_url}/api/v1"
         self.token = token
         self.verify_ssl = verify_ssl
+        self.scheduler = scheduler or RequestScheduler()
+        self.page_size = min(max(1, page_size), MAX_PAGE_SIZE)
         self.session = requests.Session()
         self.session.headers.update(
             {
@@ -58,6 +78,7 @@ class ScanopyRestClient:
                 "Accept": "application/json",
             }
         )
+        self.scheduler.mount(self.session)
 
     def _build_url(self, endpoint: str, id: Optional[str] = None) -> str:
         """Build the full URL for an API request."""
@@ -66,6 +87,10 @@ class ScanopyRestClient:
             return f"{self.api_url}/{endpoint}/{id}"
         return f"{self.api_url}/{endpoint}"
 
+    def _request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request through the scheduler (timeouts, retries, rate limit)."""
+        return self.scheduler.send(self.session, method, url, verify=self.verify_ssl, **kwargs)
+
     @staticmethod
     def _unwrap(payload: Any) -> Any:
         """
@@ -83,30 +108,92 @@ class ScanopyRestClient:
         id: Optional[str] = None,
         params: Optional[Dict[str, Any]] = None,
     ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
-        """Retrieve one or more objects from Scanopy via the REST API."""
+        """Retrieve one or more objects from Scanopy via the REST API. Concurrent identical calls share one request."""
         url = self._build_url(endpoint, id)
-        response = self.session.get(url, params=params, verify=self.verify_ssl)
+        body = self.scheduler.coalesce(request_key("GET", url, params), lambda: self._get_body(url, params))
+        return self._unwrap(json.loads(body))
+
+    def iter_objects(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterate over every object matching a query, across all pages.
+
+        Walks Scanopy's limit/offset pagination one page at a time as the caller consumes
+        results. The verified GET envelope carries no total or next link, so a
+        page shorter than the limit marks the end. Objects already yielded are skipped by
+        id, which also stops the walk if the server ignores offset and keeps returning
+        the same page.
+
+        Args:
+            endpoint: The API endpoint (e.g. 'hosts', 'services')
+            params: Optional query parameters for filtering; limit and offset are set
+                per page
+            page_size: Objects per request (defaults to the client's page_size, capped
+                at MAX_PAGE_SIZE)
+
+        Returns:
+            An iterator of object dicts
+        """
+        limit = min(max(1, page_size or self.page_size), MAX_PAGE_SIZE)
+        params = {k: v for k, v in (params or {}).items() if k not in ("limit", "offset")}
+        seen = set()
+        offset = 0
+        while True:
+            page = self.get(endpoint, params={**params, "limit": limit, "offset": offset})
+            if not isinstance(page, list):
+                # Not a list endpoint; hand back whatever it returned
+                yield page
+                return
+            new = 0
+            for obj in page:
+                key = obj.get("id") if isinstance(obj, dict) else None
+                if key is not None:
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                new += 1
+                yield obj
+            if len(page) < limit or not new:
+                return
+            offset += len(page)
+
+    def get_all(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Retrieve every object matching a query, across all pages (see iter_objects)."""
+        return list(self.iter_objects(endpoint, params=params, page_size=page_size))
+
+    def _get_body(self, url: str, params: Optional[Dict[str, Any]]) -> bytes:
+        """Issue a GET request and return the raw response body."""
+        response = self._request("GET", url, params=params)
         response.raise_for_status()
-        return self._unwrap(response.json())
+        return response.content
 
     def create(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new object in Scanopy via the REST API."""
         url = self._build_url(endpoint)
-        response = self.session.post(url, json=data, verify=self.verify_ssl)
+        response = self._request("POST", url, json=data)
         response.raise_for_status()
         return self._unwrap(response.json())
 
     def update(self, endpoint: str, id: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Update an existing object in Scanopy via the REST API (partial update)."""
         url = self._build_url(endpoint, id)
-        response = self.session.patch(url, json=data, verify=self.verify_ssl)
+        response = self._request("PATCH", url, json=data)
         response.raise_for_status()
         return self._unwrap(response.json())
 
     def delete(self, endpoint: str, id: str) -> bool:
         """Delete an object from Scanopy via the REST API."""
         url = self._build_url(endpoint, id)
-        response = self.session.delete(url, verify=self.verify_ssl)
+        response = self._request("DELETE", url)
         response.raise_for_status()
         return response.status_code in (200, 204)
 
@@ -117,14 +204,14 @@ class ScanopyRestClient:
         mirrors NetBox/DRF convention, not something confirmed against Scanopy's own docs.
         """
         url = f"{self._build_url(endpoint)}/bulk"
-        response = self.session.post(url, json=data, verify=self.verify_ssl)
+        response = self._request("POST", url, json=data)
         response.raise_for_status()
         return self._unwrap(response.json())
 
     def bulk_update(self, endpoint: str, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Update multiple objects in Scanopy via the REST API. UNVERIFIED, see bulk_create."""
         url = f"{self._build_url(endpoint)}/bulk"
-        response = self.session.patch(url, json=data, verify=self.verify_ssl)
+        response = self._request("PATCH", url, json=data)
         response.raise_for_status()
         return self._unwrap(response.json())
 
@@ -132,6 +219,6 @@ class ScanopyRestClient:
         """Delete multiple objects from Scanopy via the REST API. UNVERIFIED, see bulk_create."""
         url = f"{self._build_url(endpoint)}/bulk"
         data = [{"id": id} for id in ids]
-        response = self.session.delete(url, json=data, verify=self.verify_ssl)
+        response = self._request("DELETE", url, json=data)
         response.raise_for_status()
         return response.status_code in (200, 204)
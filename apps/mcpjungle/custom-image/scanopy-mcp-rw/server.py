@@ -1,12 +1,18 @@
 from mcp.server.fastmcp import FastMCP
-from scanopy_client import ScanopyRestClient
+from compact_output import compact_list
+from types import MappingProxyType
+import asyncio
 import os
 
+# scanopy_client and request_scheduler (and with them requests/urllib3) are imported by
+# _client() on the first tool call: MCPJungle spawns this server per session, and the
+# MCP handshake doesn't need them.
+
 # Mapping of simple object names to Scanopy API endpoints. Unlike NetBox (grouped under
 # dcim/ipam/etc. app prefixes), Scanopy's API is flat under /api/v1/ — the endpoint is just
 # the resource name itself. Confirmed against Scanopy's own source tree
 # (backend/src/server/) and published API docs (scanopy.net/docs/api/).
-SCANOPY_OBJECT_TYPES = {
+SCANOPY_OBJECT_TYPES = MappingProxyType({
     "credentials": "credentials",
     "daemons": "daemons",
     "dependencies": "dependencies",
@@ -25,18 +31,27 @@ SCANOPY_OBJECT_TYPES = {
     "topologies": "topologies",
     "users": "users",
     "vlans": "vlans",
-}
+})
 
 # Writable subset — deliberately excludes "credentials" (SNMP community strings / SSH keys
 # used for authenticated scans). Readable via scanopy_get_objects/get_object_by_id, but
 # never created/updated/deleted/bulk-modified through this MCP: an LLM shouldn't be minting
 # or rotating scan secrets. Every create/update/delete/bulk_* tool below validates against
 # this map, not the full SCANOPY_OBJECT_TYPES map.
-SCANOPY_WRITABLE_TYPES = {
+SCANOPY_WRITABLE_TYPES = MappingProxyType({
     k: v for k, v in SCANOPY_OBJECT_TYPES.items() if k != "credentials"
-}
-
-mcp = FastMCP("Scanopy", log_level="DEBUG")
+})
+
+# Host/port only apply to the sse and streamable-http transports (SCANOPY_MCP_TRANSPORT).
+# They're passed to the constructor because FastMCP derives its DNS-rebinding protection
+# from the host it's created with.
+mcp = FastMCP(
+    "Scanopy",
+    log_level="DEBUG",
+    host=os.getenv("SCANOPY_MCP_HOST", "127.0.0.1"),
+    port=int(os.getenv("SCANOPY_MCP_PORT", "8001")),
+)
+MCP_TRANSPORTS = ("stdio", "sse", "streamable-http")
 scanopy = None
 
 
@@ -45,16 +60,25 @@ def _valid_types_message(types: dict) -> str:
     return f"Invalid object_type. Must be one of:\n{valid}"
 
 
+# Built once: returned for every call with an unknown object_type
+INVALID_OBJECT_TYPE_MESSAGE = _valid_types_message(SCANOPY_OBJECT_TYPES)
+INVALID_WRITABLE_TYPE_MESSAGE = _valid_types_message(SCANOPY_WRITABLE_TYPES)
+
+
 @mcp.tool()
-def scanopy_get_objects(object_type: str, filters: dict):
+async def scanopy_get_objects(object_type: str, filters: dict, compact: bool = False):
     """
     Get objects from Scanopy based on their type and filters.
 
     Args:
         object_type: String representing the Scanopy object type (e.g. "hosts", "vlans")
-        filters: dict of filters/query params to apply (e.g. {"limit": 50, "offset": 0}).
-            Scanopy paginates with limit (default 50, max 1000, 0 = no limit) and offset
-            (default 0).
+        filters: dict of filters/query params to apply (e.g. {"network_id": "..."}).
+            Every page is fetched unless filters contains limit or offset, in which case
+            only that page is returned (Scanopy's limit: default 50, max 1000; offset
+            default 0).
+        compact: Return the list as a table ({"columns", "rows"}) with repeated nested
+            objects stored once under "refs" and referenced as {"$ref": id}. Much
+            smaller for large lists; "size" reports the saving.
 
     Valid object_type values:
     - credentials  (SNMP/SSH credentials used for authenticated scans — read-only here)
@@ -79,14 +103,18 @@ def scanopy_get_objects(object_type: str, filters: dict):
     See https://scanopy.net/docs/api/ for filtering options per object type.
     """
     if object_type not in SCANOPY_OBJECT_TYPES:
-        raise ValueError(_valid_types_message(SCANOPY_OBJECT_TYPES))
+        raise ValueError(INVALID_OBJECT_TYPE_MESSAGE)
 
     endpoint = SCANOPY_OBJECT_TYPES[object_type]
-    return scanopy.get(endpoint, params=filters)
+    if "limit" in filters or "offset" in filters:
+        objects = await asyncio.to_thread(_client().get, endpoint, params=filters)
+    else:
+        objects = await asyncio.to_thread(_client().get_all, endpoint, params=filters)
+    return compact_list(objects) if compact and isinstance(objects, list) else objects
 
 
 @mcp.tool()
-def scanopy_get_object_by_id(object_type: str, object_id: str):
+async def scanopy_get_object_by_id(object_type: str, object_id: str):
     """
     Get detailed information about a specific Scanopy object by its ID.
 
@@ -99,14 +127,14 @@ def scanopy_get_object_by_id(object_type: str, object_id: str):
         Complete object details
     """
     if object_type not in SCANOPY_OBJECT_TYPES:
-        raise ValueError(_valid_types_message(SCANOPY_OBJECT_TYPES))
+        raise ValueError(INVALID_OBJECT_TYPE_MESSAGE)
 
     endpoint = SCANOPY_OBJECT_TYPES[object_type]
-    return scanopy.get(endpoint, id=object_id)
+    return await asyncio.to_thread(_client().get, endpoint, id=object_id)
 
 
 @mcp.tool()
-def scanopy_create_object(object_type: str, data: dict):
+async def scanopy_create_object(object_type: str, data: dict):
     """
     Create a new object in Scanopy.
 
@@ -125,14 +153,14 @@ def scanopy_create_object(object_type: str, data: dict):
     scanopy_create_object("tags", {"name": "verified"})
     """
     if object_type not in SCANOPY_WRITABLE_TYPES:
-        raise ValueError(_valid_types_message(SCANOPY_WRITABLE_TYPES))
+        raise ValueError(INVALID_WRITABLE_TYPE_MESSAGE)
 
     endpoint = SCANOPY_WRITABLE_TYPES[object_type]
-    return scanopy.create(endpoint, data)
+    return await asyncio.to_thread(_client().create, endpoint, data)
 
 
 @mcp.tool()
-def scanopy_update_object(object_type: str, object_id: str, data: dict):
+async def scanopy_update_object(object_type: str, object_id: str, data: dict):
     """
     Update an existing object in Scanopy (partial update — only changed fields needed).
 
@@ -150,14 +178,14 @@ def scanopy_update_object(object_type: str, object_id: str, data: dict):
     scanopy_update_object("hosts", "70680c92-9087-4427-a0b4-e1afd096891c", {"name": "xfw-daemon"})
     """
     if object_type not in SCANOPY_WRITABLE_TYPES:
-        raise ValueError(_valid_types_message(SCANOPY_WRITABLE_TYPES))
+        raise ValueError(INVALID_WRITABLE_TYPE_MESSAGE)
 
     endpoint = SCANOPY_WRITABLE_TYPES[object_type]
-    return scanopy.update(endpoint, object_id, data)
+    return await asyncio.to_thread(_client().update, endpoint, object_id, data)
 
 
 @mcp.tool()
-def scanopy_delete_object(object_type: str, object_id: str):
+async def scanopy_delete_object(object_type: str, object_id: str):
     """
     Delete an object from Scanopy.
 
@@ -172,10 +200,10 @@ def scanopy_delete_object(object_type: str, object_id: str):
     WARNING: This permanently deletes the object and cannot be undone!
     """
     if object_type not in SCANOPY_WRITABLE_TYPES:
-        raise ValueError(_valid_types_message(SCANOPY_WRITABLE_TYPES))
+        raise ValueError(INVALID_WRITABLE_TYPE_MESSAGE)
 
     endpoint = SCANOPY_WRITABLE_TYPES[object_type]
-    success = scanopy.delete(endpoint, object_id)
+    success = await asyncio.to_thread(_client().delete, endpoint, object_id)
 
     if success:
         return {"success": True, "message": f"Successfully deleted {object_type} with ID {object_id}"}
@@ -184,7 +212,7 @@ def scanopy_delete_object(object_type: str, object_id: str):
 
 
 @mcp.tool()
-def scanopy_bulk_create_objects(object_type: str, data: list):
+async def scanopy_bulk_create_objects(object_type: str, data: list):
     """
     Create multiple objects in Scanopy in a single request.
     UNVERIFIED: whether Scanopy's API actually supports bulk endpoints — see
@@ -195,14 +223,14 @@ def scanopy_bulk_create_objects(object_type: str, data: list):
         data: List of dicts containing the object data to create
     """
     if object_type not in SCANOPY_WRITABLE_TYPES:
-        raise ValueError(_valid_types_message(SCANOPY_WRITABLE_TYPES))
+        raise ValueError(INVALID_WRITABLE_TYPE_MESSAGE)
 
     endpoint = SCANOPY_WRITABLE_TYPES[object_type]
-    return scanopy.bulk_create(endpoint, data)
+    return await asyncio.to_thread(_client().bulk_create, endpoint, data)
 
 
 @mcp.tool()
-def scanopy_bulk_update_objects(object_type: str, data: list):
+async def scanopy_bulk_update_objects(object_type: str, data: list):
     """
     Update multiple objects in Scanopy in a single request. UNVERIFIED, see
     scanopy_bulk_create_objects.
@@ -212,14 +240,14 @@ def scanopy_bulk_update_objects(object_type: str, data: list):
         data: List of dicts containing the object data to update (must include "id")
     """
     if object_type not in SCANOPY_WRITABLE_TYPES:
-        raise ValueError(_valid_types_message(SCANOPY_WRITABLE_TYPES))
+        raise ValueError(INVALID_WRITABLE_TYPE_MESSAGE)
 
     endpoint = SCANOPY_WRITABLE_TYPES[object_type]
-    return scanopy.bulk_update(endpoint, data)
+    return await asyncio.to_thread(_client().bulk_update, endpoint, data)
 
 
 @mcp.tool()
-def scanopy_bulk_delete_objects(object_type: str, object_ids: list):
+async def scanopy_bulk_delete_objects(object_type: str, object_ids: list):
     """
     Delete multiple objects from Scanopy in a single request. UNVERIFIED, see
     scanopy_bulk_create_objects.
@@ -231,10 +259,10 @@ def scanopy_bulk_delete_objects(object_type: str, object_ids: list):
     WARNING: This permanently deletes the objects and cannot be undone!
     """
     if object_type not in SCANOPY_WRITABLE_TYPES:
-        raise ValueError(_valid_types_message(SCANOPY_WRITABLE_TYPES))
+        raise ValueError(INVALID_WRITABLE_TYPE_MESSAGE)
 
     endpoint = SCANOPY_WRITABLE_TYPES[object_type]
-    success = scanopy.bulk_delete(endpoint, object_ids)
+    success = await asyncio.to_thread(_client().bulk_delete, endpoint, object_ids)
 
     if success:
         return {"success": True, "message": f"Successfully deleted {len(object_ids)} {object_type} objects"}
@@ -242,13 +270,58 @@ def scanopy_bulk_delete_objects(object_type: str, object_ids: list):
         return {"success": False, "message": f"Failed to delete {object_type} objects"}
 
 
-if __name__ == "__main__":
-    scanopy_url = os.getenv("SCANOPY_URL")
-    scanopy_token = os.getenv("SCANOPY_TOKEN")
+@mcp.tool()
+async def scanopy_get_connection_stats():
+    """
+    Get HTTP connection counters for this Scanopy MCP server's client.
+
+    Returns:
+        Dict with retries, coalesced (GETs that joined an identical in-flight request),
+        throttled_seconds, pool_maxsize, new_connections, reused_connections,
+        reuse_ratio (keep-alive effectiveness), tls_handshakes, tls_handshake_seconds
+        and tls_handshake_avg_ms
+    """
+    return _client().scheduler.stats()
+
+
+def _client():
+    """Return the Scanopy client, building it from environment variables on first use."""
+    global scanopy
+    if scanopy is not None:
+        return scanopy
+
+    from request_scheduler import HostRateLimiter, RequestScheduler, RetryPolicy
+    from scanopy_client import ScanopyRestClient
 
-    if not scanopy_url or not scanopy_token:
+    scheduler = RequestScheduler(
+        retry_policy=RetryPolicy(max_retries=int(os.getenv("SCANOPY_MAX_RETRIES", "3"))),
+        rate_limiter=HostRateLimiter(rate=float(os.getenv("SCANOPY_RATE_LIMIT", "0"))),
+        connect_timeout=float(os.getenv("SCANOPY_CONNECT_TIMEOUT", "5")),
+        read_timeout=float(os.getenv("SCANOPY_READ_TIMEOUT", "60")),
+        pool_connections=int(os.getenv("SCANOPY_POOL_CONNECTIONS", "10")),
+        pool_maxsize=int(os.getenv("SCANOPY_POOL_MAXSIZE", "10")),
+        pool_block=os.getenv("SCANOPY_POOL_BLOCK", "false").lower() == "true",
+    )
+
+    scanopy = ScanopyRestClient(
+        url=os.environ["SCANOPY_URL"],
+        token=os.environ["SCANOPY_TOKEN"],
+        scheduler=scheduler,
+        page_size=int(os.getenv("SCANOPY_PAGE_SIZE", "1000")),
+    )
+    return scanopy
+
+
+if __name__ == "__main__":
+    # Fail fast on missing configuration; the client itself is built on first use
+    if not os.getenv("SCANOPY_URL") or not os.getenv("SCANOPY_TOKEN"):
         raise ValueError("SCANOPY_URL and SCANOPY_TOKEN environment variables must be set")
 
-    scanopy = ScanopyRestClient(url=scanopy_url, token=scanopy_token)
+    transport = os.getenv("SCANOPY_MCP_TRANSPORT", "stdio")
+    if transport not in MCP_TRANSPORTS:
+        raise ValueError(f"SCANOPY_MCP_TRANSPORT must be one of: {', '.join(MCP_TRANSPORTS)}")
+    if transport != "stdio":
+        # One long-lived process serves every session; build the client up front
+        _client()
 
-    mcp.run(transport="stdio")
+    mcp.run(transport=transport)
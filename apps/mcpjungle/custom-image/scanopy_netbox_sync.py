@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Reconcile Scanopy discovery data into NetBox with a handful of bulk requests.
+
+Loads both sides in one paginated pass per endpoint (concurrently, through the same
+clients the MCP servers use), joins them in memory and writes only the difference:
+
+  - subnets                            -> ipam/prefixes     (global VRF, keyed by CIDR)
+  - vlans                              -> ipam/vlans        (ungrouped, keyed by VID)
+  - hosts, interfaces and ip-addresses -> ipam/ip-addresses (global VRF, keyed by address)
+
+NetBox stays the source of truth for anything already set. Missing objects are created
+and empty fields filled in - a prefix's description, an IP's dns_name, and an unassigned
+IP's interface when Scanopy saw it on a MAC NetBox knows - but nothing NetBox already
+holds is overwritten or deleted. Every change is sent through bulk_write, so each
+endpoint costs one request per chunk rather than one per object.
+
+Scanopy hosts are also joined to NetBox devices by MAC (an interface's MAC address),
+then IP (the device an address is assigned to), then hostname (device name), and the
+result is reported. Unmatched hosts are listed, not created: a NetBox device needs a
+site, role and device type that discovery can't supply.
+
+Scanopy field names beyond the GET envelope were NOT verified live (see
+scanopy-mcp-rw/scanopy_client.py's docstring); each is read via SCANOPY_FIELDS, which
+lists the candidate keys in order. If a dry run reports hosts with no addresses, adjust
+that map.
+
+Dry run by default: prints the plan and writes nothing.
+
+Usage (netbox-mcp-rw's environment has everything both clients need):
+    cd netbox-mcp-rw && uv run python ../scanopy_netbox_sync.py
+    cd netbox-mcp-rw && uv run python ../scanopy_netbox_sync.py --json    # full plan
+    cd netbox-mcp-rw && uv run python ../scanopy_netbox_sync.py --apply
+
+Reads NETBOX_URL, NETBOX_TOKEN, SCANOPY_URL and SCANOPY_TOKEN.
+"""
+
+import argparse
+import ipaddress
+import json
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+HERE = Path(__file__).resolve().parent
+# request_scheduler.py is duplicated verbatim in both, so either copy serves both clients
+sys.path[:0] = [str(HERE / "netbox-mcp-rw"), str(HERE / "scanopy-mcp-rw")]
+
+from netbox_client import NetBoxRestClient  # noqa: E402
+from scanopy_client import ScanopyRestClient  # noqa: E402
+
+# Candidate keys for each value read from Scanopy objects, tried in order
+SCANOPY_FIELDS = {
+    "name": ("hostname", "name"),
+    "mac": ("mac_address", "mac"),
+    "ip": ("ip_address", "address", "ip"),
+    "cidr": ("cidr", "network", "prefix"),
+    "vid": ("vlan_id", "vid", "tag"),
+    "host_id": ("host_id",),
+    "interface_id": ("interface_id",),
+    "subnet_id": ("subnet_id",),
+}
+
+SCANOPY_ENDPOINTS = ("hosts", "interfaces", "ip-addresses", "subnets", "vlans")
+
+# name: (endpoint, params, fields)
+NETBOX_QUERIES = {
+    "devices": ("dcim/devices", None, ["id", "name"]),
+    "interfaces": ("dcim/interfaces", None, ["id", "device", "mac_address", "primary_mac_address"]),
+    "ip-addresses": (
+        "ipam/ip-addresses",
+        {"vrf_id": "null"},
+        ["id", "address", "dns_name", "assigned_object_type", "assigned_object_id", "assigned_object"],
+    ),
+    "prefixes": ("ipam/prefixes", {"vrf_id": "null"}, ["id", "prefix", "description"]),
+    "vlans": ("ipam/vlans", None, ["id", "vid", "group"]),
+}
+
+# Writes are applied in this order, so prefixes exist before the addresses inside them
+WRITE_ENDPOINTS = ("ipam/prefixes", "ipam/vlans", "ipam/ip-addresses")
+
+DESCRIPTION = "Discovered by Scanopy"
+
+# NetBox's validator for IPAddress.dns_name
+DNS_NAME = re.compile(r"^([0-9A-Za-z_-]+|\*)(\.[0-9A-Za-z_-]+)*\.?$")
+
+
+def _field(obj: Dict[str, Any], name: str) -> Any:
+    """Return the first non-empty candidate key for a Scanopy value."""
+    for key in SCANOPY_FIELDS[name]:
+        value = obj.get(key)
+        if value not in (None, ""):
+            return value
+    return None
+
+
+def _mac(value: Any) -> Optional[str]:
+    """Normalize a MAC address to lowercase colon-separated form."""
+    digits = re.sub(r"[^0-9a-fA-F]", "", str(value or ""))
+    if len(digits) != 12:
+        return None
+    return ":".join(digits[i:i + 2] for i in range(0, 12, 2)).lower()
+
+
+def _ip(value: Any) -> Optional[str]:
+    """Normalize an address, with or without a mask, to its bare IP."""
+    try:
+        return str(ipaddress.ip_interface(str(value)).ip) if value else None
+    except ValueError:
+        return None
+
+
+def _network(value: Any) -> Optional[Union[ipaddress.IPv4Network, ipaddress.IPv6Network]]:
+    """Parse a CIDR, tolerating host bits, or return None."""
+    try:
+        return ipaddress.ip_network(str(value), strict=False) if value else None
+    except ValueError:
+        return None
+
+
+def load(netbox: NetBoxRestClient, scanopy: ScanopyRestClient) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, List[Dict[str, Any]]]]:
+    """Fetch every Scanopy endpoint and NetBox query concurrently; returns (scanopy, netbox) data."""
+    tasks = {("scanopy", name): (scanopy.get_all, name, {}) for name in SCANOPY_ENDPOINTS}
+    for name, (endpoint, params, fields) in NETBOX_QUERIES.items():
+        tasks[("netbox", name)] = (netbox.get_all, endpoint, {"params": params, "fields": fields})
+    with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+        futures = {key: pool.submit(fn, endpoint, **kwargs) for key, (fn, endpoint, kwargs) in tasks.items()}
+        results = {key: future.result() for key, future in futures.items()}
+    return (
+        {name: results[("scanopy", name)] for name in SCANOPY_ENDPOINTS},
+        {name: results[("netbox", name)] for name in NETBOX_QUERIES},
+    )
+
+
+def _scanopy_hosts(data: Dict[str, List[Dict[str, Any]]]) -> Tuple[List[Dict[str, Any]], Dict[Any, Any]]:
+    """
+    Fold Scanopy hosts, interfaces and ip-addresses into one record per host.
+
+    Returns:
+        (hosts, subnets): hosts as {"id", "name", "macs", "addresses": {ip: {"mac", "subnet"}}},
+        subnets as {subnet id: network}
+    """
+    subnets = {}
+    for subnet in data["subnets"]:
+        network = _network(_field(subnet, "cidr"))
+        if network is not None:
+            subnets[subnet.get("id")] = network
+
+    hosts = {}
+    interfaces = list(data["interfaces"])
+    for host in data["hosts"]:
+        hosts[host.get("id")] = {"id": host.get("id"), "name": _field(host, "name"), "macs": set(), "addresses": {}}
+        # Hosts may embed their interfaces instead of (or as well as) the interfaces endpoint listing them
+        interfaces += [{**iface, "host_id": host.get("id")} for iface in host.get("interfaces") or [] if isinstance(iface, dict)]
+
+    def add(host_id: Any, ip: Any, mac: Optional[str], subnet_id: Any) -> None:
+        host = hosts.get(host_id)
+        if host is None:
+            return
+        if mac:
+            host["macs"].add(mac)
+        ip = _ip(ip)
+        if ip:
+            entry = host["addresses"].setdefault(ip, {"mac": None, "subnet": None})
+            entry["mac"] = entry["mac"] or mac
+            entry["subnet"] = entry["subnet"] or subnets.get(subnet_id)
+
+    interface_hosts = {}
+    for iface in interfaces:
+        mac = _mac(_field(iface, "mac"))
+        interface_hosts[iface.get("id")] = (_field(iface, "host_id"), mac)
+        add(_field(iface, "host_id"), _field(iface, "ip"), mac, _field(iface, "subnet_id"))
+    for address in data["ip-addresses"]:
+        host_id, mac = interface_hosts.get(_field(address, "interface_id"), (_field(address, "host_id"), None))
+        add(host_id, _field(address, "ip"), mac, _field(address, "subnet_id"))
+    return list(hosts.values()), subnets
+
+
+def _device_of(ip: Dict[str, Any]) -> Optional[int]:
+    """Return the ID of the device an IP address is assigned to, if any."""
+    assigned = ip.get("assigned_object")
+    if ip.get("assigned_object_type") == "dcim.interface" and isinstance(assigned, dict):
+        device = assigned.get("device")
+        return device.get("id") if isinstance(device, dict) else None
+    return None
+
+
+def plan(scanopy_data: Dict[str, List[Dict[str, Any]]], netbox_data: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    Diff Scanopy against NetBox.
+
+    Returns:
+        {"writes": {endpoint: {"create": [...], "update": [...]}}, "hosts": {"matched",
+        "unmatched", "conflicts"}}; updates carry only the ID and the fields that change
+    """
+    writes = {endpoint: {"create": [], "update": []} for endpoint in WRITE_ENDPOINTS}
+    hosts, subnets = _scanopy_hosts(scanopy_data)
+
+    # Prefixes
+    prefixes = {_network(p["prefix"]): p for p in netbox_data["prefixes"]}
+    names = {_network(_field(s, "cidr")): s.get("name") for s in scanopy_data["subnets"]}
+    for network in sorted(set(subnets.values()), key=lambda n: (n.version, n)):
+        name = names.get(network)
+        existing = prefixes.get(network)
+        if existing is None:
+            writes["ipam/prefixes"]["create"].append(
+                {"prefix": str(network), "status": "active", "description": name or DESCRIPTION}
+            )
+        elif name and not existing.get("description"):
+            writes["ipam/prefixes"]["update"].append({"id": existing["id"], "description": name})
+
+    # VLANs (NetBox requires a name, so there's nothing to fill in on existing ones)
+    vids = {v["vid"] for v in netbox_data["vlans"] if not v.get("group")}
+    for vlan in scanopy_data["vlans"]:
+        try:
+            vid = int(_field(vlan, "vid"))
+        except (TypeError, ValueError):
+            continue
+        if vid not in vids and 1 <= vid <= 4094:
+            vids.add(vid)
+            writes["ipam/vlans"]["create"].append(
+                {"vid": vid, "name": vlan.get("name") or f"VLAN {vid}", "status": "active", "description": DESCRIPTION}
+            )
+
+    # Join hosts to devices and diff their addresses
+    devices = {d["id"]: d.get("name") for d in netbox_data["devices"]}
+    device_names = {}
+    for device_id, name in devices.items():
+        if name:
+            device_names.setdefault(name.casefold(), device_id)
+            device_names.setdefault(name.split(".")[0].casefold(), device_id)
+    interfaces = {}
+    for iface in netbox_data["interfaces"]:
+        primary = iface.get("primary_mac_address")
+        mac = _mac(iface.get("mac_address") or (primary.get("mac_address") if isinstance(primary, dict) else None))
+        device = iface.get("device")
+        if mac and isinstance(device, dict):
+            interfaces.setdefault(mac, (iface["id"], device.get("id")))
+    ips = {_ip(ip["address"]): ip for ip in netbox_data["ip-addresses"]}
+    known_networks = sorted(
+        set(subnets.values()) | {n for n in prefixes if n is not None}, key=lambda n: -n.prefixlen
+    )
+
+    matched, unmatched, conflicts = [], [], []
+    created = set()
+    for host in hosts:
+        label = host["name"] or host["id"]
+        found = [
+            ("mac", {interfaces[mac][1] for mac in host["macs"] if mac in interfaces}),
+            ("ip", {_device_of(ips[ip]) for ip in host["addresses"] if ip in ips} - {None}),
+            ("hostname", {device_names.get(n.casefold()) for n in (host["name"], (host["name"] or "").split(".")[0]) if n} - {None}),
+        ]
+        candidates = set().union(*(ids for _, ids in found))
+        by, ids = next(((how, ids) for how, ids in found if ids), (None, set()))
+        if ids:
+            device_id = min(ids)
+            matched.append({"host": label, "device": devices.get(device_id), "device_id": device_id, "by": by})
+            if len(candidates) > 1:
+                conflicts.append({"host": label, "devices": sorted(devices.get(d) or str(d) for d in candidates)})
+        else:
+            unmatched.append(label)
+
+        dns_name = host["name"] if host["name"] and DNS_NAME.match(host["name"]) else None
+        for ip, seen in sorted(host["addresses"].items()):
+            assign = interfaces.get(seen["mac"]) if seen["mac"] else None
+            existing = ips.get(ip)
+            if existing is not None:
+                changes = {}
+                if dns_name and not existing.get("dns_name"):
+                    changes["dns_name"] = dns_name
+                if assign and not existing.get("assigned_object_id"):
+                    changes.update(assigned_object_type="dcim.interface", assigned_object_id=assign[0])
+                if changes:
+                    writes["ipam/ip-addresses"]["update"].append({"id": existing["id"], **changes})
+            elif ip not in created:
+                created.add(ip)
+                address = ipaddress.ip_address(ip)
+                subnet = seen["subnet"] if seen["subnet"] and address in seen["subnet"] else None
+                subnet = subnet or next((n for n in known_networks if address in n), None)
+                item = {
+                    "address": f"{ip}/{subnet.prefixlen if subnet else address.max_prefixlen}",
+                    "status": "active",
+                    "description": DESCRIPTION,
+                }
+                if dns_name:
+                    item["dns_name"] = dns_name
+                if assign:
+                    item.update(assigned_object_type="dcim.interface", assigned_object_id=assign[0])
+                writes["ipam/ip-addresses"]["create"].append(item)
+
+    return {
+        "writes": writes,
+        "hosts": {"matched": matched, "unmatched": sorted(unmatched, key=str), "conflicts": conflicts},
+    }
+
+
+def apply(netbox: NetBoxRestClient, changes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Send a plan's writes as chunked bulk requests; returns one summary per bulk write."""
+    results = []
+    for endpoint in WRITE_ENDPOINTS:
+        for action in ("create", "update"):
+            items = changes["writes"][endpoint][action]
+            if items:
+                result = netbox.bulk_write(action, endpoint, items).to_dict()
+                del result["succeeded"]
+                results.append(result)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--apply", action="store_true", help="Write the changes to NetBox (default: dry run)")
+    parser.add_argument("--json", action="store_true", help="Print the full plan (and results) as JSON")
+    args = parser.parse_args()
+
+    for var in ("NETBOX_URL", "NETBOX_TOKEN", "SCANOPY_URL", "SCANOPY_TOKEN"):
+        if not os.getenv(var):
+            raise SystemExit(f"{var} must be set")
+    netbox = NetBoxRestClient(url=os.environ["NETBOX_URL"], token=os.environ["NETBOX_TOKEN"])
+    scanopy = ScanopyRestClient(url=os.environ["SCANOPY_URL"], token=os.environ["SCANOPY_TOKEN"])
+
+    changes = plan(*load(netbox, scanopy))
+    results = apply(netbox, changes) if args.apply else None
+
+    if args.json:
+        print(json.dumps({**changes, "results": results}, indent=2, default=str))
+        return
+    hosts = changes["hosts"]
+    print(
+        f"hosts: {len(hosts['matched'])} matched, {len(hosts['unmatched'])} unmatched, "
+        f"{len(hosts['conflicts'])} matching more than one device"
+    )
+    for endpoint in WRITE_ENDPOINTS:
+        writes = changes["writes"][endpoint]
+        print(f"{endpoint}: {len(writes['create'])} to create, {len(writes['update'])} to update")
+    if results is None:
+        print("dry run, nothing written (use --apply)")
+        return
+    for result in results:
+        print(
+            f"{result['endpoint']} {result['action']}: {result['succeeded_count']} ok, "
+            f"{result['failed_count']} failed in {result['chunks']} requests"
+        )
+        for failure in result["failed"]:
+            print(f"  {failure['item']}: {failure['error']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,17 +6,41 @@ box- and device-level metrics on /metrics. This is the MSP cloud API (the
 same one mcp-firewalla uses) -- not a local API on the Firewalla box -- so
 this runs as an ordinary k8s Deployment, no flash-wear concerns.
 
-API results are cached for FIREWALLA_POLL_INTERVAL_SECONDS regardless of
-Prometheus's own scrape_interval, so a short scrape_interval doesn't
-hammer the MSP API.
+API results are cached regardless of Prometheus's own scrape_interval, so a
+short scrape_interval doesn't hammer the MSP API. Each resource (boxes,
+devices, alarms) is polled on its own interval, defaulting to
+FIREWALLA_POLL_INTERVAL_SECONDS, and keeps its last good data when a poll of
+it fails -- one failing endpoint only marks that resource down.
+
+Resources that fall due together are fetched as a small pipeline: /boxes and
+/devices in parallel, and alarm counting as soon as /boxes (its only input)
+arrives, or straight away from the cached box list if /boxes isn't due.
+Per-stage durations are exported alongside the data.
+
+Metrics are built and encoded (plain and gzipped) once per poll by the
+refresh thread into an immutable snapshot, and /metrics serves those bytes as
+they are -- a scrape takes no lock and does no work proportional to the
+number of devices.
+
+Active alarms are counted with a single /alarms?groupBy=box request where
+the API supports it. Otherwise each box is paged on a small thread pool with
+its own time budget, so a poll takes as long as the slowest box rather than
+the sum of all of them. A box that times out or errors keeps its last count
+instead of holding up the rest.
 """
 import os
 import sys
 import threading
 import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
 
 import requests
-from prometheus_client import start_http_server
+from requests.adapters import HTTPAdapter
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from prometheus_client.exposition import gzip_accepted
 from prometheus_client.core import REGISTRY, GaugeMetricFamily, CounterMetricFamily
 
 MSP_ID = os.environ["FIREWALLA_MSP_ID"]
@@ -24,6 +48,21 @@ MSP_TOKEN = os.environ["FIREWALLA_MSP_TOKEN"]
 POLL_INTERVAL = int(os.environ.get("FIREWALLA_POLL_INTERVAL_SECONDS", "60"))
 LISTEN_PORT = int(os.environ.get("FIREWALLA_METRICS_PORT", "9878"))
 PER_DEVICE_METRICS = os.environ.get("FIREWALLA_PER_DEVICE_METRICS", "true").lower() == "true"
+ALARM_CONCURRENCY = max(1, int(os.environ.get("FIREWALLA_ALARM_CONCURRENCY", "4")))
+ALARM_BOX_TIMEOUT = float(os.environ.get("FIREWALLA_ALARM_BOX_TIMEOUT_SECONDS", "30"))
+ALARM_COUNT_MODE = os.environ.get("FIREWALLA_ALARM_COUNT_MODE", "auto").lower()
+ALARM_PAGE_SIZE = int(os.environ.get("FIREWALLA_ALARM_PAGE_SIZE", "100"))
+ALARM_MAX_PAGES = int(os.environ.get("FIREWALLA_ALARM_MAX_PAGES", "20"))
+# After a grouped /alarms response in an unexpected shape, page per box this long before retrying
+GROUPED_RETRY_SECONDS = 3600
+if ALARM_COUNT_MODE not in ("auto", "page"):
+    raise ValueError("FIREWALLA_ALARM_COUNT_MODE must be auto or page")
+RESOURCES = ("boxes", "devices", "alarms")
+RESOURCE_INTERVALS = {
+    resource: int(os.environ.get(f"FIREWALLA_{resource.upper()}_POLL_INTERVAL_SECONDS", POLL_INTERVAL))
+    for resource in RESOURCES
+}
+REQUEST_TIMEOUT = 15
 
 BASE_URL = f"https://{MSP_ID}/v2"
 session = requests.Session()
@@ -31,124 +70,420 @@ session.headers.update({
     "Authorization": f"Token {MSP_TOKEN}",
     "Content-Type": "application/json",
 })
+# One keep-alive connection per alarm worker, plus headroom for /boxes and /devices
+session.mount("https://", HTTPAdapter(pool_maxsize=ALARM_CONCURRENCY + 2))
 
 _lock = threading.Lock()
-_cache = {"ts": 0.0, "boxes": [], "devices": [], "active_alarms": {}, "ok": False}
+_cache = {"boxes": [], "devices": [], "active_alarms": {}, "alarm_errors": set(),
+          "alarm_truncated": set(), "stage_seconds": {},
+          # Per resource: whether its last poll succeeded, when it last did, and failures so far
+          "status": {resource: {"ok": False, "last_success": 0.0, "errors": 0} for resource in RESOURCES}}
+# Monotonic time before which grouped alarm counts aren't retried, after a response
+# in a shape _fetch_grouped_alarm_counts doesn't understand
+_grouped_counts_retry_at = 0.0
+# (encoded metrics, the same as an unfinished gzip stream, {resource: last
+# success}) -- rebuilt by the refresh thread after every poll (see
+# _publish_snapshot), read without locking by every scrape
+_snapshot = (b"", (b"", zlib.compressobj(wbits=31)), {})
+# Failed snapshot builds; the previous snapshot keeps being served meanwhile
+_snapshot_errors = 0
 
 
-def _get(path, params=None):
-    r = session.get(f"{BASE_URL}{path}", params=params, timeout=15)
+def _get(path, params=None, timeout=REQUEST_TIMEOUT):
+    r = session.get(f"{BASE_URL}{path}", params=params, timeout=timeout)
     r.raise_for_status()
     return r.json()
 
 
-def _fetch_active_alarm_counts(boxes):
-    """Count active alarms per box. /alarms is paginated and box-scoped."""
-    counts = {}
-    for box in boxes:
-        gid = box["gid"]
-        total = 0
-        cursor = None
-        for _ in range(20):  # hard cap: never loop forever on a pagination bug
-            params = {"query": f"status:active box:{gid}", "limit": 100}
-            if cursor:
-                params["cursor"] = cursor
-            data = _get("/alarms", params=params)
-            total += len(data.get("results", []))
-            cursor = data.get("next_cursor")
-            if not cursor:
-                break
-        counts[gid] = total
-    return counts
-
-
-def _refresh():
-    boxes = _get("/boxes")
-    devices = _get("/devices")
-    active_alarms = _fetch_active_alarm_counts(boxes)
+def _fetch_grouped_alarm_counts(gids):
+    """
+    Count active alarms for every box in one request, using /alarms' groupBy.
+
+    UNVERIFIED: the MSP API documents groupBy for /alarms, but the exact shape of
+    grouped results wasn't confirmed against the live API. Each group is
+    expected to carry a box gid (as "gid", or "box" as a string or object) and
+    an integer "count"; anything else raises ValueError so the caller can fall
+    back to paging. Boxes with no group have no active alarms.
+
+    More groups than fit in one page (over 500 boxes) are paged with
+    next_cursor, up to ALARM_MAX_PAGES; past that it raises RuntimeError, which
+    falls back to per-box paging for this poll only.
+    """
+    counts = dict.fromkeys(gids, 0)
+    cursor = None
+    for _ in range(ALARM_MAX_PAGES):
+        params = {"query": "status:active", "groupBy": "box", "limit": 500}
+        if cursor:
+            params["cursor"] = cursor
+        data = _get("/alarms", params=params)
+        results = data.get("results")
+        if not isinstance(results, list):
+            raise ValueError(f"grouped /alarms response has no list of groups: {str(data)[:200]}")
+        for group in results:
+            if not isinstance(group, dict):
+                raise ValueError(f"unexpected group in grouped /alarms response: {str(group)[:200]}")
+            box = group.get("gid") or group.get("box")
+            gid = box.get("gid") if isinstance(box, dict) else box
+            count = group.get("count")
+            if not isinstance(gid, str) or type(count) is not int:
+                raise ValueError(f"unexpected group in grouped /alarms response: {str(group)[:200]}")
+            if gid in counts:
+                counts[gid] += count
+        cursor = data.get("next_cursor")
+        if not cursor:
+            return counts
+    raise RuntimeError(f"grouped /alarms response ran past {ALARM_MAX_PAGES} pages")
+
+
+def _fetch_box_alarm_count(gid):
+    """
+    Count one box's active alarms by paging, giving up once ALARM_BOX_TIMEOUT
+    has passed. Returns (count, truncated): truncated is True if ALARM_MAX_PAGES
+    ran out before the last page, i.e. the count is a lower bound.
+    """
+    deadline = time.monotonic() + ALARM_BOX_TIMEOUT
+    total = 0
+    cursor = None
+    for _ in range(ALARM_MAX_PAGES):  # hard cap: never loop forever on a pagination bug
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"gave up after {ALARM_BOX_TIMEOUT:g}s")
+        params = {"query": f"status:active box:{gid}", "limit": ALARM_PAGE_SIZE}
+        if cursor:
+            params["cursor"] = cursor
+        data = _get("/alarms", params=params, timeout=min(REQUEST_TIMEOUT, remaining))
+        total += len(data.get("results", []))
+        cursor = data.get("next_cursor")
+        if not cursor:
+            return total, False
+    return total, True
+
+
+def _fetch_active_alarm_counts(boxes, previous):
+    """
+    Count active alarms per box. Tries one grouped request for all boxes first
+    (see ALARM_COUNT_MODE); otherwise /alarms is paged per box, concurrently.
+    Returns (counts, failed gids, truncated gids); a failed box keeps its count
+    from `previous`.
+    """
+    global _grouped_counts_retry_at
+    gids = [box["gid"] for box in boxes]
+    if ALARM_COUNT_MODE == "auto" and time.monotonic() >= _grouped_counts_retry_at:
+        try:
+            return _fetch_grouped_alarm_counts(gids), set(), set()
+        except ValueError as e:
+            # The response shape is unlikely to change from one poll to the next;
+            # page per box for a while, then try grouping again
+            _grouped_counts_retry_at = time.monotonic() + GROUPED_RETRY_SECONDS
+            print(f"[firewalla-exporter] grouped alarm counts unavailable, paging per box "
+                  f"for {GROUPED_RETRY_SECONDS}s: {e}", file=sys.stderr)
+        except Exception as e:  # noqa: BLE001 -- fall back to paging for this poll only
+            print(f"[firewalla-exporter] grouped alarm counts failed, paging per box: {e}",
+                  file=sys.stderr)
+
+    counts, failed, truncated = {}, set(), set()
+
+    def fetch(gid):
+        try:
+            return gid, _fetch_box_alarm_count(gid)
+        except Exception as e:  # noqa: BLE001 -- one bad box mustn't fail the poll
+            print(f"[firewalla-exporter] alarms for box {gid} failed: {e}", file=sys.stderr)
+            return gid, None
+
+    with ThreadPoolExecutor(max_workers=ALARM_CONCURRENCY) as pool:
+        for gid, result in pool.map(fetch, gids):
+            if result is None:
+                failed.add(gid)
+                if gid in previous:
+                    counts[gid] = previous[gid]
+            else:
+                counts[gid], capped = result
+                if capped:
+                    truncated.add(gid)
+    return counts, failed, truncated
+
+
+def _run_stages(stages):
+    """
+    Run {name: (dependencies, fn)} concurrently, each stage starting as soon as
+    the stages it depends on have finished. fn gets {dependency: result} for
+    the dependencies that succeeded, so it can fall back when one failed.
+    Stages must be listed after their dependencies. Returns (results, errors,
+    seconds), each keyed by stage name.
+    """
+    futures, seconds = {}, {}
+
+    def run(name, deps, fn):
+        inputs = {}
+        for dep in deps:
+            if futures[dep].exception() is None:
+                inputs[dep] = futures[dep].result()
+        started = time.monotonic()
+        try:
+            return fn(inputs)
+        finally:
+            seconds[name] = time.monotonic() - started
+
+    with ThreadPoolExecutor(max_workers=len(stages)) as pool:
+        for name, (deps, fn) in stages.items():
+            futures[name] = pool.submit(run, name, deps, fn)
+        errors = {name: future.exception() for name, future in futures.items()}
+    results = {name: futures[name].result() for name, error in errors.items() if error is None}
+    return results, {name: error for name, error in errors.items() if error is not None}, seconds
+
+
+def _refresh(due):
+    """Poll the resources in `due`, updating the cache for each one that succeeds."""
+    with _lock:
+        previous = dict(_cache["active_alarms"])
+        cached_boxes = list(_cache["boxes"])
+    stages = {}
+    if "boxes" in due:
+        stages["boxes"] = ((), lambda _: _get("/boxes"))
+    if "devices" in due:
+        stages["devices"] = ((), lambda _: _get("/devices"))
+    if "alarms" in due:
+        deps = ("boxes",) if "boxes" in due else ()
+        stages["alarms"] = (deps, lambda r: _fetch_active_alarm_counts(r.get("boxes", cached_boxes), previous))
+    started = time.monotonic()
+    results, errors, seconds = _run_stages(stages)
+    seconds["total"] = time.monotonic() - started
+
+    now = time.time()
     with _lock:
-        _cache.update(ts=time.time(), boxes=boxes, devices=devices,
-                       active_alarms=active_alarms, ok=True)
+        for resource in stages:
+            status = _cache["status"][resource]
+            if resource in errors:
+                print(f"[firewalla-exporter] {resource} refresh failed: {errors[resource]}", file=sys.stderr)
+                status["ok"] = False
+                status["errors"] += 1
+                continue
+            status.update(ok=True, last_success=now)
+            if resource == "alarms":
+                _cache["active_alarms"], _cache["alarm_errors"], _cache["alarm_truncated"] = results["alarms"]
+            else:
+                _cache[resource] = results[resource]
+        _cache["stage_seconds"].update(seconds)
 
 
 def _refresh_loop():
+    global _snapshot_errors
+    next_due = dict.fromkeys(RESOURCES, 0.0)
     while True:
-        try:
-            _refresh()
-        except Exception as e:  # noqa: BLE001 -- exporter must never crash the loop
-            print(f"[firewalla-exporter] refresh failed: {e}", file=sys.stderr)
-            with _lock:
-                _cache["ok"] = False
-        time.sleep(POLL_INTERVAL)
+        now = time.monotonic()
+        due = {resource for resource, at in next_due.items() if at <= now}
+        if due:
+            try:
+                _refresh(due)
+            except Exception as e:  # noqa: BLE001 -- exporter must never crash the loop
+                print(f"[firewalla-exporter] refresh failed: {e}", file=sys.stderr)
+            try:
+                _publish_snapshot()
+            except Exception as e:  # noqa: BLE001 -- keep serving the last snapshot
+                _snapshot_errors += 1
+                print(f"[firewalla-exporter] building metrics failed: {e}", file=sys.stderr)
+            for resource in due:
+                next_due[resource] = now + RESOURCE_INTERVALS[resource]
+        time.sleep(max(0.0, min(next_due.values()) - time.monotonic()))
 
 
-class FirewallaCollector:
-    def collect(self):
-        with _lock:
-            boxes = list(_cache["boxes"])
-            devices = list(_cache["devices"])
-            active_alarms = dict(_cache["active_alarms"])
-            ok = _cache["ok"]
-            ts = _cache["ts"]
-
-        up = GaugeMetricFamily("firewalla_exporter_up", "1 if the last MSP API poll succeeded")
-        up.add_metric([], 1 if ok else 0)
-        yield up
-
-        last_poll = GaugeMetricFamily("firewalla_exporter_last_poll_timestamp_seconds",
-                                       "Unix timestamp of the last successful poll")
-        last_poll.add_metric([], ts)
-        yield last_poll
-
-        box_online = GaugeMetricFamily("firewalla_box_online", "1 if the box is online",
-                                        labels=["gid", "name", "model"])
-        box_devices = GaugeMetricFamily("firewalla_box_device_count", "Devices known to this box",
-                                         labels=["gid", "name"])
-        box_rules = GaugeMetricFamily("firewalla_box_rule_count", "Rules configured on this box",
+def _metric_families():
+    """Build every metric family from the cache, except the time-dependent staleness gauge."""
+    with _lock:
+        boxes = list(_cache["boxes"])
+        devices = list(_cache["devices"])
+        active_alarms = dict(_cache["active_alarms"])
+        alarm_errors = set(_cache["alarm_errors"])
+        alarm_truncated = set(_cache["alarm_truncated"])
+        stage_seconds = dict(_cache["stage_seconds"])
+        status = {resource: dict(s) for resource, s in _cache["status"].items()}
+
+    up = GaugeMetricFamily("firewalla_exporter_up",
+                           "1 if the last poll of every MSP API resource succeeded")
+    up.add_metric([], 1 if all(s["ok"] for s in status.values()) else 0)
+    yield up
+
+    last_poll = GaugeMetricFamily("firewalla_exporter_last_poll_timestamp_seconds",
+                                   "Unix timestamp by which every resource had been polled "
+                                   "successfully (the oldest per-resource last success)")
+    last_poll.add_metric([], min(s["last_success"] for s in status.values()))
+    yield last_poll
+
+    resource_up = GaugeMetricFamily("firewalla_exporter_resource_up",
+                                     "1 if the last poll of this resource succeeded",
+                                     labels=["resource"])
+    resource_last = GaugeMetricFamily("firewalla_exporter_resource_last_success_timestamp_seconds",
+                                       "Unix timestamp of this resource's last successful poll",
+                                       labels=["resource"])
+    resource_errors = CounterMetricFamily("firewalla_exporter_resource_errors",
+                                           "Failed polls of this resource",
+                                           labels=["resource"])
+    for resource, s in status.items():
+        resource_up.add_metric([resource], 1 if s["ok"] else 0)
+        resource_last.add_metric([resource], s["last_success"])
+        resource_errors.add_metric([resource], s["errors"])
+    yield resource_up
+    yield resource_last
+    yield resource_errors
+
+    stage_duration = GaugeMetricFamily("firewalla_exporter_poll_stage_duration_seconds",
+                                        "Duration of each stage the last time it ran (stages "
+                                        "overlap, so total can be less than their sum)",
+                                        labels=["stage"])
+    for stage, duration in stage_seconds.items():
+        stage_duration.add_metric([stage], duration)
+    yield stage_duration
+
+    box_online = GaugeMetricFamily("firewalla_box_online", "1 if the box is online",
+                                    labels=["gid", "name", "model"])
+    box_devices = GaugeMetricFamily("firewalla_box_device_count", "Devices known to this box",
+                                     labels=["gid", "name"])
+    box_rules = GaugeMetricFamily("firewalla_box_rule_count", "Rules configured on this box",
+                                   labels=["gid", "name"])
+    box_alarms_total = GaugeMetricFamily("firewalla_box_alarm_count_total",
+                                          "Lifetime alarm count reported by the box",
+                                          labels=["gid", "name"])
+    box_alarms_active = GaugeMetricFamily("firewalla_alarms_active",
+                                           "Currently active (unresolved) alarms",
+                                           labels=["gid", "name"])
+    box_alarms_up = GaugeMetricFamily("firewalla_alarms_active_up",
+                                       "1 if this box's active alarms were counted on the last poll",
                                        labels=["gid", "name"])
-        box_alarms_total = GaugeMetricFamily("firewalla_box_alarm_count_total",
-                                              "Lifetime alarm count reported by the box",
+    box_alarms_truncated = GaugeMetricFamily("firewalla_alarms_active_truncated",
+                                              "1 if paging hit FIREWALLA_ALARM_MAX_PAGES, so "
+                                              "firewalla_alarms_active is a lower bound",
                                               labels=["gid", "name"])
-        box_alarms_active = GaugeMetricFamily("firewalla_alarms_active",
-                                               "Currently active (unresolved) alarms",
-                                               labels=["gid", "name"])
-        for box in boxes:
-            gid = box["gid"]
-            name = box.get("name", gid)
-            box_online.add_metric([gid, name, box.get("model", "")], 1 if box.get("online") else 0)
-            box_devices.add_metric([gid, name], box.get("deviceCount", 0))
-            box_rules.add_metric([gid, name], box.get("ruleCount", 0))
-            box_alarms_total.add_metric([gid, name], box.get("alarmCount", 0))
-            box_alarms_active.add_metric([gid, name], active_alarms.get(gid, 0))
-        yield box_online
-        yield box_devices
-        yield box_rules
-        yield box_alarms_total
-        yield box_alarms_active
-
-        if PER_DEVICE_METRICS:
-            dev_online = GaugeMetricFamily("firewalla_device_online", "1 if the client device is online",
-                                            labels=["gid", "device_id", "name"])
-            dev_bandwidth = CounterMetricFamily(
-                "firewalla_device_bandwidth_bytes",
-                "Cumulative bandwidth per device, as reported by the MSP API",
-                labels=["gid", "device_id", "name", "direction"],
-            )
-            for d in devices:
-                gid, dev_id, name = d.get("gid", ""), d.get("id", ""), d.get("name", "")
-                dev_online.add_metric([gid, dev_id, name], 1 if d.get("online") else 0)
-                dev_bandwidth.add_metric([gid, dev_id, name, "download"], d.get("totalDownload", 0))
-                dev_bandwidth.add_metric([gid, dev_id, name, "upload"], d.get("totalUpload", 0))
-            yield dev_online
-            yield dev_bandwidth
+    for box in boxes:
+        box_gid = box.get("gid")
+        gid = str(box_gid or "")
+        # Label values must be strings; the API can send null for any of them
+        name = str(box.get("name") or gid)
+        box_online.add_metric([gid, name, str(box.get("model") or "")], 1 if box.get("online") else 0)
+        box_devices.add_metric([gid, name], box.get("deviceCount") or 0)
+        box_rules.add_metric([gid, name], box.get("ruleCount") or 0)
+        box_alarms_total.add_metric([gid, name], box.get("alarmCount") or 0)
+        box_alarms_active.add_metric([gid, name], active_alarms.get(box_gid, 0))
+        box_alarms_up.add_metric([gid, name], 0 if box_gid in alarm_errors else 1)
+        box_alarms_truncated.add_metric([gid, name], 1 if box_gid in alarm_truncated else 0)
+    yield box_online
+    yield box_devices
+    yield box_rules
+    yield box_alarms_total
+    yield box_alarms_active
+    yield box_alarms_up
+    yield box_alarms_truncated
+
+    if PER_DEVICE_METRICS:
+        dev_online = GaugeMetricFamily("firewalla_device_online", "1 if the client device is online",
+                                        labels=["gid", "device_id", "name"])
+        dev_bandwidth = CounterMetricFamily(
+            "firewalla_device_bandwidth_bytes",
+            "Cumulative bandwidth per device, as reported by the MSP API",
+            labels=["gid", "device_id", "name", "direction"],
+        )
+        for d in devices:
+            gid, dev_id, name = (str(d.get(key) or "") for key in ("gid", "id", "name"))
+            dev_online.add_metric([gid, dev_id, name], 1 if d.get("online") else 0)
+            dev_bandwidth.add_metric([gid, dev_id, name, "download"], d.get("totalDownload") or 0)
+            dev_bandwidth.add_metric([gid, dev_id, name, "upload"], d.get("totalUpload") or 0)
+        yield dev_online
+        yield dev_bandwidth
+
+
+class _StaticCollector:
+    """A fixed set of metric families, in the shape generate_latest() expects."""
+
+    def __init__(self, families):
+        self.families = families
+
+    def collect(self):
+        return iter(self.families)
+
+
+def _publish_snapshot():
+    """Build and encode the metrics once, and swap them in for scrapes to serve."""
+    global _snapshot
+    with _lock:
+        last_success = {resource: s["last_success"] for resource, s in _cache["status"].items()}
+    body = generate_latest(_StaticCollector(tuple(_metric_families())))
+    # The gzip stream is flushed but not finished, so each scrape appends its own
+    # small tail to a copy of the compressor and still sends one gzip member
+    compressor = zlib.compressobj(wbits=31)
+    gzipped = compressor.compress(body) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    # Rebinding a global is atomic, so scrapes see either the old snapshot or
+    # the new one; neither is modified after it's published
+    _snapshot = (body, (gzipped, compressor), last_success)
+
+
+def _staleness(last_success):
+    """The time-dependent gauge, built per scrape from the snapshot's timestamps."""
+    now = time.time()
+    resource_age = GaugeMetricFamily("firewalla_exporter_resource_staleness_seconds",
+                                      "Seconds since this resource's last successful poll",
+                                      labels=["resource"])
+    for resource, ts in last_success.items():
+        if ts:
+            resource_age.add_metric([resource], now - ts)
+    return resource_age
+
+
+def _snapshot_health():
+    """Failed snapshot builds, built per scrape since a failed build publishes nothing."""
+    snapshot_errors = CounterMetricFamily("firewalla_exporter_snapshot_errors",
+                                          "Times building the metrics snapshot failed; the previous "
+                                          "snapshot is served until a build succeeds")
+    snapshot_errors.add_metric([], _snapshot_errors)
+    return snapshot_errors
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    """
+    Serves the pre-encoded snapshot on /metrics (404 elsewhere), gzipped when the
+    client accepts it. Per scrape, only the staleness gauge, the snapshot error
+    counter and prometheus_client's own process/GC metrics (a fixed handful) are
+    encoded; nothing scales with the number of boxes or devices, and _lock isn't
+    taken.
+    """
+
+    def _respond(self, send_body):
+        if urlsplit(self.path).path != "/metrics":
+            self.send_error(404)
+            return
+        body, (gzipped, compressor), last_success = _snapshot
+        tail = generate_latest(_StaticCollector((_staleness(last_success), _snapshot_health()))) + generate_latest(REGISTRY)
+        compress = gzip_accepted(self.headers.get("Accept-Encoding", ""))
+        if compress:
+            # Only the small per-scrape tail is compressed here
+            compressor = compressor.copy()
+            body = gzipped + compressor.compress(tail) + compressor.flush()
+        else:
+            body += tail
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE_LATEST)
+        if compress:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def do_GET(self):
+        self._respond(send_body=True)
+
+    def do_HEAD(self):
+        self._respond(send_body=False)
+
+    def log_message(self, format, *args):
+        pass  # probes and scrapes would flood the log
 
 
 def main():
-    REGISTRY.register(FirewallaCollector())
+    _publish_snapshot()
     threading.Thread(target=_refresh_loop, daemon=True).start()
-    start_http_server(LISTEN_PORT)
-    print(f"[firewalla-exporter] serving /metrics on :{LISTEN_PORT}, "
-          f"polling {BASE_URL} every {POLL_INTERVAL}s")
+    server = ThreadingHTTPServer(("0.0.0.0", LISTEN_PORT), MetricsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    intervals = ", ".join(f"{resource} every {RESOURCE_INTERVALS[resource]}s" for resource in RESOURCES)
+    print(f"[firewalla-exporter] serving /metrics on :{LISTEN_PORT}, polling {BASE_URL}: {intervals}")
     while True:
         time.sleep(3600)
 